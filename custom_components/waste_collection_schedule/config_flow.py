@@ -4,8 +4,7 @@ import json
 import logging
 import types
 from datetime import date, datetime
-from pathlib import Path
-from typing import Any, Literal, Tuple, TypedDict, Union, cast, get_origin
+from typing import Any, Literal, Tuple, Union, cast, get_origin
 
 import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
@@ -41,6 +40,11 @@ from waste_collection_schedule.exceptions import (
     SourceArgumentRequired,
     SourceArgumentSuggestionsExceptionBase,
 )
+from waste_collection_schedule.source_catalogue import (
+    SourceCatalogue,
+    get_source_catalogue,
+    option_value,
+)
 
 from .const import (
     CONF_ADD_DAYS_TO,
@@ -79,6 +83,7 @@ from .const import (
 )
 from .init_ui import WCSCoordinator
 from .sensor import DetailsFormat
+from .wcs_coordinator import store_prefetched_entries
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -283,13 +288,6 @@ EXAMPLE_DATE_TEMPLATES = {
 }
 
 
-class SourceDict(TypedDict):
-    title: str
-    module: str
-    default_params: dict[str, Any]
-    id: str
-
-
 class WasteCollectionConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call-arg]
     """Config flow."""
 
@@ -299,39 +297,32 @@ class WasteCollectionConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call
     _source: str | None = None
 
     _options: dict = {}
-    _sources: dict[str, list[SourceDict]] = {}
+    _catalogue: SourceCatalogue
     _error_suggestions: dict[str, list[Any]]
 
-    # Get source list from JSON
-    def _get_source_list(self) -> dict[str, list[SourceDict]]:
-        p = Path(__file__).with_name("sources.json")
-        with p.open(encoding="utf-8") as json_file:
-            return json.load(json_file)
+    def __getattr__(self, name: str) -> Any:
+        # every source has its own args (and reconfigure) step to allow source
+        # specific translations, resolve these step methods on demand instead
+        # of registering one method per source
+        if name.startswith("async_step_args_") and "_catalogue" in self.__dict__:
+            if self._catalogue.has_id(name.removeprefix("async_step_args_")):
+                return self.async_step_args
+        if name.startswith("async_step_reconfigure_") and "_catalogue" in self.__dict__:
+            source = name.removeprefix("async_step_reconfigure_")
+            if self._catalogue.has_id(source) or self._catalogue.has_module(source):
+                return self.async_step_reconfigure
+        raise AttributeError(
+            f"'{type(self).__name__}' object has no attribute '{name}'"
+        )
 
     async def _async_setup_sources(self) -> None:
-        if len(self._sources) > 0:
+        if "_catalogue" in self.__dict__:
             return
 
-        self._sources = await self.hass.async_add_executor_job(self._get_source_list)
-
-        async def args_method(args_input):
-            return await self.async_step_args(args_input)
-
-        async def reconfigure_method(args_input):
-            return await self.async_step_reconfigure(args_input)
-
-        for sources in self._sources.values():
-            for source in sources:
-                setattr(
-                    self,
-                    f"async_step_args_{source['id']}",
-                    args_method,
-                )
-                setattr(
-                    self,
-                    f"async_step_reconfigure_{source['id']}",
-                    reconfigure_method,
-                )
+        catalogue = get_source_catalogue()
+        # parse sources.json outside of the event loop
+        await self.hass.async_add_executor_job(lambda: catalogue.countries)
+        self._catalogue = catalogue
 
     # Step 1: User selects country
     async def async_step_user(
@@ -347,7 +338,7 @@ class WasteCollectionConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call
             {
                 vol.Required(CONF_COUNTRY_NAME): SelectSelector(
                     SelectSelectorConfig(
-                        options=[""] + list(self._sources.keys()),
+                        options=[""] + self._catalogue.countries,
                         mode=SelectSelectorMode.DROPDOWN,
                         sort=True,
                     )
@@ -361,14 +352,30 @@ class WasteCollectionConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call
         self, info: dict[str, Any] | None = None
     ) -> ConfigFlowResult:
         self._country = cast(str, self._country)
-        sources = self._sources[self._country]
-        sources_options = [SelectOptionDict(value="", label="")] + [
-            SelectOptionDict(
-                value=f"{x['module']}\t{x['title']}\t{x['id']}",
-                label=f"{x['title']} ({x['module']})",
-            )
-            for x in sources
-        ]
+        sources_options = self._catalogue.get_options(self._country)
+
+        errors = {}
+        if info is not None:
+            source = self._catalogue.get_source(self._country, info[CONF_SOURCE_NAME])
+            if source is None:
+                errors[CONF_SOURCE_NAME] = "invalid_source"
+                # custom value entered, offer the best matching sources
+                if matches := self._catalogue.search(
+                    info[CONF_SOURCE_NAME], self._country
+                ):
+                    sources_options = [
+                        SelectOptionDict(
+                            value=option_value(x),
+                            label=f"{x['title']} ({x['module']})",
+                        )
+                        for x in matches
+                    ]
+            else:
+                self._source = source["module"]
+                self._title = source["title"]
+                self._id = source["id"]
+                self._extra_info_default_params = source["default_params"]
+                return await self.async_step_args()
 
         SCHEMA = vol.Schema(
             {
@@ -384,30 +391,6 @@ class WasteCollectionConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call
             }
         )
 
-        errors = {}
-        if info is not None:
-            if not (
-                "\t" in info[CONF_SOURCE_NAME]
-                and info[CONF_SOURCE_NAME].split("\t")[0]
-                in [x["module"] for x in sources]
-            ):
-                errors[CONF_SOURCE_NAME] = "invalid_source"
-            else:
-                self._source = info[CONF_SOURCE_NAME].split("\t")[0]
-                self._title = info[CONF_SOURCE_NAME].split("\t")[1]
-                self._id = info[CONF_SOURCE_NAME].split("\t")[2]
-                self._extra_info_default_params = next(
-                    (
-                        x["default_params"]
-                        for x in self._sources[self._country]
-                        if info[CONF_SOURCE_NAME].startswith(
-                            f"{x['module']}\t{x['title']}"
-                        )
-                    ),
-                    {},
-                )
-                return await self.async_step_args()
-
         return self.async_show_form(step_id="source", data_schema=SCHEMA, errors=errors)
 
     async def __get_simple_annotation_type(self, annotation: Any) -> Any:
@@ -646,6 +629,9 @@ class WasteCollectionConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call
             if len(resp) == 0:
                 errors["base"] = "fetch_empty"
             self._fetched_types = list({x.type.strip() for x in resp})
+            if len(errors) == 0:
+                # hand the result over to the config entry to avoid a second fetch
+                store_prefetched_entries(self.hass, source, args_input, resp)
         except SourceArgumentSuggestionsExceptionBase as e:
             if not hasattr(self, "_error_suggestions"):
                 self._error_suggestions = {}
@@ -676,17 +662,6 @@ class WasteCollectionConfigFlow(ConfigFlow, domain=DOMAIN):  # type: ignore[call
         kwargs = args_input
         return module.Source(**kwargs)
 
-    async def async_source_selected(self) -> None:
-        async def args_method(args_input):
-            return await self.async_step_args(args_input)
-
-        setattr(
-            self,
-            f"async_step_args_{self._id}",
-            args_method,
-        )
-        return await self.async_step_args()
-
     # Step 3: User fills in source arguments
     async def async_step_args(self, args_input=None) -> ConfigFlowResult:
         self._source = cast(str, self._source)
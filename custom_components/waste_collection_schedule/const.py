@@ -40,6 +40,18 @@ CONF_FETCH_TIME_DEFAULT: Final = "01:00"
 CONF_RANDOM_FETCH_TIME_OFFSET_DEFAULT: Final = 60
 CONF_DAY_SWITCH_TIME_DEFAULT: Final = "10:00"
 
+# Directory (relative to the config directory) for persistent source caches
+CACHE_DIR: Final = ".storage/waste_collection_schedule"
+
+# Key in hass.data for fetch results of the config flow validation. Not stored
+# in hass.data[DOMAIN], which must only exist once the integration is set up.
+PREFETCHED_ENTRIES: Final = f"{DOMAIN}_prefetched"
+# Time in seconds a validated fetch result may be reused by the new config entry
+PREFETCHED_ENTRIES_TTL: Final = 600
+
+# Maximum number of sources which are created in parallel during YAML setup
+SOURCE_SETUP_PARALLEL_JOBS: Final = 4
+
 # Sensor config var names
 
 CONF_SOURCE_INDEX: Final = "source_index"
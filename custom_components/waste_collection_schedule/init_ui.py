@@ -9,7 +9,7 @@ from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 
 from .service import get_fetch_all_service
-from .wcs_coordinator import WCSCoordinator
+from .wcs_coordinator import WCSCoordinator, pop_prefetched_entries
 
 from . import const  # type: ignore # isort:skip # noqa: E402
 from .waste_collection_schedule import SourceShell, Customize  # type: ignore # isort:skip # noqa: E402
@@ -66,6 +66,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         day_switch_time=cv.time(
             options.get(const.CONF_DAY_SWITCH_TIME, const.CONF_DAY_SWITCH_TIME_DEFAULT)
         ),
+        prefetched_entries=pop_prefetched_entries(
+            hass, entry.data[const.CONF_SOURCE_NAME], entry.data[const.CONF_SOURCE_ARGS]
+        ),
     )
 
     await coordinator.async_config_entry_first_refresh()
@@ -1,5 +1,6 @@
 """YAML setup logic."""
 
+import asyncio
 import logging
 import site
 from pathlib import Path
@@ -16,7 +17,8 @@ from .waste_collection_api import WasteCollectionApi
 package_dir = Path(__file__).resolve().parents[0]
 site.addsitedir(str(package_dir))
 from . import const  # type: ignore # isort:skip # noqa: E402
-from waste_collection_schedule import Customize  # type: ignore # isort:skip # noqa: E402
+from waste_collection_schedule import Customize, SourceShell  # type: ignore # isort:skip # noqa: E402
+from waste_collection_schedule.service.PersistentCache import set_cache_dir  # type: ignore # isort:skip # noqa: E402
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -74,6 +76,8 @@ CONFIG_SCHEMA = vol.Schema(
 
 async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     """Set up the component. config contains data from configuration.yaml."""
+    set_cache_dir(hass.config.path(const.CACHE_DIR))
+
     # Skip for config flow
     if const.DOMAIN not in config:
         return True
@@ -89,7 +93,23 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
         day_switch_time=config[const.DOMAIN][const.CONF_DAY_SWITCH_TIME],
     )
 
+    # importing a source and running its constructor may block on network I/O,
+    # so create the shells concurrently but limit the number of parallel jobs
+    semaphore = asyncio.Semaphore(const.SOURCE_SETUP_PARALLEL_JOBS)
+
+    async def create_source_shell(source: dict, customize: dict[str, Customize]):
+        async with semaphore:
+            return await hass.async_add_executor_job(
+                SourceShell.create,
+                source[const.CONF_SOURCE_NAME],
+                customize,
+                source.get(const.CONF_SOURCE_ARGS, {}),
+                source.get(const.CONF_SOURCE_CALENDAR_TITLE),
+                source.get(const.CONF_DAY_OFFSET, 0),
+            )
+
     # create shells for source(s)
+    jobs = []
     for source in config[const.DOMAIN][const.CONF_SOURCES]:
         # create customize object
         customize = {}
@@ -106,14 +126,11 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
                 ),
             )
 
-        await hass.async_add_executor_job(
-            api.add_source_shell,
-            source[const.CONF_SOURCE_NAME],
-            customize,
-            source.get(const.CONF_SOURCE_ARGS, {}),
-            source.get(const.CONF_SOURCE_CALENDAR_TITLE),
-            source.get(const.CONF_DAY_OFFSET, 0),
-        )
+        jobs.append(create_source_shell(source, customize))
+
+    # gather keeps the configuration order, which defines the source_index
+    for shell in await asyncio.gather(*jobs):
+        api.append_source_shell(shell)
 
     # store api object
     hass.data.setdefault(const.DOMAIN, {})["YAML_CONFIG"] = api
@@ -92,11 +92,13 @@ class WasteCollectionApi:
             calendar_title=calendar_title,
             day_offset=day_offset,
         )
-
-        if new_shell:
-            self._source_shells.append(new_shell)
+        self.append_source_shell(new_shell)
         return new_shell
 
+    def append_source_shell(self, shell: SourceShell | None):
+        if shell:
+            self._source_shells.append(shell)
+
     def _fetch(self, *_):
         for shell in self._source_shells:
             shell.fetch()
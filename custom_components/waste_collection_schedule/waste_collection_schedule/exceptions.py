@@ -1,5 +1,7 @@
 from typing import Any, Generic, Iterable, Type, TypeVar
 
+from .suggestions import rank_suggestions
+
 T = TypeVar("T")
 
 
@@ -54,15 +56,16 @@ class SourceArgumentSuggestionsExceptionBase(SourceArgumentException, Generic[T]
         Args:
             argument (str): The source argument that caused the exception (written exactly like in the source __init__).
             message (str): Message to be displayed for the provided argument.
-            suggestions (Iterable[T]): An iterable of suggestions for the provided argument.
+            suggestions (Iterable[T]): An iterable of suggestions for the provided argument, should already be ranked and truncated (see rank_suggestions).
             message_addition (str, optional): Additional message appended after the main message adding additional information. Defaults to "".
         """
         self._simple_message = message
         message += f", {message_addition}" if message_addition else ""
         super().__init__(argument=argument, message=message)
         self._suggestions = suggestions
+        first = next(iter(suggestions), None)
         self._suggestion_type: Type[T] | None = (
-            type(list(suggestions)[0]) if suggestions else None
+            type(first) if first is not None else None
         )
 
     @property
@@ -117,10 +120,10 @@ class SourceArgumentNotFoundWithSuggestions(SourceArgumentSuggestionsExceptionBa
         Args:
             argument (str): The source argument that caused the exception (written exactly like in the source __init__).
             value (Any): The value of that source argument.
-            suggestions (Iterable[T]): An iterable of suggestions for the provided argument.
+            suggestions (Iterable[T]): An iterable of suggestions for the provided argument, only the ones most similar to value are kept.
         """
         message = f"We could not find values for the argument '{argument}' with the value '{value}'"
-        suggestions = list(suggestions)
+        suggestions = rank_suggestions(value, suggestions)
         if len(suggestions) == 0:
             message += ", We could not find any suggestions. Please also check other arguments."
             message_addition = ""
@@ -148,9 +151,10 @@ class SourceArgAmbiguousWithSuggestions(SourceArgumentSuggestionsExceptionBase):
         Args:
             argument (str): The source argument that caused the exception (written exactly like in the source __init__).
             value (Any): The value of that source argument.
-            suggestions (Iterable[T]): An iterable of suggestions for the provided argument.
+            suggestions (Iterable[T]): An iterable of suggestions for the provided argument, only the ones most similar to value are kept.
         """
         message = f"Multiple values found for the argument '{argument}' with the value '{value}'"
+        suggestions = rank_suggestions(value, suggestions)
         message_addition = f"please specify one of: {suggestions}"
         super().__init__(
             argument=argument,
@@ -194,9 +198,10 @@ class SourceArgumentRequiredWithSuggestions(SourceArgumentSuggestionsExceptionBa
             suggestions (Iterable[T]): An iterable of suggestions for the provided argument.
         """
         message = f"Argument '{argument}' must be provided"
-        message_addition = (
-            f"you may want to use one of the following: {list(suggestions)}"
-        )
+        # without a value there is nothing to rank by, so keep all suggestions
+        # instead of an arbitrary first MAX_SUGGESTIONS
+        suggestions = rank_suggestions(None, suggestions, limit=None)
+        message_addition = f"you may want to use one of the following: {suggestions}"
         if reason:
             message += f", {reason}"
         super().__init__(
@@ -1,12 +1,21 @@
-from typing import Literal
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Literal
 
-import requests
-from bs4 import BeautifulSoup
+from waste_collection_schedule.collection import Collection
 from waste_collection_schedule.exceptions import (
     SourceArgumentNotFoundWithSuggestions,
     SourceArgumentRequiredWithSuggestions,
 )
-from waste_collection_schedule.source.ics import Source as ICS
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+
+if TYPE_CHECKING:
+    import requests
+    from waste_collection_schedule.source.ics import Source as ICS
 
 SERVICES = {
     "winterthur": "https://m.winterthur.ch",
@@ -15,6 +24,14 @@ SERVICES = {
 }
 SERVICES_LITERALS = Literal["winterthur", "a_region", "koeniz"]
 
+# maximum number of parallel requests
+MAX_WORKERS = 4
+# resolved ICS links are refreshed after this time or if they stop working
+LINK_TTL = 7 * 24 * 3600
+HEADERS = {"user-agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)"}
+
+_cache = PersistentCache("a_region_ch", ttl=LINK_TTL)
+
 
 class A_region_ch:
     def __init__(
@@ -32,21 +49,78 @@ class A_region_ch:
 
         self._municipality_url = region_url
         self._district = district
+        self._session: "requests.Session | None" = None
+        self._session_lock = threading.Lock()
+
+    @property
+    def session(self) -> "requests.Session":
+        with self._session_lock:
+            if self._session is None:
+                import requests
+
+                self._session = requests.Session()
+                self._session.headers.update(HEADERS)
+            return self._session
+
+    def fetch(self) -> list["ICS"]:
+        from waste_collection_schedule.source.ics import Source as ICS
 
-    def fetch(self) -> list[ICS]:
+        return [ICS(url=url, regex=self._regex) for url in self.get_ICS_urls()]
+
+    def get_ICS_urls(self) -> list[str]:
+        """Return the ICS links of all tours, resolved concurrently."""
         waste_types = self.get_waste_types(self._municipality_url)
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            urls = pool.map(
+                lambda item: self.get_ICS_links(item[1], item[0]), waste_types.items()
+            )
+        return [url for tour_urls in urls for url in tour_urls]
+
+    def fetch_collections(self) -> list[Collection]:
+        """Download and parse the ICS files of all tours.
 
-        entries = []
+        The tour links are cached and only resolved again if a cached link
+        fails or doesn't return any dates. An empty list of links is not
+        cached.
+        """
+        key = cache_key(self._base_url, self._municipality_url, self._district)
+        urls = _cache.get(key)
+        if urls:
+            try:
+                results = self._download_ICS(urls)
+                if all(results):
+                    return [entry for result in results for entry in result]
+            except Exception:
+                pass
 
-        for tour, link in waste_types.items():
-            entries += self.get_ICS_sources(link, tour)
-        return entries
+        urls = self.get_ICS_urls()
+        results = self._download_ICS(urls)
+        if urls:
+            _cache.set(key, urls)
+        return [entry for result in results for entry in result]
+
+    def _download_ICS(self, urls: list[str]) -> list[list[Collection]]:
+        from waste_collection_schedule.service.ICS import ICS
+
+        ics = ICS(regex=self._regex)
+
+        def download(url: str) -> list[Collection]:
+            r = self.session.get(re.sub("^webcal", "https", url))
+            r.raise_for_status()
+            if r.apparent_encoding == "UTF-8-SIG":
+                r.encoding = "UTF-8-SIG"
+            else:
+                r.encoding = "utf-8"
+            return [Collection(d[0], d[1]) for d in ics.convert(r.text)]
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            return list(pool.map(download, urls))
 
     def get_municipalities(self) -> dict[str, str]:
         municipalities: dict[str, str] = {}
 
         # get PHPSESSID
-        session = requests.session()
+        session = self.session
         r = session.get(f"{self._base_url}")
         r.raise_for_status()
 
@@ -57,8 +131,7 @@ class A_region_ch:
         r.raise_for_status()
         self.extract_municipalities(r.text, municipalities)
 
-        page = 1
-        while True:
+        def fetch_page(page: int) -> str:
             params = {
                 "do": "searchFetchMore",
                 "hash": "606ee79ca61fc6eef434ab4fca0d5956",
@@ -71,13 +144,23 @@ class A_region_ch:
                 f"{self._base_url}/appl/ajax/index.php", params=params, headers=headers
             )
             r.raise_for_status()
-            if r.text == "":
-                break
-            self.extract_municipalities(r.text, municipalities)
-            page = page + 1
-        return municipalities
+            return r.text
+
+        # the number of pages is unknown, fetch them in batches until an empty
+        # page is returned
+        page = 1
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            while True:
+                texts = list(pool.map(fetch_page, range(page, page + MAX_WORKERS)))
+                for text in texts:
+                    if text == "":
+                        return municipalities
+                    self.extract_municipalities(text, municipalities)
+                page += MAX_WORKERS
 
     def extract_municipalities(self, text: str, municipalities: dict[str, str]):
+        from bs4 import BeautifulSoup
+
         soup = BeautifulSoup(text, features="html.parser")
         downloads = soup.find_all("a", href=True)
         for download in downloads:
@@ -89,9 +172,11 @@ class A_region_ch:
                     municipalities[title.string.removeprefix("Abfallkalender ")] = href
 
     def get_waste_types(self, link: str) -> dict[str, str]:
+        from bs4 import BeautifulSoup
+
         if not link.startswith("http"):
             link = f"{self._base_url}{link}"
-        r = requests.get(link)
+        r = self.session.get(link)
         r.raise_for_status()
 
         waste_types = {}
@@ -116,10 +201,19 @@ class A_region_ch:
 
         return waste_types
 
-    def get_ICS_sources(self, link: str, tour: str) -> list[ICS]:
+    def get_ICS_sources(self, link: str, tour: str) -> list["ICS"]:
+        from waste_collection_schedule.source.ics import Source as ICS
+
+        return [
+            ICS(url=url, regex=self._regex) for url in self.get_ICS_links(link, tour)
+        ]
+
+    def get_ICS_links(self, link: str, tour: str) -> list[str]:
+        from bs4 import BeautifulSoup
+
         if not link.startswith("http"):
             link = f"{self._base_url}{link}"
-        r = requests.get(link)
+        r = self.session.get(link)
         r.raise_for_status()
 
         soup = BeautifulSoup(r.text, features="html.parser")
@@ -140,7 +234,7 @@ class A_region_ch:
         if len(districts) > 0:
             if len(districts) == 1:
                 # only one district found -> use it
-                return self.get_ICS_sources(list(districts.values())[0], tour)
+                return self.get_ICS_links(list(districts.values())[0], tour)
             if self._district is None:
                 raise SourceArgumentRequiredWithSuggestions(
                     "district", districts.keys()
@@ -150,19 +244,19 @@ class A_region_ch:
                 raise SourceArgumentNotFoundWithSuggestions(
                     "district", self._district, districts.keys()
                 )
-            return self.get_ICS_sources(districts[self._district], tour)
+            return self.get_ICS_links(districts[self._district], tour)
 
-        dates = list()
+        links = list()
 
         downloads = soup.find_all("a", href=True)
         for download in downloads:
             # href ::= "/appl/ics.php?apid=12731252&amp;from=2022-05-04%2013%3A00%3A00&amp;to=2022-05-04%2013%3A00%3A00"
             href = download.get("href")
             if href.startswith("webcal") and "ical.php" in href:
-                dates.append(ICS(url=href, regex=self._regex))
+                links.append(href)
                 break
 
-        return dates
+        return links
 
 
 def get_region_url_by_street(
@@ -172,6 +266,9 @@ def get_region_url_by_street(
     district: str | None = None,
     regex: str | None = None,
 ) -> A_region_ch:
+    import requests
+    from bs4 import BeautifulSoup
+
     r = requests.get(search_url, params={"q": street})
     r.raise_for_status()
 
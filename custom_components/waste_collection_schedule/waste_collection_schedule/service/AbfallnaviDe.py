@@ -1,13 +1,28 @@
 #!/usr/bin/env python3
 
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-import requests
 from waste_collection_schedule.exceptions import (
     SourceArgumentNotFoundWithSuggestions,
     SourceArgumentRequiredWithSuggestions,
 )
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+from waste_collection_schedule.transport import Request, Response
+
+# resolved ids and waste types rarely change, they are refreshed after a week
+# or as soon as a request using them fails
+CACHE_TTL = 7 * 24 * 3600
+MAX_WORKERS = 4
+
+_cache = PersistentCache("abfallnavi_de", ttl=CACHE_TTL)
+# working base url per service, kept until it stops working
+_url_cache = PersistentCache("abfallnavi_de_url")
 
 SERVICE_DOMAINS = [
     {
@@ -161,17 +176,40 @@ SERVICE_DOMAINS = [
 class AbfallnaviDe:
     def __init__(self, service_domain):
         self._service_domain = service_domain
-        self._service_url = f"https://{service_domain}-abfallapp.regioit.de/abfall-app-{service_domain}/rest"
-        self._service_url_fallback = (
-            f"https://abfallapp.regioit.de/abfall-app-{service_domain}/rest"
-        )
+        self._service_urls = [
+            f"https://{service_domain}-abfallapp.regioit.de/abfall-app-{service_domain}/rest",
+            f"https://abfallapp.regioit.de/abfall-app-{service_domain}/rest",
+        ]
+        self._service_url = _url_cache.get(service_domain, self._service_urls[0])
+        self._session = None
+        self._session_lock = threading.Lock()
+        self._waste_types: dict = {}
+        # number of requests in the last batch of date_requests
+        self._date_requests = 0
 
     def _fetch(self, path, params=None):
-        try:
-            r = requests.get(f"{self._service_url}/{path}", params=params)
-        except requests.exceptions.ConnectionError:
-            self._service_url = self._service_url_fallback
-            r = requests.get(f"{self._service_url}/{path}", params=params)
+        import requests
+
+        # _map calls this from several threads
+        with self._session_lock:
+            if self._session is None:
+                self._session = requests.Session()
+
+        # try the remembered url first, then all others
+        urls = [self._service_url] + [
+            url for url in self._service_urls if url != self._service_url
+        ]
+        for url in urls:
+            try:
+                r = self._session.get(f"{url}/{path}", params=params)
+                break
+            except requests.exceptions.ConnectionError:
+                if url == urls[-1]:
+                    raise
+        if url != self._service_url:
+            self._service_url = url
+            _url_cache.set(self._service_domain, url)
+
         r.encoding = "utf-8"  # requests doesn't guess the encoding correctly
         if r.status_code == 404:
             raise SourceArgumentNotFoundWithSuggestions(
@@ -195,7 +233,7 @@ class AbfallnaviDe:
     def get_city_id(self, city):
         """Return id for given city string."""
         cities = self.get_cities()
-        city_id = self._find_in_inverted_dict(cities, city)
+        city_id = self._find_in_dict(cities, city)
         if not city_id:
             raise SourceArgumentNotFoundWithSuggestions(
                 "city", city, list(cities.values())
@@ -251,7 +289,7 @@ class AbfallnaviDe:
                 "house number is required for this street",
                 list(house_numbers.values()),
             )
-        id = self._find_in_inverted_dict(house_numbers, house_number)
+        id = self._find_in_dict(house_numbers, house_number)
         if id is None:
             raise SourceArgumentNotFoundWithSuggestions(
                 "house_number", house_number, list(house_numbers.values())
@@ -266,12 +304,22 @@ class AbfallnaviDe:
             result[waste_type["id"]] = waste_type["name"]
         return result
 
+    def _get_cached_waste_types(self):
+        key = cache_key(self._service_domain, "fraktionen")
+        waste_types = _cache.get(key)
+        if waste_types is None:
+            waste_types = self.get_waste_types()
+            _cache.set(key, list(waste_types.items()))
+            return waste_types
+        # stored as list of pairs because JSON objects only have string keys
+        return dict((id, name) for id, name in waste_types)
+
     def _get_dates(self, target, id, waste_types=None):
         # retrieve collections
         args = []
 
         if waste_types is None:
-            waste_types = self.get_waste_types()
+            waste_types = self._get_cached_waste_types()
 
         for f in waste_types.keys():
             args.append(("fraktion", f))
@@ -291,30 +339,115 @@ class AbfallnaviDe:
     def get_dates_by_house_number_id(self, house_number_id):
         return self._get_dates("hausnummern", house_number_id, waste_types=None)
 
-    def get_dates(self, city, street, house_number=None):
-        """Get dates by strings only for convenience."""
-        # find city_id
+    def _resolve_targets(self, city, street, house_number):
+        """Return (target, id) pairs whose termine contain the dates of an address."""
         city_id = self.get_city_id(city)
-
-        # find street_id
         street_ids = self.get_street_ids(city_id, street)
 
-        dates = []
-        for street_id in street_ids:
+        def resolve(street_id):
             # find house_number_id (which is optional: not all house number do have an id)
             house_number_id = self.get_house_number_id(street_id, house_number)
 
             # return dates for specific house number of street if house number
             # doesn't have an own id
             if house_number_id is not None:
-                dates += self.get_dates_by_house_number_id(house_number_id)
-            else:
-                dates += self.get_dates_by_street_id(street_id)
+                return ["hausnummern", house_number_id]
+            return ["strassen", street_id]
+
+        return self._map(resolve, street_ids)
+
+    def _fetch_targets(self, targets):
+        waste_types = self._get_cached_waste_types()
+        dates = []
+        for d in self._map(
+            lambda target: self._get_dates(target[0], target[1], waste_types),
+            targets,
+        ):
+            dates += d
         return dates
 
-    def _find_in_inverted_dict(self, mydict, value):
-        inverted_dict = dict(map(reversed, mydict.items()))
-        return inverted_dict.get(value)
+    def _map(self, func, items):
+        """Call func for all items, concurrently if there is more than one."""
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(len(items), MAX_WORKERS)) as pool:
+            return list(pool.map(func, items))
+
+    def get_dates(self, city, street, house_number=None):
+        """Get dates by strings only for convenience."""
+        key = cache_key(self._service_domain, city, street, house_number)
+        targets = _cache.get(key)
+        if targets is not None:
+            try:
+                dates = self._fetch_targets(targets)
+                if dates:
+                    return dates
+            except Exception:
+                pass
+            # ids may change on year change, resolve the address again
+            _cache.delete(key)
+
+        targets = self._resolve_targets(city, street, house_number)
+        dates = self._fetch_targets(targets)
+        _cache.set(key, targets)
+        return dates
+
+    def _termine_request(self, target, id, waste_types) -> Request:
+        return Request(
+            f"{self._service_url}/{target}/{id}/termine",
+            params=[("fraktion", f) for f in waste_types.keys()],
+            encoding="utf-8",  # requests doesn't guess the encoding correctly
+        )
+
+    def date_requests(self, city, street, house_number=None):
+        """Two-stage variant of get_dates, parse the responses with parse_dates.
+
+        Resolves the address (cached) and yields the termine requests. If the
+        cached ids fail, the responses of the stale requests are ignored by
+        parse_dates.
+        """
+        key = cache_key(self._service_domain, city, street, house_number)
+        self._waste_types = self._get_cached_waste_types()
+        targets = _cache.get(key)
+        if targets is not None:
+            try:
+                self._date_requests = len(targets)
+                responses = yield [
+                    self._termine_request(target, id, self._waste_types)
+                    for target, id in targets
+                ]
+                if any(r.json() for r in responses):
+                    return
+            except Exception:
+                pass
+            # ids may change on year change, resolve the address again
+            _cache.delete(key)
+
+        targets = self._resolve_targets(city, street, house_number)
+        self._date_requests = len(targets)
+        yield [
+            self._termine_request(target, id, self._waste_types)
+            for target, id in targets
+        ]
+        _cache.set(key, targets)
+
+    def parse_dates(self, responses: list[Response]) -> list:
+        """Return the [date, waste type] pairs of the termine responses."""
+        entries = []
+        for response in responses[len(responses) - self._date_requests :]:
+            for r in response.json():
+                date = datetime.strptime(r["datum"], "%Y-%m-%d").date()
+                fraktion = self._waste_types[r["bezirk"]["fraktionId"]]
+                entries.append([date, fraktion])
+        return entries
+
+    def _find_in_dict(self, mydict, value):
+        """Return the key of the last entry with the given value."""
+        result = None
+        for key, item in mydict.items():
+            if item == value:
+                result = key
+        return result
 
 
 def main():
@@ -1,18 +1,30 @@
 #!/usr/bin/env python3
 import json
+import logging
+import plistlib
 import re
+import threading
 import time
 import uuid
-from collections import OrderedDict
+from collections import OrderedDict, deque
 from datetime import date, datetime
+from typing import TYPE_CHECKING, Any
+from urllib.parse import urlparse
+from xml.parsers.expat import ExpatError
 
-import requests
-from bs4 import BeautifulSoup, Tag
 from waste_collection_schedule.exceptions import (
     SourceArgumentNotFound,
     SourceArgumentNotFoundWithSuggestions,
     SourceArgumentRequiredWithSuggestions,
 )
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+
+if TYPE_CHECKING:
+    import requests
+    from bs4 import BeautifulSoup
 
 SUPPORTED_APPS = [
     "de.albagroup.app",
@@ -378,10 +390,76 @@ USER_AGENT_ASSISTANT = "Mozilla/5.0 (Linux; Android 10; K) AppleWebKit/537.36 (K
 ABFALLARTEN_H2_SKIP = ["Sondermüll"]
 VERIFY_SSL = True
 
+# the assistant is rate limited, allow short bursts but 1 request per second on average
+REQUESTS_PER_SECOND = 1.0
+REQUESTS_BURST = 5
+
+# attributes which are persisted after the assistant has been completed
+SESSION_STATE_ATTRIBUTES = (
+    "_client",
+    "_bundesland_id",
+    "_landkreis_id",
+    "_kommune_id",
+    "_region_id",
+    "_bezirk_id",
+    "_strasse_id",
+    "_f_id_strasse",
+    "_hnr",
+    "_f_id_abfallart",
+    "_needs_subtitle",
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_session_cache = PersistentCache("app_abfallplus_de")
+
+
+class TokenBucket:
+    """Thread safe token bucket limiting the request rate to one host."""
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            # reserve a token, a negative balance is the time to wait for it
+            self._tokens -= 1
+            wait = -self._tokens / self._rate if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+
+_token_buckets: dict[str, TokenBucket] = {}
+_token_buckets_lock = threading.Lock()
+
+
+def throttle(url: str) -> None:
+    """Wait until the next request to the host of url is allowed."""
+    host = urlparse(url).netloc
+    with _token_buckets_lock:
+        bucket = _token_buckets.get(host)
+        if bucket is None:
+            bucket = _token_buckets[host] = TokenBucket(
+                REQUESTS_PER_SECOND, REQUESTS_BURST
+            )
+    bucket.acquire()
+
 
 def extract_onclicks(
-    data: BeautifulSoup | str | requests.Response, hnr=False
+    data: "BeautifulSoup | str | requests.Response", hnr=False
 ) -> list[list]:
+    import requests
+    from bs4 import BeautifulSoup
+
     if isinstance(data, requests.Response):
         data = data.text
     if isinstance(data, str):
@@ -414,6 +492,24 @@ def extract_onclicks(
     return to_return
 
 
+def find_plist_key(plist: Any, key: str) -> Any:
+    """Return the value of the first dict entry named key, searching breadth first."""
+    queue = deque([plist])
+    while queue:
+        item = queue.popleft()
+        if isinstance(item, dict):
+            if key in item:
+                return item[key]
+            queue.extend(item.values())
+        elif isinstance(item, list):
+            queue.extend(item)
+    return None
+
+
+def clean_plist_string(value: Any) -> str:
+    return str(value).replace("![CDATA[", "").replace("]]", "").strip()
+
+
 def compare(a, b, remove_space=False):
     if remove_space:
         a = a.replace(" ", "")
@@ -438,6 +534,8 @@ class AppAbfallplusDe:
         strasse_id=None,
         hnr_id=None,
     ):
+        import requests
+
         self._client = str(uuid.uuid4())
 
         self._app_id = app_id
@@ -458,6 +556,27 @@ class AppAbfallplusDe:
 
         self._needs_subtitle: list[str] = []
 
+        self._initial_state = self._get_state()
+        self._state_key = cache_key(
+            app_id, bundesland, landkreis, kommune, bezirk, strasse, hnr
+        )
+
+    def _get_state(self) -> dict:
+        state = {}
+        for attr in SESSION_STATE_ATTRIBUTES:
+            if hasattr(self, attr):
+                value = getattr(self, attr)
+                state[attr] = list(value) if isinstance(value, list) else value
+        return state
+
+    def _set_state(self, state: dict) -> None:
+        for attr in SESSION_STATE_ATTRIBUTES:
+            if attr in state:
+                value = state[attr]
+                setattr(self, attr, list(value) if isinstance(value, list) else value)
+            elif hasattr(self, attr):
+                delattr(self, attr)
+
     def _request(
         self,
         url_ending,
@@ -467,6 +586,8 @@ class AppAbfallplusDe:
         method="post",
         headers=None,
     ):
+        import requests
+
         if headers is None:
             headers = OrderedDict({})
 
@@ -489,7 +610,7 @@ class AppAbfallplusDe:
             headers["Accept-Encoding"] = "gzip, deflate, br"
             headers["Content-Type"] = "application/x-www-form-urlencoded"
         else:
-            time.sleep(1)
+            throttle(base.format(url_ending))
 
         if method not in ("get", "post"):
             raise Exception(f"Method {method} not supported.")
@@ -530,6 +651,8 @@ class AppAbfallplusDe:
         return False
 
     def init_connection(self):
+        from bs4 import BeautifulSoup
+
         data = {
             "client": self._client,
             "app_id": self._app_id,
@@ -827,6 +950,8 @@ class AppAbfallplusDe:
         )
 
     def select_all_waste_types(self):
+        from bs4 import BeautifulSoup
+
         data = {
             "f_id_region": self._region_id if hasattr(self, "_region_id") else "",
             "f_id_bundesland": self._bundesland_id,
@@ -924,54 +1049,35 @@ class AppAbfallplusDe:
         )
         r.raise_for_status()
 
-        soup = BeautifulSoup(r.text, "xml")
-        soup_categories = soup.find("key", text="categories")
-        if not soup_categories:
+        try:
+            structure = plistlib.loads(r.content, fmt=plistlib.FMT_XML)
+        except (plistlib.InvalidFileException, ExpatError) as e:
+            raise Exception(f"Failed to parse struktur.xml: {e}") from e
+
+        plist_categories = find_plist_key(structure, "categories")
+        if not plist_categories:
             raise Exception("No categories found.")
-        soup_array = soup_categories.find_next_sibling("array")
-        if not soup_array or not isinstance(soup_array, Tag):
+        if not isinstance(plist_categories, list):
             raise Exception("No array found.")
 
         categories = {}
-
-        for category in soup_array.find_all("dict"):
-            id = category.find("key", text="id").find_next_sibling("string").text
-            name = (
-                category.find("key", text="name")
-                .find_next_sibling("string")
-                .text.replace("![CDATA[", "")
-                .replace("]]", "")
-                .strip()
-            )
+        for category in plist_categories:
+            id = str(category["id"])
+            name = clean_plist_string(category["name"])
             if any(s_id in id for s_id in self._needs_subtitle):
-                subtitle = (
-                    category.find("key", text="subtitle")
-                    .find_next_sibling("string")
-                    .text.replace("![CDATA[", "")
-                    .replace("]]", "")
-                    .strip()
-                )
-                name += " - " + subtitle
+                name += " - " + clean_plist_string(category.get("subtitle", ""))
             categories[id] = name
 
         collections: list[dict] = []
-        for collection in (
-            soup.find("key", text="dates").find_next_sibling("array").find_all("dict")
-        ):
-            category = (
-                collection.find("key", text="category_id")
-                .find_next_sibling("string")
-                .text
-            )
-            category_name = categories[category]
-            pickup_date_str = (
-                collection.find("key", text="pickup_date")
-                .find_next_sibling("string")
-                .text
-            )
-            pickup_date = datetime.strptime(
-                pickup_date_str, "%Y-%m-%dT%H:%M:%S%z"
-            ).date()
+        for collection in find_plist_key(structure, "dates") or []:
+            category_name = categories[str(collection["category_id"])]
+            pickup_date = collection["pickup_date"]
+            if isinstance(pickup_date, datetime):
+                pickup_date = pickup_date.date()
+            else:
+                pickup_date = datetime.strptime(
+                    pickup_date, "%Y-%m-%dT%H:%M:%S%z"
+                ).date()
 
             collections.append({"category": category_name, "date": pickup_date})
 
@@ -980,9 +1086,50 @@ class AppAbfallplusDe:
     def generate_calendar(self) -> list[dict[str, date | str]]:
         """Run all necessary function and return the output of get_collections.
 
+        The registered client and the resolved ids are persisted after the
+        assistant has been completed. Later calls only download the collection
+        dates and run the assistant again if the server rejects the client.
+
         Returns:
             list[dict[str, date|str]]: all collection dates
         """
+        state = _session_cache.get(self._state_key)
+        if state is not None:
+            if collections := self._resume_session(state):
+                return collections
+            _session_cache.delete(self._state_key)
+            self._set_state(self._initial_state)
+            self._client = str(uuid.uuid4())
+
+        collections = self._run_assistant()
+        if collections:
+            _session_cache.set(self._state_key, self._get_state())
+        return collections
+
+    def _resume_session(self, state: dict) -> list[dict[str, date | str]]:
+        """Get collections with a persisted session state, empty list on failure."""
+        self._set_state(state)
+        try:
+            if collections := self.get_collections():
+                return collections
+        except Exception as e:
+            _LOGGER.debug(f"persisted client rejected: {e}")
+
+        # client is not known anymore, register a new one with the known ids
+        try:
+            self._client = str(uuid.uuid4())
+            self.init_connection()
+            self._set_state({**state, "_client": self._client})
+            self.select_all_waste_types()
+            self.validate()
+            if collections := self.get_collections():
+                _session_cache.set(self._state_key, self._get_state())
+                return collections
+        except Exception as e:
+            _LOGGER.debug(f"persisted ids rejected: {e}")
+        return []
+
+    def _run_assistant(self) -> list[dict[str, date | str]]:
         self.init_connection()
         if self._bundesland_search:
             self.select_bundesland()
@@ -1005,6 +1152,8 @@ class AppAbfallplusDe:
         print(self.generate_calendar())
 
     def get_suppoted_by_bl(self):
+        from bs4 import BeautifulSoup
+
         supported = []
         for i in range(1, 17):
             r = self._request("landkreis/", data={"id_bundesland": i})
@@ -1083,6 +1232,7 @@ def get_newly_supported_apps():
     # DO NOT MOVE THIS IMPORT TO THE TOP IT MAY BREAK THE SCRIPT IF SELENIUM IS NOT INSTALLED
     import time
 
+    from bs4 import BeautifulSoup
     from selenium import webdriver
     from selenium.webdriver.firefox.options import Options
     from selenium.webdriver.firefox.service import Service as FirefoxService
@@ -1,9 +1,50 @@
+import base64
 import json
 import re
+import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable
 
-import requests
 from waste_collection_schedule.exceptions import SourceArgumentNotFoundWithSuggestions
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+
+if TYPE_CHECKING:
+    import requests
+
+AUTH_URL = "https://api.v2.citiesapps.com/auth"
+# used if the expiry can't be read from the token
+TOKEN_TTL = 3600
+# renew tokens which expire within this time
+TOKEN_EXPIRY_MARGIN = 60
+LISTING_TTL = 24 * 3600
+MAX_WORKERS = 4
+
+_token_cache = PersistentCache("citiesapps_com_token")
+_listing_cache = PersistentCache("citiesapps_com", ttl=LISTING_TTL)
+
+
+def _cached(key: str, func: Callable[[], Any]) -> Any:
+    """Return the cached listing for key, calling func if missing."""
+    value = _listing_cache.get(key)
+    if value is None:
+        value = func()
+        _listing_cache.set(key, value)
+    return value
+
+
+def _token_expiry(token: str) -> float:
+    """Return the expiry timestamp of a JWT access token."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return time.time() + TOKEN_TTL
+
 
 SERVICE_MAP = [
     {
@@ -1416,7 +1457,8 @@ class CitiesApps:
         if email is not None and phone is not None:
             raise Exception("Only provide one of email or phone not both")
 
-        # get authentication
+        import requests
+
         self._session = requests.Session()
         self._session.headers.update(
             {
@@ -1424,23 +1466,57 @@ class CitiesApps:
                 "requesting-app": "user-android",
             }
         )
+        self._session.hooks["response"].append(self._reauthenticate)
 
-        username = phone if email is None else email
+        self._username = phone if email is None else email
+        self._method = "email" if email is not None else "phoneNumber"
+        self._password = password
+        # the password is not part of the key, a token rejected after a
+        # password change is renewed by _reauthenticate
+        self._token_key = cache_key(self._method, self._username)
+
+        token = _token_cache.get(self._token_key)
+        if token is None or token[1] - TOKEN_EXPIRY_MARGIN < time.time():
+            self._login()
+        else:
+            self._session.headers.update({"authorization": token[0]})
+
+    def _login(self) -> None:
         r = self._session.post(
-            "https://api.v2.citiesapps.com/auth",
+            AUTH_URL,
             json={
-                "method": "email" if email is not None else "phoneNumber",
-                "emailOrPhoneNumber": username,
-                "password": password,
+                "method": self._method,
+                "emailOrPhoneNumber": self._username,
+                "password": self._password,
             },
         )
         if r.status_code == 400:
             raise Exception("failed to login to the App, check your login credentials")
         r.raise_for_status()
 
-        self._session.headers.update({"authorization": r.headers["access-token"]})
+        token = r.headers["access-token"]
+        self._session.headers.update({"authorization": token})
+        _token_cache.set(self._token_key, [token, _token_expiry(token)])
+
+    def _reauthenticate(self, r: "requests.Response", **kwargs):
+        """Response hook logging in again if a (cached) token was rejected."""
+        if (
+            r.status_code != 401
+            or r.request.url == AUTH_URL
+            or getattr(r.request, "reauthenticated", False)
+        ):
+            return r
+        _token_cache.delete(self._token_key)
+        self._login()
+        request = r.request.copy()
+        request.headers["authorization"] = self._session.headers["authorization"]
+        request.reauthenticated = True  # type: ignore[attr-defined]
+        return self._session.send(request, **kwargs)
 
     def get_cities(self) -> list:
+        return _cached("cities", self._get_cities)
+
+    def _get_cities(self) -> list:
         cities = []
         next_url = "/cities?pagination=limit:100"
         while next_url:
@@ -1461,6 +1537,12 @@ class CitiesApps:
         )
 
     def get_uses_garbage_calendar_v2(self, city_id: str) -> bool:
+        return _cached(
+            cache_key("is_v2", city_id),
+            lambda: self._get_uses_garbage_calendar_v2(city_id),
+        )
+
+    def _get_uses_garbage_calendar_v2(self, city_id: str) -> bool:
         r = self._session.get(f"https://api.citiesapps.com/entities/{city_id}/services")
         r.raise_for_status()
         essentials = r.json()["essentials"]
@@ -1492,8 +1574,13 @@ class CitiesApps:
 
     def get_supported_cities(self) -> dict[str, list]:
         supported_dict: dict[str, list] = {"supported": [], "not_supported": []}
-        for city in self.get_cities():
-            if self.get_garbage_calendars(city["_id"]):
+        cities = self.get_cities()
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            calendars = pool.map(
+                lambda city: self.get_garbage_calendars(city["_id"]), cities
+            )
+        for city, city_calendars in zip(cities, calendars):
+            if city_calendars:
                 supported_dict["supported"].append(city)
             else:
                 supported_dict["not_supported"].append(city)
@@ -1541,7 +1628,7 @@ class CitiesApps:
         return service_map
 
     class GarbageApiV1:
-        def __init__(self, session: requests.Session) -> None:
+        def __init__(self, session: "requests.Session") -> None:
             self._session = session
 
         def fetch_garbage_plans(self, city_dict: dict, calendar: str):
@@ -1571,6 +1658,12 @@ class CitiesApps:
             return garbage_plans
 
         def get_garbage_calendars(self, city_id: str) -> list:
+            return _cached(
+                cache_key("calendars_v1", city_id),
+                lambda: self._get_garbage_calendars(city_id),
+            )
+
+        def _get_garbage_calendars(self, city_id: str) -> list:
             params = {
                 "filter": json.dumps(
                     {"entityid": {"$in": [city_id]}}, separators=(",", ":")
@@ -1585,7 +1678,7 @@ class CitiesApps:
             return r.json()["garbage_calendars"]
 
     class GarbageApiV2:
-        def __init__(self, session: requests.Session) -> None:
+        def __init__(self, session: "requests.Session") -> None:
             self._session = session
 
         def fetch_garbage_plans(self, city_dict: dict, calendar: str):
@@ -1618,6 +1711,12 @@ class CitiesApps:
             return r.json()["garbageCollectionDays"]
 
         def get_garbage_calendars_with_search(self, city_id: str, search: str) -> list:
+            return _cached(
+                cache_key("calendar_search_v2", city_id, search),
+                lambda: self._get_garbage_calendars_with_search(city_id, search),
+            )
+
+        def _get_garbage_calendars_with_search(self, city_id: str, search: str) -> list:
             r = self._session.get(
                 f"https://api.v2.citiesapps.com/waste-management/by-city/{city_id}/areas/search/autocomplete?query={search}&limit=100"
             )
@@ -1625,6 +1724,12 @@ class CitiesApps:
             return r.json()["garbageAreas"]
 
         def get_garbage_calendars(self, city_id: str) -> list:
+            return _cached(
+                cache_key("calendars_v2", city_id),
+                lambda: self._get_garbage_calendars(city_id),
+            )
+
+        def _get_garbage_calendars(self, city_id: str) -> list:
             calendars = []
             next_url = f"/waste-management/by-city/{city_id}/areas?pagination=limit:100"
 
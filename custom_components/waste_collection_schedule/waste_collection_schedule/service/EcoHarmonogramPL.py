@@ -1,9 +1,25 @@
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING
 
-import requests
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+
+if TYPE_CHECKING:
+    import requests
 
 API_URL = "https://ecoharmonogram.pl/api/api.php"
 
+# maximum number of parallel requests
+MAX_WORKERS = 4
+# towns and schedule periods are refreshed after this time
+METADATA_TTL = 24 * 3600
+
+_cache = PersistentCache("ecoharmonogram_pl", ttl=METADATA_TTL)
+
 SUPPORTED_APPS = [
     "eco-przyszlosc",
     "ogrodzieniec",
@@ -29,24 +45,40 @@ class Ecoharmonogram:
             "Accept": "application/json",
         }
         self._app = app if app else None
+        self._session: "requests.Session | None" = None
+        self._session_lock = threading.Lock()
+
+    def _get_session(self) -> "requests.Session":
+        with self._session_lock:
+            if self._session is None:
+                import requests
+
+                self._session = requests.Session()
+                self._session.headers.update(self._headers)
+            return self._session
 
     def do_request(
         self, action: str, payload: dict[str, str], url: str = API_URL
-    ) -> requests.Response:
+    ) -> "requests.Response":
         params = payload.copy()
         params["action"] = action
         if self._app:
             params["customApp"] = self._app
-        response = requests.get(url, headers=self._headers, params=params)
+        response = self._get_session().get(url, params=params)
         response.encoding = "utf-8-sig"
         return response
 
+    def _cached(self, key: str, action: str, payload: dict[str, str]) -> dict:
+        key = cache_key(self._app, key)
+        data = _cache.get(key)
+        if data is None:
+            data = self.do_request(action, payload).json()
+            _cache.set(key, data)
+        return data
+
     def fetch_schedules(self, sp, streetId):
         payload = {"streetId": streetId, "schedulePeriodId": sp.get("id")}
-        schedules_response = self.do_request("getSchedules", payload)
-        schedules_response.encoding = "utf-8-sig"
-        schedules_response = schedules_response.json()
-        return schedules_response
+        return self.do_request("getSchedules", payload).json()
 
     def fetch_streets(self, sp, town, street, house_number):
         payload = {
@@ -56,30 +88,49 @@ class Ecoharmonogram:
             "schedulePeriodId": sp.get("id"),
         }
 
-        streets_response = self.do_request("getStreets", payload)
-        streets_response.encoding = "utf-8-sig"
-        streets = streets_response.json().get("streets")
-        return streets
+        return self.do_request("getStreets", payload).json().get("streets")
 
     def fetch_scheduled_periods(self, town):
         payload = {"townId": town.get("id")}
-        scheduled_perionds_response = self.do_request("getSchedulePeriods", payload)
-        scheduled_perionds_response.encoding = "utf-8-sig"
-        schedule_periods_data = scheduled_perionds_response.json()
-        return schedule_periods_data
+        return self._cached(f"periods/{town.get('id')}", "getSchedulePeriods", payload)
 
     def fetch_town(self):
-        town_response = self.do_request("getTowns", {})
-        town_response.encoding = "utf-8-sig"
-        town_data = town_response.json()
-        return town_data
+        return self._cached("towns", "getTowns", {})
 
     def fetch_town_with_community(self, community):
         payload = {"communityId": community}
-        town_response = self.do_request(action="getTownsForCommunity", payload=payload)
-        town_response.encoding = "utf-8-sig"
-        town_data = town_response.json()
-        return town_data
+        return self._cached(f"towns/{community}", "getTownsForCommunity", payload)
+
+    def fetch_all_schedules(
+        self, schedule_periods, town, street, house_number, first_street_id_only=False
+    ) -> list[list[dict]]:
+        """Fetch the schedules of all street ids of all schedule periods.
+
+        Requests run concurrently, the result keeps the order of the sequential
+        walk: one list of schedule responses per schedule period.
+        """
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as pool:
+            streets_per_period = list(
+                pool.map(
+                    lambda sp: self.fetch_streets(sp, town, street, house_number),
+                    schedule_periods,
+                )
+            )
+
+            jobs = []
+            for sp, streets in zip(schedule_periods, streets_per_period):
+                street_ids = [
+                    street_id for s in streets for street_id in s.get("id").split(",")
+                ]
+                if first_street_id_only:
+                    street_ids = street_ids[:1]
+                jobs.append(
+                    [
+                        pool.submit(self.fetch_schedules, sp, street_id)
+                        for street_id in street_ids
+                    ]
+                )
+            return [[job.result() for job in period_jobs] for period_jobs in jobs]
 
     def print_possible_sides(
         self, town_input, district_input, street_input, house_number_input
@@ -99,12 +150,11 @@ class Ecoharmonogram:
         schedule_periods_data = self.fetch_scheduled_periods(town)
         schedule_periods = schedule_periods_data.get("schedulePeriods")
 
-        for sp in schedule_periods:
-            streets = self.fetch_streets(sp, town, street_input, house_number_input)
-            for street in streets:
-                for streetId in street.get("id").split(","):
-                    schedules_response = self.fetch_schedules(sp, streetId)
-                    print(schedules_response.get("street").get("sides"))
+        for schedules_responses in self.fetch_all_schedules(
+            schedule_periods, town, street_input, house_number_input
+        ):
+            for schedules_response in schedules_responses:
+                print(schedules_response.get("street").get("sides"))
 
 
 def print_markdown_table() -> None:
@@ -3,9 +3,6 @@ import logging
 import re
 from typing import Any, List, Optional, Tuple
 
-import jinja2
-from icalevents import icalevents
-
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -30,6 +27,10 @@ class ICS:
         self._title_template = title_template
 
     def convert(self, ics_data: str) -> List[Tuple[datetime.date, str]]:
+        # icalevents and jinja2 are expensive to import, load them on first use
+        import jinja2
+        from icalevents import icalevents
+
         # calculate start- and end-date for recurring events
         start_date = datetime.datetime.now().replace(
             hour=0, minute=0, second=0, microsecond=0
@@ -51,6 +52,9 @@ class ICS:
 
         entries: List[Tuple[datetime.date, str]] = []
 
+        environment = jinja2.Environment()
+        title_template = environment.from_string(self._title_template)
+
         for e in events:
             # calculate date
             dtstart: Optional[datetime.date] = None
@@ -65,8 +69,6 @@ class ICS:
                 if self._offset is not None:
                     dtstart += datetime.timedelta(days=self._offset)
 
-                environment = jinja2.Environment()
-                title_template = environment.from_string(self._title_template)
                 entry_title = title_template.render(date=e)
 
                 if self._regex is not None:
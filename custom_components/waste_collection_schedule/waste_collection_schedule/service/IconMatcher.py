@@ -0,0 +1,85 @@
+"""Find the icon of a waste type by the ICON_MAP keys it contains.
+
+Many sources look up icons by checking every ICON_MAP key for being a
+substring of the waste type. IconMatcher compiles the keys once into a
+single regex and caches the result per waste type, so every distinct type
+is matched only once.
+
+If multiple keys are contained, the precedence decides which one wins:
+
+    "first": the first key in ICON_MAP order
+    "last": the last key in ICON_MAP order
+    "longest": the longest key, the first one in ICON_MAP order on ties
+"""
+
+import re
+from functools import lru_cache
+
+PRECEDENCES = ("first", "last", "longest")
+
+
+class IconMatcher:
+    def __init__(
+        self,
+        icon_map: dict[str, str],
+        precedence: str = "first",
+        ignore_case: bool = False,
+        default: str | None = None,
+    ):
+        """Compile the keys of icon_map.
+
+        Args:
+            icon_map (dict[str, str]): substring -> icon
+            precedence (str, optional): "first", "last" or "longest". Defaults to "first".
+            ignore_case (bool, optional): match case-insensitive. Defaults to False.
+            default (str | None, optional): icon if no key matches. Defaults to None.
+        """
+        if precedence not in PRECEDENCES:
+            raise ValueError(
+                f"invalid precedence '{precedence}', expected one of {PRECEDENCES}"
+            )
+        keys = [k for k in icon_map if k]
+        if precedence == "last":
+            keys.reverse()
+        elif precedence == "longest":
+            keys.sort(key=len, reverse=True)
+
+        self._icon_map = icon_map
+        self._default = default
+        self._rank = {}
+        for key in keys:
+            folded = key.casefold() if ignore_case else key
+            # with ignore_case, keys only differing in case are the same key
+            self._rank.setdefault(folded, (len(self._rank), key))
+        self._ignore_case = ignore_case
+
+        # The lookahead matches at every position of the text, so overlapping
+        # keys are found as well. At a single position the alternation takes
+        # the key with the highest precedence.
+        self._regex = (
+            re.compile(
+                "(?=(" + "|".join(re.escape(k) for k in keys) + "))",
+                re.IGNORECASE if ignore_case else 0,
+            )
+            if keys
+            else None
+        )
+        self.key = lru_cache(maxsize=1024)(self._key)
+
+    def _key(self, text: str) -> str | None:
+        if self._regex is None:
+            return None
+        best = None
+        for m in self._regex.finditer(text):
+            found = m.group(1)
+            rank = self._rank[found.casefold() if self._ignore_case else found]
+            if best is None or rank < best:
+                best = rank
+                if rank[0] == 0:
+                    break
+        return best[1] if best is not None else None
+
+    def get(self, text: str) -> str | None:
+        """Return the icon of the highest precedence key contained in text."""
+        key = self.key(text)
+        return self._icon_map[key] if key is not None else self._default
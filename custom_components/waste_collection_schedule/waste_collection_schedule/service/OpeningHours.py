@@ -0,0 +1,275 @@
+"""Compile OSM style opening_hours strings into dateutil rrules.
+
+Used by sources which describe collection days like opening hours, e.g.
+"week 2-52/2 Mo 12:00-17:00" or "2024-2025 Sep-Nov We 09:00-19:00".
+
+Handled opening_hours formats:
+    "week 2-52/2 Mo 12:00-17:00"
+    "Feb,May,Aug,Nov Th[4] 05:00-12:00"
+    "Tu 05:00-12:00"
+    "2025 Jul 16 05:00-12:00"
+    "2025 Jan,Apr,Jul,Oct Tu[1] 05:00-12:00"
+    "2024-2025 Mo 05:00-12:00"
+    "2024-2025 Dec: We[2,4] 09:00-19:00"
+    "2024-2025 Sep-Nov We 09:00-19:00"
+    "week 18 Mo,Fr 14:00-18:00"
+    "week 1-52 Mo 12:00-17:00"
+    "week 1-17,19-52 Mo,We,Fr 14:00-18:00"
+    "2024,2025 week 1-17,19-52 Mo,We,Fr 14:00-18:00"
+    "2024 Jan 01-2024 May 12 week 01-53/2 Mo"
+"""
+
+import calendar
+import re
+from datetime import date, datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Iterable
+
+from dateutil.rrule import (
+    DAILY,
+    FR,
+    MO,
+    MONTHLY,
+    SA,
+    SU,
+    TH,
+    TU,
+    WE,
+    WEEKLY,
+    rrule,
+    rruleset,
+)
+
+# number of days before and after today returned by expand_schedules
+HORIZON_DAYS = 365
+
+_CALENDAR_DAY_VERY_ABBR = {
+    "Mo": MO,
+    "Tu": TU,
+    "We": WE,
+    "Th": TH,
+    "Fr": FR,
+    "Sa": SA,
+    "Su": SU,
+}
+
+_CALENDAR_MONTHS_ABBR = [m for m in calendar.month_abbr if m]
+
+_WEEK_DAY_REGEX = re.compile(r"([A-Za-z]{2})(?:\[(\d+(?:,\d+)*)\])?")
+_TIME_REGEX = re.compile(r"^(\d{2}:\d{2})")
+_DAY_NUMBER_REGEX = re.compile(r"^(\d{1,2})(,\d{1,2})*$")
+_YEAR_REGEX = re.compile(r"^(\d{4})")
+_DATE_RANGE_REGEX = re.compile(r"^(\d{4} \w+ \d{1,2}-\d{4} \w+ \d{1,2})(.*)")
+
+_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+def _parse_week_day(input_string: str) -> dict[str, Any]:
+    """Parse a string like "Mo" "Tu[2]", "We[2,4]" or "We,Th,Fr"."""
+    weekdays = []
+    for day_of_week, nth_str in _WEEK_DAY_REGEX.findall(input_string):
+        if nth_str:
+            nth = [int(n) for n in nth_str.split(",")]
+            weekdays.extend([_CALENDAR_DAY_VERY_ABBR[day_of_week](n) for n in nth])
+        else:
+            weekdays.append(_CALENDAR_DAY_VERY_ABBR[day_of_week])
+
+    if not weekdays:
+        raise ValueError(f"Invalid day format: {input_string}")
+
+    return {"byweekday": tuple(weekdays)}
+
+
+def _parse_month(input_string: str) -> dict[str, Any]:
+    input_string = input_string.replace(
+        ":", ""
+    )  # match some actual cases in production
+    if "-" in input_string:
+        start_month, end_month = input_string.split("-")
+        month_list = range(
+            _CALENDAR_MONTHS_ABBR.index(start_month) + 1,
+            _CALENDAR_MONTHS_ABBR.index(end_month) + 2,
+        )
+    else:
+        month_list = [
+            _CALENDAR_MONTHS_ABBR.index(month) + 1 for month in input_string.split(",")
+        ]
+
+    return {"bymonth": tuple(month_list)}
+
+
+def _parse_year(input_string: str) -> dict[str, Any]:
+    if "-" in input_string:
+        start_year, end_year = (int(year) for year in input_string.split("-"))
+    elif "," in input_string:
+        years = [int(year) for year in input_string.split(",")]
+        if years != list(range(min(years), max(years) + 1)):
+            raise ValueError(f"Invalid year range: {input_string}")
+        start_year = min(years)
+        end_year = max(years)
+    else:
+        start_year = int(input_string)
+        end_year = start_year
+
+    return {
+        "dtstart": datetime(start_year, 1, 1, tzinfo=timezone.utc),
+        "until": datetime(end_year, 12, 31, tzinfo=timezone.utc),
+    }
+
+
+def _parse_part(part: str) -> dict[str, Any]:
+    """Parse a part of the opening_hours string into rrule kwargs.
+
+    Example:
+        "Sep-Nov" -> {"bymonth": (9, 10, 11)}
+        "We[2,4]" -> {"byweekday": (WE(2), WE(4))}
+        "2024-2025" -> {"dtstart": datetime(2024, 1, 1, tzinfo=timezone.utc), "until": datetime(2025, 12, 31, tzinfo=timezone.utc)}
+    """
+    if _YEAR_REGEX.match(part):
+        return _parse_year(part)
+    elif any(month in part for month in _CALENDAR_MONTHS_ABBR):
+        return _parse_month(part)
+    elif any(day in part for day in _CALENDAR_DAY_VERY_ABBR):
+        return _parse_week_day(part)
+    elif _DAY_NUMBER_REGEX.match(part):
+        return {"bymonthday": tuple(int(day) for day in part.split(","))}
+    elif _TIME_REGEX.match(part):
+        return {}  # ignore those, the plugin doesn’t support time
+    else:
+        raise ValueError(f"Invalid part: {part}")
+
+
+def _parse_week_no(input_string: str) -> dict[str, Any]:
+    week_nos: list[int] = []
+    for sub_string in input_string.split(","):
+        if "-" not in sub_string:
+            week_nos.append(int(sub_string))
+            continue
+
+        weeks = sub_string.split("-")
+        start_week = int(weeks[0])
+        if "/" in weeks[1]:
+            end_week = int(weeks[1].split("/")[0])
+            interval = int(weeks[1].split("/")[1])
+        else:
+            end_week = int(weeks[1])
+            interval = 1
+
+        week_nos.extend(range(start_week, end_week + 1, interval))
+
+    return {"byweekno": tuple(week_nos)}
+
+
+def _parse_date_range(input_string: str) -> dict[str, Any]:
+    """Parse a date range such as "2024 Jan 01-2024 May 12"."""
+    start, end = input_string.split("-")
+    return {
+        "dtstart": datetime.strptime(start, "%Y %b %d").astimezone(timezone.utc),
+        "until": datetime.strptime(end, "%Y %b %d").astimezone(timezone.utc),
+    }
+
+
+@lru_cache(maxsize=1024)
+def parse_opening_hours(opening_hours: str) -> tuple[tuple[str, Any], ...]:
+    """Parse an opening_hours string into rrule keyword arguments.
+
+    The result only depends on the string and is cached, as the same
+    schedules are used by many addresses.
+
+    Returns:
+        tuple[tuple[str, Any], ...]: (keyword, value) pairs, overriding the
+        default frequency (MONTHLY) and the dtstart/until of the schedule
+    """
+    kwargs: dict[str, Any] = {}
+
+    date_range_match = _DATE_RANGE_REGEX.search(opening_hours)
+    if date_range_match:
+        kwargs.update(_parse_date_range(date_range_match.group(1)))
+        opening_hours = date_range_match.group(2).strip()
+
+    parts = opening_hours.split()
+    while parts:
+        part = parts.pop(0)
+        if part == "week":
+            kwargs["freq"] = WEEKLY
+            kwargs.update(_parse_week_no(parts.pop(0)))
+        else:
+            kwargs.update(_parse_part(part))
+
+    return tuple(kwargs.items())
+
+
+@lru_cache(maxsize=1024)
+def compile_opening_hours(
+    opening_hours: str, dtstart: datetime | None = None, until: datetime | None = None
+) -> rrule:
+    """Return the rrule for an opening_hours string.
+
+    Args:
+        opening_hours (str): the opening_hours string, e.g. "week 2-52/2 Mo"
+        dtstart (datetime | None, optional): first day of the schedule. Defaults to None.
+        until (datetime | None, optional): last day of the schedule, None for an unbounded rule. Defaults to None.
+    """
+    kwargs: dict[str, Any] = {"freq": MONTHLY, "dtstart": dtstart, "until": until}
+    kwargs.update(parse_opening_hours(opening_hours))
+    return rrule(**kwargs)
+
+
+def expand_opening_hours(
+    opening_hours: str, start: datetime, end: datetime
+) -> list[datetime]:
+    """Return all occurrences of an opening_hours string from the day of start to end (inclusive)."""
+    # the compiled rule is cached, key it by day instead of the exact time
+    start = _start_of_day(start)
+    return compile_opening_hours(opening_hours, dtstart=start).between(
+        start, end, inc=True
+    )
+
+
+def _start_of_day(value: datetime) -> datetime:
+    return value.replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+def _parse_datetime(value: str | None) -> datetime | None:
+    return datetime.strptime(value, _DATETIME_FORMAT) if value else None
+
+
+def expand_schedules(
+    schedules: Iterable[dict[str, Any]],
+    start: datetime | None = None,
+    end: datetime | None = None,
+) -> list[date]:
+    """Return the collection days of publidata style schedules.
+
+    Schedules of type "regular" or "exception" add days, schedules of type
+    "closed" or "closing_exception" remove all days between their start_at
+    and end_at. Only days between start and end are generated.
+
+    Args:
+        schedules (Iterable[dict[str, Any]]): dicts with schedule_type, opening_hours, start_at and end_at
+        start (datetime | None, optional): first day returned. Defaults to HORIZON_DAYS before now.
+        end (datetime | None, optional): last day returned. Defaults to HORIZON_DAYS after now.
+    """
+    # day aligned, so the compiled rules are reused by later calls
+    now = _start_of_day(datetime.now(timezone.utc))
+    if start is None:
+        start = now - timedelta(days=HORIZON_DAYS)
+    if end is None:
+        end = now + timedelta(days=HORIZON_DAYS)
+
+    rule_set = rruleset()
+    for schedule in schedules:
+        start_at = _parse_datetime(schedule["start_at"])
+        end_at = _parse_datetime(schedule["end_at"])
+        if schedule["schedule_type"] in ("regular", "exception"):
+            rule_set.rrule(
+                compile_opening_hours(
+                    schedule["opening_hours"],
+                    dtstart=start_at or start,
+                    until=end_at,
+                )
+            )
+        elif schedule["schedule_type"] in ("closed", "closing_exception"):
+            rule_set.exrule(rrule(freq=DAILY, dtstart=start_at, until=end_at))
+
+    return [d.date() for d in rule_set.between(start, end, inc=True)]
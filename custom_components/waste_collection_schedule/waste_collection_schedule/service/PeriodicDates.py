@@ -0,0 +1,62 @@
+"""Generate the dates of schedules like "every N weeks on weekdays W".
+
+Used by sources which only get a rule (e.g. "every second Tuesday and
+Friday, next collection on 2024-02-20") instead of a list of dates. The
+dates are computed per weekday with date ordinals instead of walking the
+calendar day by day.
+"""
+
+from datetime import date
+from typing import Iterable, Mapping
+
+
+def periodic_dates(
+    anchor: date,
+    weekdays: Iterable[int] | None,
+    start: date,
+    end: date,
+    interval: int = 1,
+    shifts: Mapping[date, date | None] | None = None,
+) -> list[date]:
+    """Return the dates of a weekly schedule between start and end (inclusive).
+
+    Weeks start on Monday, the week containing anchor is a collection week
+    and so is every interval-th week before and after it.
+
+    Args:
+        anchor (date): a day in a collection week, e.g. the next collection
+        weekdays (Iterable[int] | None): collection weekdays, Monday is 0. None for the weekday of anchor.
+        start (date): first day returned
+        end (date): last day returned
+        interval (int, optional): number of weeks between collection weeks. Defaults to 1.
+        shifts (Mapping[date, date | None] | None, optional): collections moved to another day (e.g. because of public holidays), None if cancelled. Defaults to None.
+
+    Returns:
+        list[date]: sorted dates without duplicates
+    """
+    if interval < 1:
+        raise ValueError(f"invalid interval: {interval}")
+
+    weekdays = {anchor.weekday()} if weekdays is None else set(weekdays)
+    step = 7 * interval
+    anchor_monday = anchor.toordinal() - anchor.weekday()
+    first = start.toordinal()
+    last = end.toordinal()
+
+    ordinals: set[int] = set()
+    for weekday in weekdays:
+        if not 0 <= weekday <= 6:
+            raise ValueError(f"invalid weekday: {weekday}")
+        day = anchor_monday + weekday
+        # first occurrence on or after start
+        day -= (day - first) // step * step
+        ordinals.update(range(day, last + 1, step))
+
+    dates = {date.fromordinal(ordinal) for ordinal in ordinals}
+    if shifts:
+        for day in dates & shifts.keys():
+            dates.discard(day)
+            if (shifted := shifts[day]) is not None:
+                dates.add(shifted)
+
+    return sorted(dates)
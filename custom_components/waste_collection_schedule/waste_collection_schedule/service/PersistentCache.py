@@ -0,0 +1,113 @@
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Directory where caches are stored. If not set, caches are only kept in
+# memory, which is the case when sources are used outside of Home Assistant.
+_cache_dir: Path | None = None
+_lock = threading.RLock()
+_namespaces: dict[str, dict[str, list]] = {}
+
+
+def set_cache_dir(path: str | Path | None) -> None:
+    """Set the directory used to persist caches, None disables persistence."""
+    global _cache_dir
+    new_dir = Path(path) if path is not None else None
+    with _lock:
+        if new_dir != _cache_dir:
+            _cache_dir = new_dir
+            # reload from the new location on next access
+            _namespaces.clear()
+
+
+def get_cache_dir() -> Path | None:
+    return _cache_dir
+
+
+class PersistentCache:
+    """Key/value cache for resolved ids, sessions and lookup tables.
+
+    Entries are shared between all instances using the same namespace and
+    written to `<cache dir>/<namespace>.json` if a cache directory is set.
+    Keys must be strings and values JSON serializable.
+    """
+
+    def __init__(self, namespace: str, ttl: float | None = None):
+        """Initialize the PersistentCache.
+
+        Args:
+            namespace (str): name of the cache, usually the name of the service or source.
+            ttl (float | None, optional): time in seconds after which entries expire, None to never expire. Defaults to None.
+        """
+        self._namespace = namespace
+        self._ttl = ttl
+
+    def _entries(self) -> dict[str, list]:
+        entries = _namespaces.get(self._namespace)
+        if entries is None:
+            entries = {}
+            if _cache_dir is not None:
+                try:
+                    with self._path().open(encoding="utf-8") as f:
+                        entries = json.load(f)
+                except FileNotFoundError:
+                    pass
+                except (OSError, ValueError) as e:
+                    _LOGGER.warning(f"ignoring unreadable cache {self._path()}: {e}")
+            _namespaces[self._namespace] = entries
+        return entries
+
+    def _path(self) -> Path:
+        assert _cache_dir is not None
+        return _cache_dir / f"{self._namespace}.json"
+
+    def _save(self, entries: dict[str, list]) -> None:
+        if _cache_dir is None:
+            return
+        try:
+            _cache_dir.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=_cache_dir, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entries, f)
+            os.replace(tmp, self._path())
+        except OSError as e:
+            _LOGGER.warning(f"failed to write cache {self._path()}: {e}")
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the cached value or default if missing or expired."""
+        with _lock:
+            item = self._entries().get(key)
+            if item is None:
+                return default
+            timestamp, value = item
+            if self._ttl is not None and time.time() - timestamp > self._ttl:
+                return default
+            return value
+
+    def set(self, key: str, value: Any) -> None:
+        with _lock:
+            entries = self._entries()
+            entries[key] = [time.time(), value]
+            if self._ttl is not None:
+                now = time.time()
+                for k in [k for k, v in entries.items() if now - v[0] > self._ttl]:
+                    del entries[k]
+            self._save(entries)
+
+    def delete(self, key: str) -> None:
+        with _lock:
+            entries = self._entries()
+            if entries.pop(key, None) is not None:
+                self._save(entries)
+
+
+def cache_key(*parts: Any) -> str:
+    """Build a cache key from arguments, e.g. the arguments of a source."""
+    return json.dumps(parts, sort_keys=True, default=str, ensure_ascii=False)
@@ -0,0 +1,149 @@
+"""Pure Python point in polygon lookups for GeoJSON like data.
+
+Shapely is not supported in the project, SpatialIndex provides the lookups
+needed by sources which find the collection zone of an address: polygons
+are stored in a uniform grid of their bounding boxes so only polygons whose
+bounding box contains the point are checked with ray casting.
+
+Coordinates are (x, y) pairs, which is (longitude, latitude) for GeoJSON.
+"""
+
+import math
+from collections import defaultdict
+from typing import Any, Callable, Generic, Iterable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+Ring = Sequence[Sequence[float]]
+
+
+def point_in_ring(x: float, y: float, ring: Ring) -> bool:
+    """Return True if the point is inside the ring (ray casting)."""
+    inside = False
+    n = len(ring)
+    if n == 0:
+        return False
+    x1, y1 = ring[-1][0], ring[-1][1]
+    for vertex in ring:
+        x2, y2 = vertex[0], vertex[1]
+        if (y1 > y) != (y2 > y) and x < (x2 - x1) * (y - y1) / (y2 - y1) + x1:
+            inside = not inside
+        x1, y1 = x2, y2
+    return inside
+
+
+def point_in_polygon(x: float, y: float, rings: Sequence[Ring]) -> bool:
+    """Return True if the point is inside the outer ring and not in a hole."""
+    if not rings or not point_in_ring(x, y, rings[0]):
+        return False
+    return not any(point_in_ring(x, y, hole) for hole in rings[1:])
+
+
+def geometry_polygons(geometry: dict[str, Any]) -> list[Sequence[Ring]]:
+    """Return the polygons (lists of rings) of a GeoJSON geometry."""
+    if geometry["type"] == "Polygon":
+        return [geometry["coordinates"]]
+    if geometry["type"] == "MultiPolygon":
+        return list(geometry["coordinates"])
+    return []
+
+
+class SpatialIndex(Generic[T]):
+    """Grid index of polygons, each polygon is associated with a value."""
+
+    def __init__(
+        self, polygons: Iterable[tuple[Sequence[Ring], T]], cells: int | None = None
+    ):
+        """Initialize the SpatialIndex.
+
+        Args:
+            polygons (Iterable[tuple[Sequence[Ring], T]]): (rings, value) pairs, the first ring is the outer ring
+            cells (int | None, optional): number of grid cells per axis, None to derive it from the number of polygons. Defaults to None.
+        """
+        # (bounding box, rings, value, group), consecutive polygons with the
+        # same value (e.g. of a MultiPolygon) share a group
+        self._entries: list[
+            tuple[tuple[float, float, float, float], Sequence[Ring], T, int]
+        ] = []
+        group = -1
+        previous: Any = object()
+        for rings, value in polygons:
+            if value is not previous:
+                group += 1
+                previous = value
+            if not rings or not rings[0]:
+                continue
+            xs = [p[0] for p in rings[0]]
+            ys = [p[1] for p in rings[0]]
+            bbox = (min(xs), min(ys), max(xs), max(ys))
+            self._entries.append((bbox, rings, value, group))
+
+        self._grid: dict[tuple[int, int], list[int]] = defaultdict(list)
+        if not self._entries:
+            return
+
+        self._min_x = min(e[0][0] for e in self._entries)
+        self._min_y = min(e[0][1] for e in self._entries)
+        max_x = max(e[0][2] for e in self._entries)
+        max_y = max(e[0][3] for e in self._entries)
+        if cells is None:
+            cells = max(1, math.isqrt(len(self._entries)))
+        self._cell_w = (max_x - self._min_x) / cells or 1.0
+        self._cell_h = (max_y - self._min_y) / cells or 1.0
+
+        for i, (bbox, _, _, _) in enumerate(self._entries):
+            x0, y0 = self._cell(bbox[0], bbox[1])
+            x1, y1 = self._cell(bbox[2], bbox[3])
+            for cx in range(x0, x1 + 1):
+                for cy in range(y0, y1 + 1):
+                    self._grid[(cx, cy)].append(i)
+
+    @classmethod
+    def from_geojson(
+        cls,
+        features: Iterable[dict[str, Any]],
+        value: Callable[[dict[str, Any]], T] = lambda feature: feature,
+        geometry: Callable[[dict[str, Any]], dict | None] = lambda feature: feature[
+            "geometry"
+        ],
+    ) -> "SpatialIndex[T]":
+        """Build an index of GeoJSON features, features without geometry are skipped."""
+
+        def polygons():
+            for feature in features:
+                feature_geometry = geometry(feature)
+                if not feature_geometry:
+                    continue
+                feature_value = value(feature)
+                for polygon in geometry_polygons(feature_geometry):
+                    yield polygon, feature_value
+
+        return cls(polygons())
+
+    def _cell(self, x: float, y: float) -> tuple[int, int]:
+        return (
+            int((x - self._min_x) // self._cell_w),
+            int((y - self._min_y) // self._cell_h),
+        )
+
+    def query(self, x: float, y: float) -> list[T]:
+        """Return the values of all polygons containing the point, in insertion order."""
+        result: list[T] = []
+        if not self._entries:
+            return result
+        seen = set()
+        for i in self._grid.get(self._cell(x, y), ()):
+            bbox, rings, value, group = self._entries[i]
+            if group in seen:
+                continue
+            if not (bbox[0] <= x <= bbox[2] and bbox[1] <= y <= bbox[3]):
+                continue
+            if point_in_polygon(x, y, rings):
+                seen.add(group)
+                result.append(value)
+        return result
+
+    def find(self, x: float, y: float) -> T | None:
+        """Return the value of the first polygon containing the point."""
+        matches = self.query(x, y)
+        return matches[0] if matches else None
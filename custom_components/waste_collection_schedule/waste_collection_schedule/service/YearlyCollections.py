@@ -0,0 +1,96 @@
+"""Fetch the collections of the current and, in December, the next year.
+
+Many providers publish one calendar per year. fetch_years calls the
+per-year fetch function of a source for all required years concurrently
+and merges the results. With a cache key, the collections fetched in
+December are kept, so they are still available in January after the
+provider switched to the new year.
+"""
+
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+from typing import Callable
+
+from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# december collections are needed until the end of january
+_cache = PersistentCache("yearly_collections", ttl=62 * 24 * 3600)
+
+
+def _dump(entries: list[Collection]) -> list[list]:
+    return [[e.date.isoformat(), e.type, e.icon, e.picture] for e in entries]
+
+
+def _load(items: list[list]) -> list[Collection]:
+    return [
+        Collection(date.fromisoformat(d), t, icon=icon, picture=picture)
+        for d, t, icon, picture in items
+    ]
+
+
+def merge_collections(*collections: list[Collection]) -> list[Collection]:
+    """Return all collections sorted by date, without duplicate (date, type)."""
+    merged: dict[tuple[date, str], Collection] = {}
+    for entries in collections:
+        for e in entries:
+            merged.setdefault((e.date, e.type), e)
+    return sorted(merged.values(), key=lambda e: e.date)
+
+
+def fetch_years(
+    fetch_year: Callable[[int], list[Collection]],
+    key: str | None = None,
+    today: date | None = None,
+) -> list[Collection]:
+    """Return the collections of the current year and in December also of the next year.
+
+    The next year is often not published yet in December, failing to fetch
+    it is ignored. The current year may fail in December if the next year
+    could be fetched.
+
+    Args:
+        fetch_year (Callable[[int], list[Collection]]): returns the collections of a year
+        key (str | None, optional): identifies the calendar (e.g. the source arguments) to keep the December collections for January, None to disable. Defaults to None.
+        today (date | None, optional): Defaults to today.
+    """
+    today = today or date.today()
+    years = [today.year, today.year + 1] if today.month == 12 else [today.year]
+
+    def fetch(year: int) -> list[Collection] | Exception:
+        try:
+            return fetch_year(year)
+        except Exception as e:
+            return e
+
+    if len(years) == 1:
+        results = [fetch(years[0])]
+    else:
+        with ThreadPoolExecutor(max_workers=len(years)) as pool:
+            results = list(pool.map(fetch, years))
+
+    current = results[0]
+    following = results[1] if len(results) > 1 else []
+    if isinstance(following, Exception):
+        _LOGGER.debug(f"failed to fetch collections of {today.year + 1}: {following}")
+        following = []
+    if isinstance(current, Exception):
+        if not following:
+            raise current
+        _LOGGER.debug(f"failed to fetch collections of {today.year}: {current}")
+        current = []
+
+    previous: list[Collection] = []
+    if key is not None:
+        if today.month == 12 and current:
+            _cache.set(cache_key(key, today.year), _dump(current))
+        elif today.month == 1:
+            previous = _load(_cache.get(cache_key(key, today.year - 1), []))
+
+    return merge_collections(previous, current, following)
@@ -3,8 +3,11 @@ import re
 import unicodedata
 from datetime import datetime
 
-import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
 
 EMBED_URL = "https://differenziata.junker.app/embed/{municipality}/calendario"
 EMBED_URL_WITH_AREA = (
@@ -31,6 +34,9 @@ ICON_MAP = {
     "napkins": "mdi:food",
 }
 
+# area id resolved for a municipality and area name, removed if it stops working
+_area_cache = PersistentCache("junker_app")
+
 
 class AreaNotFound(Exception):
     def __init__(self, areas: list[tuple[str, int]]):
@@ -55,6 +61,17 @@ def replace_accents(text: str) -> str:
     return unicodedata.normalize("NFC", filtered_text)
 
 
+def normalize_area_name(name: str) -> str:
+    return (
+        replace_accents(name)
+        .lower()
+        .strip()
+        .replace(" ", "")
+        .replace(",", "")
+        .replace("'", "")
+    )
+
+
 class Junker:
     def __init__(
         self,
@@ -72,49 +89,42 @@ class Junker:
         self._url = EMBED_URL if use_embed_url else PLAIN_URL
         self._area_url = EMBED_URL_WITH_AREA if use_embed_url else PLAIN_URL_WITH_AREA
 
-    def fetch(self) -> list[Collection]:
+    def _get_page(self, area: int | None) -> str:
+        import requests
+
         mun_str = replace_accents(
             self._municipality.lower().strip().replace(" ", "-").replace("'", "-")
         )
-        if self._area:
-            url = self._area_url.format(municipality=mun_str, area=self._area)
+        if area:
+            url = self._area_url.format(municipality=mun_str, area=area)
         else:
             url = self._url.format(municipality=mun_str)
 
         r = requests.get(url)
         r.raise_for_status()
-
-        zone_match = ZONE_REGEX.search(r.text)
-
-        if zone_match:
-            zone_string = zone_match.group(1)
-            zones = json.loads(zone_string)
-            areas = [(zone["NOME"], zone["ID"]) for zone in zones]
-            if not areas:
-                raise ValueError("No areas found")
-
-            if self._area_name:
-                for area in areas:
-                    if replace_accents(area[0]).lower().strip().replace(
-                        " ", ""
-                    ).replace(",", "").replace("'", "") == replace_accents(
-                        self._area_name
-                    ).lower().strip().replace(
-                        " ", ""
-                    ).replace(
-                        ",", ""
-                    ).replace(
-                        "'", ""
-                    ):
-                        if self._area in (str(area[1]), area[1]):
-                            raise ValueError("Something went wrong with the area")
-                        self._area = area[1]
-                        return self.fetch()
-
-                raise AreaNotFound(areas)
+        return r.text
+
+    def _find_area(self, text: str) -> int | None:
+        """Return the id of the requested area if the page lists areas."""
+        zone_match = ZONE_REGEX.search(text)
+        if not zone_match:
+            return None
+
+        zones = json.loads(zone_match.group(1))
+        areas = [(zone["NOME"], zone["ID"]) for zone in zones]
+        if not areas:
+            raise ValueError("No areas found")
+        if not self._area_name:
             raise AreaRequired(areas)
 
-        envents_match = EVENTS_REGEX.search(r.text)
+        area_ids = {normalize_area_name(name): id for name, id in reversed(areas)}
+        area_id = area_ids.get(normalize_area_name(self._area_name))
+        if area_id is None:
+            raise AreaNotFound(areas)
+        return area_id
+
+    def _parse_events(self, text: str) -> list[Collection]:
+        envents_match = EVENTS_REGEX.search(text)
         if not envents_match:
             raise ValueError("No events found maybe wrong/not supported municipality")
         events_string = envents_match.group(1)
@@ -126,23 +136,61 @@ class Junker:
             bin_type = d["vbin_desc"]
             icon = ICON_MAP.get(bin_type.lower().split()[0])  # Collection icon
             entries.append(Collection(date=date, t=bin_type, icon=icon))
+        return entries
+
+    def _get_single_area(self) -> int | None:
+        """Return the area if the municipality needs one but has only one."""
+        muns = [
+            m
+            for m in self._municipalities_with_area
+            if m.lower().replace(" ", "") == self._municipality.lower().replace(" ", "")
+        ]
+        mun = muns[0] if muns else self._municipality
+        if (
+            mun in self._municipalities_with_area
+            and len(self._municipalities_with_area[mun]) == 1
+        ):
+            return self._municipalities_with_area[mun][0]
+        return None
+
+    def fetch(self) -> list[Collection]:
+        key = cache_key(self._url, self._municipality, self._area_name)
+        if not self._area:
+            area = _area_cache.get(key)
+            if area is not None:
+                try:
+                    text = self._get_page(area)
+                    if not ZONE_REGEX.search(text):
+                        entries = self._parse_events(text)
+                        if entries:
+                            return entries
+                except Exception:
+                    pass
+                # area ids may have changed, resolve it again
+                _area_cache.delete(key)
+
+        area = self._area
+        text = self._get_page(area)
+
+        area_id = self._find_area(text)
+        if area_id is not None:
+            if area in (str(area_id), area_id):
+                raise ValueError("Something went wrong with the area")
+            area = area_id
+            text = self._get_page(area)
+            if ZONE_REGEX.search(text):
+                raise ValueError("Something went wrong with the area")
+
+        entries = self._parse_events(text)
+
+        if not entries and not area:
+            area = self._get_single_area()
+            if area is not None:
+                entries = self._parse_events(self._get_page(area))
 
         if not entries:
-            muns = [
-                m
-                for m in self._municipalities_with_area
-                if m.lower().replace(" ", "")
-                == self._municipality.lower().replace(" ", "")
-            ]
-            mun = muns[0] if muns else self._municipality
-            if (
-                not self._area
-                and mun in self._municipalities_with_area
-                and len(self._municipalities_with_area[mun]) == 1
-            ):
-                # If municipality needs region but only one region is available use it
-                self._area = self._municipalities_with_area[self._municipality][0]
-                return self.fetch()
             raise ValueError("No collections found maybe you need to specify an area")
 
+        if area != self._area:
+            _area_cache.set(key, area)
         return entries
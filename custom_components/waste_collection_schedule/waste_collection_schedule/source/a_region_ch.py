@@ -71,39 +71,7 @@ class Source:
             )
         self._municipality_url = MUNICIPALITIES[municipality]
 
-        self._ics_sources = []
-
-    def _get_ics_sources(self):
-        self._ics_sources = A_region_ch(
-            "a_region", self._municipality_url, self._district
-        ).fetch()
-
     def fetch(self) -> list[Collection]:
-        fresh_sources = False
-        if not self._ics_sources:
-            fresh_sources = True
-            self._get_ics_sources()
-
-        entries = []
-        for source in self._ics_sources:
-            fresh_sources, e = self._get_dates(source, fresh_sources)
-            entries += e
-        return entries
-
-    def _get_dates(self, source, fresh=False) -> tuple[bool, list[Collection]]:
-        exception = None
-        try:
-            entries = source.fetch()
-        except Exception as e:
-            exception = e
-
-        if exception or not entries:
-            if fresh:
-                if exception:
-                    raise exception
-                return fresh, []
-
-            self._get_ics_sources()
-            return self._get_dates(source, fresh=True)
-
-        return fresh, entries
+        return A_region_ch(
+            "a_region", self._municipality_url, self._district
+        ).fetch_collections()
@@ -3,10 +3,10 @@ import logging
 import re
 from html.parser import HTMLParser
 
-import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.service.AbfallIO import SERVICE_MAP
 from waste_collection_schedule.service.ICS import ICS
+from waste_collection_schedule.transport import Request, Response, fetch_two_stage
 
 TITLE = "Abfall.IO / AbfallPlus"
 DESCRIPTION = (
@@ -121,10 +121,14 @@ class Source:
         self._ics = ICS()
 
     def fetch(self):
+        return fetch_two_stage(self)
+
+    def declare_requests(self):
         # get token
         params = {"key": self._key, "modus": MODUS_KEY, "waction": "init"}
-
-        r = requests.post("https://api.abfall.io", params=params, headers=HEADERS)
+        r = yield Request(
+            "https://api.abfall.io", method="POST", params=params, headers=HEADERS
+        )
 
         # add all hidden input fields to form data
         # There is one hidden field which acts as a token:
@@ -155,13 +159,18 @@ class Source:
         params = {"key": self._key, "modus": MODUS_KEY, "waction": "export_ics"}
 
         # get csv file
-        r = requests.post(
-            "https://api.abfall.io", params=params, data=args, headers=HEADERS
+        yield Request(
+            "https://api.abfall.io",
+            method="POST",
+            params=params,
+            data=args,
+            headers=HEADERS,
+            encoding="utf-8",  # requests doesn't guess the encoding correctly
         )
 
-        # parse ics file
-        r.encoding = "utf-8"  # requests doesn't guess the encoding correctly
-        ics_file = r.text
+    def parse(self, responses: list[Response]) -> list[Collection]:
+        # parse ics file, the first response only contains the token
+        ics_file = responses[-1].text
 
         # Remove all lines starting with <b
         # This warning are caused for customers which use an extra radiobutton
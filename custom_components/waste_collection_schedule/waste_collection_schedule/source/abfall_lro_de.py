@@ -1,4 +1,3 @@
-from datetime import datetime
 from typing import Literal
 
 import requests
@@ -6,6 +5,8 @@ from bs4 import BeautifulSoup, NavigableString, Tag
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.exceptions import SourceArgumentNotFoundWithSuggestions
 from waste_collection_schedule.service.ICS import ICS
+from waste_collection_schedule.service.PersistentCache import cache_key
+from waste_collection_schedule.service.YearlyCollections import fetch_years
 
 TITLE = "Landkreis Rostock"
 DESCRIPTION = "Source for Landkreis Rostock."
@@ -138,16 +139,17 @@ class Source:
             return self.get_collections_per_year()
 
     def get_collections_per_year(self) -> list[Collection]:
-        now = datetime.now()
-        year = now.year
-        collections = self.get_collections(year)
-        if now.month != 12:
-            return collections
-        try:
-            collections += self.get_collections(year + 1)
-        except Exception:
-            pass
-        return collections
+        return fetch_years(
+            self.get_collections,
+            key=cache_key(
+                "abfall_lro_de",
+                self._letters,
+                self._black_rhythm,
+                self._green_rhythm,
+                self._black_seasonal,
+                self._green_seasonal,
+            ),
+        )
 
     def get_collections(self, year: int) -> list[Collection]:
         args = {
@@ -1,5 +1,6 @@
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.service.AbfallnaviDe import SERVICE_DOMAINS, AbfallnaviDe
+from waste_collection_schedule.transport import Response, fetch_two_stage
 
 TITLE = "AbfallNavi (RegioIT.de)"
 DESCRIPTION = (
@@ -81,7 +82,13 @@ class Source:
         )
 
     def fetch(self):
-        dates = self._api.get_dates(self._ort, self._strasse, self._hausnummer)
+        return fetch_two_stage(self)
+
+    def declare_requests(self):
+        return self._api.date_requests(self._ort, self._strasse, self._hausnummer)
+
+    def parse(self, responses: list[Response]) -> list[Collection]:
+        dates = self._api.parse_dates(responses)
 
         entries = []
         for d in dates:
@@ -3,6 +3,7 @@ from datetime import date, timedelta
 
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.PeriodicDates import periodic_dates
 
 TITLE = "Praha"
 DESCRIPTION = "Prague municipal waste collection via Golemio API."
@@ -104,18 +105,16 @@ def _generate_next_picks(next_pick: date, pick_days: str, frequency: int, count=
             pick_days,
         )
 
-    # check where we are in the days list
-    first_pick_index = weekdays.index(next_pick.weekday())
-    first_pick_weekday = weekdays[first_pick_index]
-
     # get one date in the past (can be today) - API only provides future dates
-    for i in range(-1, count - 1):
-        next_pick_index = (first_pick_index + i) % len(weekdays)
-
-        weeks = period_duration * ((first_pick_index + i) // len(weekdays))
-        days = weekdays[next_pick_index] - first_pick_weekday
-
-        yield next_pick + timedelta(weeks=weeks, days=days)
+    picks = periodic_dates(
+        next_pick,
+        weekdays,
+        next_pick - timedelta(weeks=period_duration),
+        next_pick + timedelta(weeks=period_duration * count),
+        interval=period_duration,
+    )
+    first = max(picks.index(next_pick) - 1, 0)
+    yield from picks[first : first + count]
 
 
 class Source:
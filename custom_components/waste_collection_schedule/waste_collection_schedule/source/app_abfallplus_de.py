@@ -1,5 +1,6 @@
 import waste_collection_schedule.service.AppAbfallplusDe as AppAbfallplusDe
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.IconMatcher import IconMatcher
 
 SUPPORTED_SERVICES = AppAbfallplusDe.SUPPORTED_SERVICES
 EXTRA_INFO = AppAbfallplusDe.get_extra_info
@@ -152,6 +153,7 @@ ICON_MAP = {
     "wertstoff": "mdi:recycle",
     "gelber sack": "mdi:recycle",
 }
+ICON_MATCHER = IconMatcher(ICON_MAP, ignore_case=True)
 
 
 API_URL = ""
@@ -182,13 +184,8 @@ class Source:
         entries = []
         for d in self._app.generate_calendar():
             bin_type = d["category"]
-            icon = None
-            for name, icon_str in ICON_MAP.items():
-                if name in bin_type.lower():
-                    icon = icon_str
-                    break
-
-            # Collection icon
-            entries.append(Collection(date=d["date"], t=bin_type, icon=icon))
+            entries.append(
+                Collection(date=d["date"], t=bin_type, icon=ICON_MATCHER.get(bin_type))
+            )
 
         return entries
@@ -1,10 +1,17 @@
 import datetime
 import logging
+import threading
+import time
 
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.exceptions import SourceArgumentNotFoundWithSuggestions
 from waste_collection_schedule.service.ICS import ICS
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+from waste_collection_schedule.service.YearlyCollections import fetch_years
 
 TITLE = "AWIDO Online"
 DESCRIPTION = "Source for AWIDO waste collection."
@@ -301,10 +308,43 @@ TEST_CASES = {
 _LOGGER = logging.getLogger(__name__)
 
 
+API_URL = "https://awido.cubefour.de/WebServices/Awido.Service.svc/secure"
+
+# place and street tables are refreshed after this time
+TABLE_TTL = 7 * 24 * 3600
+
+# resolved oid and calendar format (json or ics) per address, persisted
+_cache = PersistentCache("awido_de", ttl=TABLE_TTL)
+
+# place, street and house number tables, shared by all sources of a customer
+_tables: dict[str, tuple[float, dict]] = {}
+_tables_lock = threading.Lock()
+
+
 class JSONNotSupported(Exception):
     pass
 
 
+def _get_table(path: str, params: dict | None = None) -> dict:
+    """Return {"items": [...], "index": {name: key}} of a lookup endpoint."""
+    key = cache_key(path, params)
+    with _tables_lock:
+        cached = _tables.get(key)
+        if cached is not None and time.time() - cached[0] < TABLE_TTL:
+            return cached[1]
+
+    r = requests.get(f"{API_URL}/{path}", params=params)
+    r.raise_for_status()
+    items = r.json()
+    table = {
+        "items": items,
+        "index": {item["value"].strip().lower(): item["key"] for item in items},
+    }
+    with _tables_lock:
+        _tables[key] = (time.time(), table)
+    return table
+
+
 PARAM_TRANSLATIONS = {
     "de": {
         "customer": "Kunde",
@@ -330,17 +370,38 @@ class Source:
         self._ics = ICS()
 
     def fetch(self) -> list[Collection]:
-        # Retrieve list of places
-        r = requests.get(
-            f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getPlaces/client={self._customer}"
-        )
-        r.raise_for_status()
-        places = r.json()
+        key = cache_key(self._customer, self._city, self._street, self._housenumber)
+        cached = _cache.get(key)
+        if cached is not None:
+            oid, calendar_format = cached
+            try:
+                entries = self._get_data(oid, calendar_format)
+                if entries:
+                    return entries
+            except Exception:
+                pass
+            # the oid may have changed, resolve the address again
+            _LOGGER.debug("cached oid failed, resolving address again")
+            _cache.delete(key)
+
+        oid = self._resolve_oid()
+        try:
+            calendar_format = "json"
+            entries = self.get_json_data(oid)
+        except JSONNotSupported:
+            calendar_format = "ics"
+            entries = self.get_ics_data(oid)
+        _cache.set(key, [oid, calendar_format])
+        return entries
+
+    def _get_data(self, oid, calendar_format: str) -> list[Collection]:
+        if calendar_format == "json":
+            return self.get_json_data(oid)
+        return self.get_ics_data(oid)
 
+    def _resolve_oid(self) -> str:
         # create city to key map from retrieved places
-        city_to_oid = {
-            place["value"].strip().lower(): place["key"] for (place) in places
-        }
+        city_to_oid = _get_table(f"getPlaces/client={self._customer}")["index"]
 
         if self._city not in city_to_oid:
             raise SourceArgumentNotFoundWithSuggestions(
@@ -348,108 +409,64 @@ class Source:
             )
 
         oid = city_to_oid[self._city]
+        streets = _get_table(f"getGroupedStreets/{oid}", {"client": self._customer})
 
         if self._street is None:
             # test if we have to use city also as street name
-            self._street = self._city
-            r = requests.get(
-                f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getGroupedStreets/{oid}",
-                params={"client": self._customer},
-            )
-            r.raise_for_status()
-            streets = r.json()
+            return streets["items"][0]["key"]
 
-            # create street to key map from retrieved places
-            oid = streets[0]["key"]
-
-        else:
-            # street specified
-            r = requests.get(
-                f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getGroupedStreets/{oid}",
-                params={"client": self._customer},
+        # street specified
+        street_to_oid = streets["index"]
+        if self._street not in street_to_oid:
+            raise SourceArgumentNotFoundWithSuggestions(
+                "street", self._street, suggestions=list(street_to_oid.keys())
             )
-            r.raise_for_status()
-            streets = r.json()
-
-            # create street to key map from retrieved places
-            street_to_oid = {
-                street["value"].strip().lower(): street["key"] for (street) in streets
-            }
-
-            if self._street not in street_to_oid:
-                raise SourceArgumentNotFoundWithSuggestions(
-                    "street", self._street, suggestions=list(street_to_oid.keys())
-                )
-
-            oid = street_to_oid[self._street]
-
-            if self._housenumber is not None:
-                r = requests.get(
-                    f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getStreetAddons/{oid}",
-                    params={"client": self._customer},
-                )
-                r.raise_for_status()
-                hsnbrs = r.json()
-
-                # create housenumber to key map from retrieved places
-                hsnbr_to_oid = {
-                    hsnbr["value"].strip().lower(): hsnbr["key"] for (hsnbr) in hsnbrs
-                }
-                if (
-                    len(hsnbr_to_oid) == 0
-                    or len(hsnbr_to_oid) == 1
-                    and "" in hsnbr_to_oid
-                ):
-                    _LOGGER.warning(
-                        "No housenumbers found for street, using street only"
+
+        oid = street_to_oid[self._street]
+
+        if self._housenumber is not None:
+            # create housenumber to key map from retrieved places
+            hsnbr_to_oid = _get_table(
+                f"getStreetAddons/{oid}", {"client": self._customer}
+            )["index"]
+            if len(hsnbr_to_oid) == 0 or len(hsnbr_to_oid) == 1 and "" in hsnbr_to_oid:
+                _LOGGER.warning("No housenumbers found for street, using street only")
+            else:
+                if self._housenumber not in hsnbr_to_oid:
+                    raise SourceArgumentNotFoundWithSuggestions(
+                        "housenumber",
+                        self._housenumber,
+                        suggestions=list(hsnbr_to_oid.keys()),
                     )
-                else:
-                    if self._housenumber not in hsnbr_to_oid:
-                        raise SourceArgumentNotFoundWithSuggestions(
-                            "housenumber",
-                            self._housenumber,
-                            suggestions=list(hsnbr_to_oid.keys()),
-                        )
-                    oid = hsnbr_to_oid[self._housenumber]
+                oid = hsnbr_to_oid[self._housenumber]
 
-        try:
-            return self.get_json_data(oid)
-        except JSONNotSupported:
-            return self.get_ics_data(oid)
+        return oid
 
     def get_ics_data(self, oid) -> list[Collection]:
-        now = datetime.datetime.now()
-
-        entries: list[Collection] = []
-
-        for year in [now.year, now.year + 1] if now.month == 12 else [now.year]:
-            r = requests.get(
-                f"https://awido.cubefour.de/Customer/{self._customer}/KalenderICS.aspx",
-                params={
-                    "oid": oid,
-                    "jahr": year,
-                    "fraktionen": "",
-                    "reminder": "-1.17:00",
-                },
-            )
-            r.raise_for_status()
-            ics_file = r.text
-
-            dates = self._ics.convert(ics_file)
+        return fetch_years(
+            lambda year: self.get_ics_data_for_year(oid, year),
+            key=cache_key("awido_de", self._customer, oid),
+        )
 
-            entries = []
-            for d in dates:
-                # prevents duplicates
-                if any(e.date == d[0] and e.type == d[1] for e in entries):
-                    continue
-                entries.append(Collection(d[0], d[1]))
+    def get_ics_data_for_year(self, oid, year: int) -> list[Collection]:
+        r = requests.get(
+            f"https://awido.cubefour.de/Customer/{self._customer}/KalenderICS.aspx",
+            params={
+                "oid": oid,
+                "jahr": year,
+                "fraktionen": "",
+                "reminder": "-1.17:00",
+            },
+        )
+        r.raise_for_status()
 
-        return entries
+        dates = self._ics.convert(r.text)
+        return [Collection(d[0], d[1]) for d in dates]
 
     def get_json_data(self, oid) -> list[Collection]:
         # get calendar data
         r = requests.get(
-            f"https://awido.cubefour.de/WebServices/Awido.Service.svc/secure/getData/{oid}",
+            f"{API_URL}/getData/{oid}",
             params={"fractions": "", "client": self._customer},
         )
         if r.status_code != 200 or r.text.strip() == "":
@@ -3,6 +3,7 @@ import datetime
 import requests
 from bs4 import BeautifulSoup
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.IconMatcher import IconMatcher
 
 TITLE = "BIR (Bergensområdets Interkommunale Renovasjonsselskap)"
 DESCRIPTION = "Askøy, Bergen, Bjørnafjorden, Eidfjord, Kvam, Osterøy, Samnanger, Ulvik, Vaksdal, Øygarden og Voss Kommune (Norway)."
@@ -33,11 +34,11 @@ ICON_MAP = {
 }
 
 
+ICON_MATCHER = IconMatcher(ICON_MAP, default="mdi:trash-can")
+
+
 def map_icon(text):
-    for key, value in ICON_MAP.items():
-        if key in text:
-            return value
-    return "mdi:trash-can"
+    return ICON_MATCHER.get(text)
 
 
 class Source:
@@ -8,6 +8,7 @@ from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.exceptions import (
     SourceArgumentNotFoundWithSuggestions,
 )
+from waste_collection_schedule.service.IconMatcher import IconMatcher
 
 TITLE = "Bürgerportal"
 URL = "https://www.c-trace.de"
@@ -62,6 +63,7 @@ ICON_MAP = {
     "schnitt": "mdi:forest",
     "schad": "mdi:biohazard",
 }
+ICON_MATCHER = IconMatcher(ICON_MAP, precedence="last", ignore_case=True)
 API_HEADERS = {
     "Accept": "application/json, text/plain;q=0.5",
     "Cache-Control": "no-cache",
@@ -185,11 +187,7 @@ class Source:
                 waste_type = collection["Abfuhrplan"]["GefaesstarifArt"]["Abfallart"][
                     "Name"
                 ]
-                icon = None
-
-                for icon_type, tested_icon in ICON_MAP.items():
-                    if icon_type.lower() in waste_type.lower():
-                        icon = tested_icon
+                icon = ICON_MATCHER.get(waste_type)
 
                 if self.show_volume:
                     volume = int(
@@ -146,58 +146,46 @@ class Source:
         schedule_periods_data = self._ecoharmonogram_pl.fetch_scheduled_periods(town)
         schedule_periods = schedule_periods_data.get("schedulePeriods")
 
+        all_schedules = self._ecoharmonogram_pl.fetch_all_schedules(
+            schedule_periods,
+            town,
+            self.street_input,
+            self.house_number_input,
+            # only the first street id is used if sides are matched
+            first_street_id_only=self.additional_sides_matcher_input != "",
+        )
+
         entries = []
-        for sp in schedule_periods:
-            entries.extend(self._create_entries(sp, town))
+        for schedules_responses in all_schedules:
+            entries.extend(self._create_entries(schedules_responses))
         return entries
 
-    def _entry_exists(self, dmy, name, entries: list[Collection]):
-        for e in entries:
-            if dmy == e.date and name == e.type:
-                return True
-        return False
-
-    def _create_entries(self, sp, town):
-        streets = self._ecoharmonogram_pl.fetch_streets(
-            sp, town, self.street_input, self.house_number_input
-        )
+    def _create_entries(self, schedules_responses):
         entries = []
-        for street in streets:
-            for streetId in street.get("id").split(","):
-                schedules_response = self._ecoharmonogram_pl.fetch_schedules(
-                    sp, streetId
+        seen = set()
+        for schedules_response in schedules_responses:
+            schedules_raw = schedules_response.get("schedules")
+            if (
+                self.additional_sides_matcher_input.lower()
+                in schedules_response.get("street").get("sides").lower()
+            ):
+                schedules_descriptions_dict = dict()
+                schedules_descriptions_raw = schedules_response.get(
+                    "scheduleDescription"
                 )
-                schedules_raw = schedules_response.get("schedules")
-                if (
-                    self.additional_sides_matcher_input.lower()
-                    in schedules_response.get("street").get("sides").lower()
-                ):
-                    schedules_descriptions_dict = dict()
-                    schedules_descriptions_raw = schedules_response.get(
-                        "scheduleDescription"
-                    )
 
-                    for sd in schedules_descriptions_raw:
-                        schedules_descriptions_dict[sd.get("id")] = sd
-
-                    schedules = []
-                    for sr in schedules_raw:
-                        z = sr.copy()
-                        get = schedules_descriptions_dict.get(
-                            sr.get("scheduleDescriptionId")
-                        )
-                        z["name"] = get.get("name")
-                        schedules.append(z)
-
-                    for sch in schedules:
-                        days = sch.get("days").split(";")
-                        month = sch.get("month")
-                        year = sch.get("year")
-                        for d in days:
-                            dmy = datetime.date(int(year), int(month), int(d))
-                            name = sch.get("name")
-                            if not self._entry_exists(dmy, name, entries):
-                                entries.append(Collection(dmy, name))
-                if self.additional_sides_matcher_input != "":
-                    return entries
+                for sd in schedules_descriptions_raw:
+                    schedules_descriptions_dict[sd.get("id")] = sd
+
+                for sr in schedules_raw:
+                    name = schedules_descriptions_dict.get(
+                        sr.get("scheduleDescriptionId")
+                    ).get("name")
+                    month = sr.get("month")
+                    year = sr.get("year")
+                    for d in sr.get("days").split(";"):
+                        dmy = datetime.date(int(year), int(month), int(d))
+                        if (dmy, name) not in seen:
+                            seen.add((dmy, name))
+                            entries.append(Collection(dmy, name))
         return entries
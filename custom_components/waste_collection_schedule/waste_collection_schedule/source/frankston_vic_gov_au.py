@@ -3,6 +3,7 @@ from datetime import datetime, timedelta
 
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.SpatialIndex import SpatialIndex
 
 TITLE = "Frankston City Council"  # Title will show up in README.md and info.md
 DESCRIPTION = "Source script for frankston.vic.gov.au"  # Describe your source
@@ -59,39 +60,10 @@ class Source:
 
         return next_dates
 
-    # Shapely is not supported in the project, so we need a  function to check whether address coordinates reside in a given zone's polygon
-    def is_point_in_polygon(self, point, polygon):
-        x, y = point
-        n = len(polygon)
-        inside = False
-
-        p1x, p1y = polygon[0]
-        for i in range(n + 1):
-            p2x, p2y = polygon[i % n]
-            if y > min(p1y, p2y):
-                if y <= max(p1y, p2y):
-                    if x <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                        if p1x == p2x or x <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-
-        return inside
-
     def find_zone(self, lat, long, data):
-        point = long, lat
-        for feature in data:
-            geometry = feature["geometry"]
-            if geometry["type"] == "Polygon":
-                polygon_coords = geometry["coordinates"][0]
-                if self.is_point_in_polygon(point, polygon_coords):
-                    return feature["properties"]
-            elif geometry["type"] == "MultiPolygon":
-                for polygon_coords in geometry["coordinates"]:
-                    if self.is_point_in_polygon(point, polygon_coords[0]):
-                        return feature["properties"]
-        return None
+        return SpatialIndex.from_geojson(
+            data, value=lambda feature: feature["properties"]
+        ).find(long, lat)
 
     def fetch(self):
         # Get latitude & longitude of address
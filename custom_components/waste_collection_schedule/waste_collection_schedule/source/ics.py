@@ -5,7 +5,6 @@ from os import getcwd
 from pathlib import Path
 from typing import Literal
 
-import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.exceptions import (
     SourceArgumentException,
@@ -13,6 +12,7 @@ from waste_collection_schedule.exceptions import (
     SourceArgumentNotFoundWithSuggestions,
 )
 from waste_collection_schedule.service.ICS import ICS
+from waste_collection_schedule.transport import Request, Response, fetch_two_stage
 
 TITLE = "ICS"
 DESCRIPTION = "Source for ICS based schedules."
@@ -153,6 +153,8 @@ class Source:
             raise SourceArgumentExceptionMultiple(
                 ("url", "file"), "Specify either url or file"
             )
+        # local files are read by fetch(), parse() doesn't do any I/O
+        self.two_stage = self._file is None
         if version is not None:
             _LOGGER.warning(
                 "The 'version' parameter is deprecated and has no effect anymore."
@@ -172,67 +174,74 @@ class Source:
         self._headers.update(headers)
 
     def fetch(self):
-        if self._url is not None:
-            if "{%Y}" in self._url or self._year_field is not None:
-                # url contains wildcard or params contains year field
-                now = datetime.datetime.now()
-
-                # replace year in url
-                url = self._url.replace("{%Y}", str(now.year))
-
-                # replace year in params
-                if self._year_field is not None:
-                    if self._params is None:
-                        raise SourceArgumentExceptionMultiple(
-                            ("params", "year_field"),
-                            "year_field specified without params",
-                        )
-                    self._params[self._year_field] = str(now.year)
-
-                entries = self.fetch_url(url, self._params)
-
-                if now.month == 12:
-                    # also get data for next year if we are already in december
-                    url = self._url.replace("{%Y}", str(now.year + 1))
-                    if self._year_field is not None:
-                        self._params[self._year_field] = str(now.year + 1)
-
-                    try:
-                        entries.extend(self.fetch_url(url, self._params))
-                    except Exception:
-                        # ignore if fetch for next year fails
-                        pass
-                return entries
-            else:
-                return self.fetch_url(self._url, self._params)
-        elif self._file is not None:
+        if self._file is not None:
             return self.fetch_file(self._file)
+        return fetch_two_stage(self)
 
-    def fetch_url(self, url, params=None):
-        # get ics file
-        if self._method == "GET":
-            r = requests.get(
-                url, params=params, headers=self._headers, verify=self._verify_ssl
-            )
-        elif self._method == "POST":
-            r = requests.post(
-                url, data=params, headers=self._headers, verify=self._verify_ssl
+    def declare_requests(self) -> list[Request]:
+        if "{%Y}" not in self._url and self._year_field is None:
+            return [self._request(self._url, self._params)]
+
+        # url contains wildcard or params contains year field
+        if self._year_field is not None and self._params is None:
+            raise SourceArgumentExceptionMultiple(
+                ("params", "year_field"),
+                "year_field specified without params",
             )
-        else:
+        now = datetime.datetime.now()
+        requests = [self._request_for_year(now.year)]
+        if now.month == 12:
+            # also get data for next year if we are already in december,
+            # ignore if fetch for next year fails
+            requests.append(self._request_for_year(now.year + 1, optional=True))
+        return requests
+
+    def _request_for_year(self, year: int, optional: bool = False) -> Request:
+        # replace year in url
+        url = self._url.replace("{%Y}", str(year))
+
+        # replace year in params
+        params = self._params
+        if self._year_field is not None:
+            params = {**self._params, self._year_field: str(year)}
+
+        return self._request(url, params, optional=optional)
+
+    def _request(self, url, params=None, optional: bool = False) -> Request:
+        if self._method not in ("GET", "POST"):
             raise SourceArgumentNotFoundWithSuggestions(
                 "method",
                 self._method,
                 ["GET", "POST"],
             )
+        return Request(
+            url,
+            method=self._method,
+            params=params if self._method == "GET" else None,
+            data=params if self._method == "POST" else None,
+            headers=self._headers,
+            verify=self._verify_ssl,
+            # requests doesn't guess the encoding correctly, utf-8-sig also
+            # strips a byte order mark
+            encoding="utf-8-sig",
+            optional=optional,
+        )
 
-        r.raise_for_status()
-
-        if r.apparent_encoding == "UTF-8-SIG":
-            r.encoding = "UTF-8-SIG"
-        else:
-            r.encoding = "utf-8"  # requests doesn't guess the encoding correctly
-
-        return self._convert(r.text)
+    def parse(self, responses: list[Response | None]) -> list[Collection]:
+        entries = []
+        for r in responses:
+            if r is None:
+                continue
+            try:
+                entries.extend(self._convert(r.text))
+            except Exception as e:
+                if not r.request.optional:
+                    raise
+                # e.g. a placeholder page for a year that isn't published yet
+                _LOGGER.debug(
+                    f"ignoring invalid optional response {r.request.url}: {e}"
+                )
+        return entries
 
     def fetch_file(self, file: str):
         try:
@@ -7,6 +7,7 @@ from waste_collection_schedule.exceptions import (
     SourceArgumentExceptionMultiple,
     SourceArgumentNotFoundWithSuggestions,
 )
+from waste_collection_schedule.service.PeriodicDates import periodic_dates
 
 TITLE = "Impact Apps"
 DESCRIPTION = (
@@ -333,14 +334,11 @@ def generate_recurring_dates(
     event: RecurringEventResponse, start_date: date, end_date: date
 ) -> List[date]:
     # Generate a list of dates for the recurring event
-    recurring_dates = []
     # Event days of week are indexed with Monday being 1 (1 = Monday, 7 = Sunday)
     start_date = date.fromisoformat(event["start_date"])
-    for i in range((end_date - start_date).days + 1):
-        current_date = start_date + timedelta(days=i)
-        if current_date.weekday() + 1 in event["daysOfWeek"]:
-            recurring_dates.append(current_date)
-    return recurring_dates
+    return periodic_dates(
+        start_date, [day - 1 for day in event["daysOfWeek"]], start_date, end_date
+    )
 
 
 class LocationFinder:
@@ -1,5 +1,7 @@
 import datetime
 import logging
+import threading
+import time
 
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
@@ -9,6 +11,11 @@ from waste_collection_schedule.exceptions import (
     SourceArgumentNotFound,
     SourceArgumentNotFoundWithSuggestions,
 )
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+from waste_collection_schedule.transport import Request, Response, fetch_two_stage
 
 TITLE = "Jumomind"
 DESCRIPTION = "Source for Jumomind.de waste collection."
@@ -201,6 +208,48 @@ def EXTRA_INFO():
 
 API_URL = "https://{provider}.jumomind.com/mmapp/api.php"
 
+# lookup tables (cities, streets, bin names) are refreshed after this time
+TABLE_TTL = 7 * 24 * 3600
+
+# resolved (city_id, area_id) and bin names per address, persisted
+_cache = PersistentCache("jumomind_de", ttl=TABLE_TTL)
+
+# city and street tables with their name index, kept in memory as the street
+# lists of some services are very large
+_tables: dict[str, tuple[float, dict]] = {}
+_tables_lock = threading.Lock()
+
+
+def _normalize(name: str) -> str:
+    return name.lower().strip()
+
+
+def _build_index(items: list[dict]) -> dict[str, dict]:
+    """Map name and _name of all items to the first item using it."""
+    index: dict[str, dict] = {}
+    for item in items:
+        for name in (item.get("name"), item.get("_name")):
+            if name is not None:
+                index.setdefault(_normalize(name), item)
+    return index
+
+
+def _get_table(session: requests.Session, api_url: str, params: dict) -> dict:
+    """Return {"items": [...], "index": {...}} for a request, cached per service."""
+    key = cache_key(api_url, params)
+    with _tables_lock:
+        cached = _tables.get(key)
+        if cached is not None and time.time() - cached[0] < TABLE_TTL:
+            return cached[1]
+
+    r = session.get(api_url, params=params)
+    r.raise_for_status()
+    items = r.json()
+    table = {"items": items, "index": _build_index(items)}
+    with _tables_lock:
+        _tables[key] = (time.time(), table)
+    return table
+
 
 PARAM_TRANSLATIONS = {
     "de": {
@@ -263,115 +312,119 @@ class Source:
         self._service_id = service_id
         self._city_id = city_id if city_id else None
         self._area_id = area_id if area_id else None
+        self._bin_name_map: dict[str, str] = {}
 
     def fetch(self):
-        session = requests.Session()
+        return fetch_two_stage(self)
 
-        city_id = self._city_id
-        area_id = self._area_id
-
-        if city_id is None and self._city is None:
+    def declare_requests(self):
+        if self._city_id is None and self._city is None:
             raise SourceArgumentExceptionMultiple(
                 ["city", "city_id"], "City or city id is required"
             )
-        if city_id is not None and self._city is not None:
+        if self._city_id is not None and self._city is not None:
             raise SourceArgumentExceptionMultiple(
                 ["city", "city_id"], "City OR city id is required. Do not use both"
             )
+        if self._city_id is not None and self._area_id is None:
+            raise SourceArgumentException(
+                "area_id",
+                "Area id is required when using city_id. Remove city id when using city (and street) name",
+            )
 
-        r = session.get(self._api_url, params={"r": "cities_web"})
-        r.raise_for_status()
+        key = cache_key(
+            self._service_id,
+            self._city,
+            self._street,
+            self._house_number,
+            self._city_id,
+            self._area_id,
+        )
+        cached = _cache.get(key)
+        if cached is not None:
+            city_id, area_id, self._bin_name_map = cached
+            try:
+                r = yield self._dates_request(city_id, area_id)
+                if all(e["trash_name"] in self._bin_name_map for e in r.json()):
+                    return
+            except Exception:
+                pass
+            # ids or bin names may have changed, resolve them again
+            LOGGER.debug("cached ids failed, resolving address again")
+            _cache.delete(key)
+
+        city_id, area_id = self._resolve_ids(requests.Session())
+        r = yield Request(
+            self._api_url,
+            params={"r": "trash", "city_id": city_id, "area_id": area_id},
+        )
+        self._bin_name_map = self._parse_bin_name_map(r)
+        yield self._dates_request(city_id, area_id)
+        _cache.set(key, [city_id, area_id, self._bin_name_map])
 
-        cities = r.json()
+    def parse(self, responses: list[Response]) -> list[Collection]:
+        # the dates are in the last response, the others are only used to
+        # resolve the address
+        entries = []
+        for event in responses[-1].json():
+            bin_type = self._bin_name_map[event["trash_name"]]
+            date = datetime.datetime.strptime(event["day"], "%Y-%m-%d").date()
+            icon = ICON_MAP.get(bin_type.split(" ")[0])  # Collection icon
+            entries.append(Collection(date=date, t=bin_type, icon=icon))
 
-        if city_id is not None:
-            if area_id is None:
-                raise SourceArgumentException(
-                    "area_id",
-                    "Area id is required when using city_id. Remove city id when using city (and street) name",
-                )
-        else:
-            has_streets = True
-            for city in cities:
-                if (
-                    city["name"].lower().strip() == self._city
-                    or city["_name"].lower().strip() == self._city
-                ):
-                    city_id = city["id"]
-                    area_id = city["area_id"]
-                    has_streets = city["has_streets"]
-                    break
-
-            if city_id is None:
-                raise SourceArgumentNotFoundWithSuggestions(
-                    "city", self._city, [c["name"] for c in cities]
-                )
+        return entries
+
+    def _resolve_ids(self, session: requests.Session) -> tuple:
+        if self._city_id is not None:
+            return self._city_id, self._area_id
+
+        cities = _get_table(session, self._api_url, {"r": "cities_web"})
+        city = cities["index"].get(self._city)
+        if city is None:
+            raise SourceArgumentNotFoundWithSuggestions(
+                "city", self._city, [c["name"] for c in cities["items"]]
+            )
+        city_id = city["id"]
+        area_id = city["area_id"]
 
-            if has_streets:
-                r = session.get(
-                    self._api_url, params={"r": "streets", "city_id": city_id}
+        if not city["has_streets"]:
+            if self._street is not None:
+                LOGGER.warning(
+                    "City does not need street name please remove it, continuing anyway"
                 )
-                r.raise_for_status()
-                streets = r.json()
-
-                street_found = False
-                for street in streets:
-                    if (
-                        street["name"].lower().strip() == self._street
-                        or street["_name"].lower().strip() == self._street
-                    ):
-                        street_found = True
-                        area_id = street["area_id"]
-                        if "houseNumbers" in street:
-                            for house_number in street["houseNumbers"]:
-                                if (
-                                    house_number[0].lower().strip().lstrip("0")
-                                    == self._house_number
-                                ):
-                                    area_id = house_number[1]
-                                    break
-                        break
-                if not street_found:
-                    streets_suggestions = {s.get("name") for s in streets}
-                    streets_suggestions.update({s.get("_name") for s in streets})
-                    streets_suggestions -= {None}
-                    raise SourceArgumentNotFoundWithSuggestions(
-                        "street", self._street, streets_suggestions
-                    )
-            else:
-                if self._street is not None:
-                    LOGGER.warning(
-                        "City does not need street name please remove it, continuing anyway"
-                    )
-
-        # get names for bins
+            return city_id, area_id
 
-        bin_name_map = {}
-        r = session.get(
-            self._api_url,
-            params={"r": "trash", "city_id": city_id, "area_id": area_id},
+        streets = _get_table(
+            session, self._api_url, {"r": "streets", "city_id": city_id}
         )
-        r.raise_for_status()
-
+        street = streets["index"].get(self._street)
+        if street is None:
+            streets_suggestions = {s.get("name") for s in streets["items"]}
+            streets_suggestions.update({s.get("_name") for s in streets["items"]})
+            streets_suggestions -= {None}
+            raise SourceArgumentNotFoundWithSuggestions(
+                "street", self._street, streets_suggestions
+            )
+        area_id = street["area_id"]
+        for house_number in street.get("houseNumbers", []):
+            if _normalize(house_number[0]).lstrip("0") == self._house_number:
+                area_id = house_number[1]
+                break
+        return city_id, area_id
+
+    def _parse_bin_name_map(self, r: Response) -> dict[str, str]:
+        bin_name_map = {}
         for bin_type in r.json():
             bin_name_map[bin_type["name"]] = bin_type["title"]
             if not bin_type["_name"] in bin_name_map:
                 bin_name_map[bin_type["_name"]] = bin_type["title"]
+        return bin_name_map
 
-        r = session.get(
+    def _dates_request(self, city_id, area_id) -> Request:
+        return Request(
             self._api_url,
             params={"r": "dates/0", "city_id": city_id, "area_id": area_id, "ws": 3},
         )
-        r.raise_for_status()
-
-        entries = []
-        for event in r.json():
-            bin_type = bin_name_map[event["trash_name"]]
-            date = datetime.datetime.strptime(event["day"], "%Y-%m-%d").date()
-            icon = ICON_MAP.get(bin_type.split(" ")[0])  # Collection icon
-            entries.append(Collection(date=date, t=bin_type, icon=icon))
-
-        return entries
 
 
 def print_md_table():
@@ -360,5 +360,5 @@ class Source(Junker):
             )
         except AreaNotFound as e:
             raise SourceArgumentNotFoundWithSuggestions(
-                "area", self._area, [a[0] for a in e.areas]
+                "area", self._area_name, [a[0] for a in e.areas]
             )
@@ -1,8 +1,8 @@
-from datetime import datetime
-
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
+from waste_collection_schedule.service.PersistentCache import cache_key
+from waste_collection_schedule.service.YearlyCollections import fetch_years
 
 TITLE = "Landkreis Verden"
 DESCRIPTION = "Source for Landkreis Verden waste collection."
@@ -59,12 +59,16 @@ class Source:
         self._ics = ICS()
 
     def fetch(self) -> list[Collection]:
-        now = datetime.now()
-        year = now.year
-        entries = self.get_collection(year)
-        if now.month == 12:
-            entries += self.get_collection(year + 1)
-        return entries
+        return fetch_years(
+            self.get_collection,
+            key=cache_key(
+                "landkreis_verden_de",
+                self.city,
+                self.street,
+                self.house_number,
+                self.house_number_addition,
+            ),
+        )
 
     def get_collection(self, year: int) -> list[Collection]:
         # Use a session to keep cookies
@@ -5,6 +5,7 @@ from time import time_ns
 
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.IconMatcher import IconMatcher
 
 TITLE = "Milton Keynes council"
 DESCRIPTION = "Source for Milton Keynes council."
@@ -22,6 +23,7 @@ ICON_MAP = {
     "FOOD": "mdi:leaf",
     "GARDEN": "mdi:leaf",
 }
+ICON_MATCHER = IconMatcher(ICON_MAP)
 
 
 SITE_URL = (
@@ -88,16 +90,13 @@ class Source:
         for index, item in rowdata.items():
             # print(item)
             bin_type = item["AssetTypeName"]
-            icon = None
-
-            for key, icon_name in ICON_MAP.items():
-                if (
-                    key in item["AssetTypeName"].upper()
-                    or key in item["TaskTypeName"].upper()
-                    or key in item["ServiceName"].upper()
-                ):
-                    icon = icon_name
-                    break
+            # the names are joined by newlines, so no key matches across them
+            icon = ICON_MATCHER.get(
+                "\n".join(
+                    item[name].upper()
+                    for name in ("AssetTypeName", "TaskTypeName", "ServiceName")
+                )
+            )
 
             dates = [
                 datetime.strptime(item["NextInstance"], "%Y-%m-%d").date(),
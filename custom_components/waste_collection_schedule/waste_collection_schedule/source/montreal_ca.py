@@ -1,9 +1,15 @@
+import calendar
+import json
 import logging
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
+from typing import Iterable, Iterator
 
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.PeriodicDates import periodic_dates
+from waste_collection_schedule.service.PersistentCache import PersistentCache
 
 # Currently, Montreal does not offer an iCal/Webcal subscription method.
 # The GeoJSON file provides sector-specific details.
@@ -86,6 +92,60 @@ MONTHS = {
 MONTH_PATTERN = r"\b(?:January|February|March|April|May|June|July|August|September|October|November|December)\b"
 
 LOGGER = logging.getLogger(__name__)
+
+# properties of the GeoJSON features needed to parse the schedule
+SCHEDULE_PROPERTIES = ("JOUR", "FREQUENCE", "MESSAGE_EN")
+CHUNK_SIZE = 64 * 1024
+
+# per url: {"etag": ..., "last_modified": ..., "sectors": {sector: [properties]}}
+_sector_cache = PersistentCache("montreal_ca")
+
+
+def iter_geojson_features(chunks: Iterable[str]) -> Iterator[dict]:
+    """Yield the features of a GeoJSON FeatureCollection read in chunks.
+
+    Only one feature is kept in memory at a time.
+    """
+    decoder = json.JSONDecoder()
+    chunk_iter = iter(chunks)
+    buffer = ""
+
+    def read() -> bool:
+        nonlocal buffer
+        chunk = next(chunk_iter, None)
+        if chunk is None:
+            return False
+        buffer += chunk
+        return True
+
+    # skip everything up to the start of the features array
+    while True:
+        start = buffer.find('"features"')
+        if start >= 0 and buffer.find("[", start) >= 0:
+            buffer = buffer[buffer.find("[", start) + 1 :]
+            break
+        if not read():
+            return
+
+    while True:
+        buffer = buffer.lstrip(" \t\r\n,")
+        if not buffer:
+            if not read():
+                return
+            continue
+        if buffer[0] == "]":
+            return
+        try:
+            feature, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            # feature is incomplete
+            if not read():
+                raise
+            continue
+        yield feature
+        buffer = buffer[end:]
+
+
 HOW_TO_GET_ARGUMENTS_DESCRIPTION = {
     "en": 'Download on your computer a <a href="https://donnees.montreal.ca/dataset/2df0fa28-7a7b-46c6-912f-93b215bd201e/resource/5f3fb372-64e8-45f2-a406-f1614930305c/download/collecte-des-ordures-menageres.geojson">Montreal GeoJSON file</a><br/>Visit https://geojson.io/<br/>Click on *Open* and select the Montreal GeoJSON file<br/>Find your sector on the map.',
     "fr": 'Téléchargez un <a href="https://donnees.montreal.ca/dataset/2df0fa28-7a7b-46c6-912f-93b215bd201e/resource/5f3fb372-64e8-45f2-a406-f1614930305c/download/collecte-des-ordures-menageres.geojson">fichier Montreal GeoJSON</a><br/>Visitez https://geojson.io/<br/>Ouvrez le fichier Montreal GeoJSON<br/>Trouvez votre secteur sur la carte.',
@@ -184,22 +244,19 @@ class Source:
 
         # These happens weekly
         if source_type in ["Waste", "Food", "Recycling", "Bulky"]:
-            # Iterate through each month and day, and handle the "out of range" error
-            for month in range(1, 13):
-                for day in range(1, 32):
-                    try:
-                        date = datetime(datetime.now().year, month, day)
-                        if date.weekday() != collection_day:  # Tuesday has index 1
-                            continue
-                        entries.append(
-                            Collection(
-                                date=date.date(),
-                                t=source_type,
-                                icon=ICON_MAP.get(source_type),
-                            )
-                        )
-                    except ValueError:
-                        pass  # Skip if the day is out of range for the month
+            if collection_day is None:
+                return entries
+            year = datetime.now().year
+            for day in periodic_dates(
+                date(year, 1, 1), [collection_day], date(year, 1, 1), date(year, 12, 31)
+            ):
+                entries.append(
+                    Collection(
+                        date=day,
+                        t=source_type,
+                        icon=ICON_MAP.get(source_type),
+                    )
+                )
             return entries
 
         days = []
@@ -229,10 +286,9 @@ class Source:
                     if re.search(rf"{month}", date_range_stop, re.IGNORECASE):
                         month_stop = month_id
                 if re.search(r"\d+", date_range_start):
-                    day_start = int(re.match(r".*(\d+).*", date_range_start).group(1))
+                    day_start = int(re.search(r"\d+", date_range_start).group(0))
                 if re.search(r"\d+", date_range_stop):
                     day_stop = int(re.search(r"\d+(?!.*\d+)", date_range_stop).group(0))
-                within_dates = False
             elif re.match(r"(.*\d+.*){1,}", line):
                 # Multiple dates ?
                 dates_defined = True
@@ -240,35 +296,32 @@ class Source:
                     if re.search(rf"{month}", line, re.IGNORECASE):
                         months_found.append(month)
 
+            if re.search("(every )?week(ly)?", line):
+                if collection_day is None:
+                    continue
+                first = date(
+                    year,
+                    month_start,
+                    min(day_start, calendar.monthrange(year, month_start)[1]),
+                )
+                last = date(
+                    year,
+                    month_stop,
+                    min(day_stop, calendar.monthrange(year, month_stop)[1]),
+                )
+                months = {MONTHS[month] for month in months_found}
+                days.extend(
+                    day
+                    for day in periodic_dates(first, [collection_day], first, last)
+                    if not dates_defined or day.month in months
+                )
+                continue
+
             for month, month_id in MONTHS.items():
                 if date_range and (month_id < month_start or month_id > month_stop):
                     continue
                 if dates_defined and month not in months_found:
                     continue
-                if re.search("(every )?week(ly)?", line):
-                    for day in range(1, 32):
-                        try:
-                            if (
-                                not within_dates
-                                and day_start == day
-                                and month_start == month_id
-                            ):
-                                within_dates = True
-                            if (
-                                within_dates
-                                and day_stop >= day
-                                and month_stop == month_id
-                            ):
-                                within_dates = False
-                            if within_dates:
-                                date = datetime(year, month_id, day)
-                                if (
-                                    date.weekday() == collection_day
-                                ):  # Tuesday has index 1
-                                    days.append(date.date())
-                        except ValueError:
-                            pass  # Skip if the day is out of range for the month
-                    continue
 
                 # Splitting the string by ',' and 'and' to extract individual numbers
                 line = line.replace(";", "")
@@ -290,8 +343,7 @@ class Source:
                     ]
 
                     for day in days_numbers:
-                        date = datetime(year, MONTHS[month], day)
-                        days.append(date.date())
+                        days.append(date(year, MONTHS[month], day))
                     # break
                 except Exception:
                     LOGGER.debug("No dates found in string.")
@@ -308,42 +360,75 @@ class Source:
             )
         return entries
 
-    def get_data_by_source(self, source_type, url):
-        # Get waste collection zone by longitude and latitude
+    def get_sector_table(self, url) -> dict[str, list[list]]:
+        """Return the schedule properties of all sectors of a GeoJSON file.
+
+        The table is cached and only downloaded again if the file changed.
+        """
+        cached = _sector_cache.get(url)
+        headers = {}
+        if cached is not None:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
 
-        r = requests.get(url, timeout=60)
-        r.raise_for_status()
+        with requests.get(url, headers=headers, timeout=60, stream=True) as r:
+            if r.status_code == 304 and cached is not None:
+                return cached["sectors"]
+            r.raise_for_status()
+            r.encoding = "utf-8"
 
-        schedule = r.json()
+            sectors: dict[str, list[list]] = {}
+            for feature in iter_geojson_features(
+                r.iter_content(CHUNK_SIZE, decode_unicode=True)
+            ):
+                properties = feature["properties"]
+                sectors.setdefault(properties["SECTEUR"], []).append(
+                    [properties.get(key) for key in SCHEDULE_PROPERTIES]
+                )
+            _sector_cache.set(
+                url,
+                {
+                    "etag": r.headers.get("ETag"),
+                    "last_modified": r.headers.get("Last-Modified"),
+                    "sectors": sectors,
+                },
+            )
+        return sectors
+
+    def get_data_by_source(self, source_type, url):
+        sectors = self.get_sector_table(url)
         entries = []
 
         # check the information for the sector
-        for feature in schedule["features"]:
-            if feature["properties"]["SECTEUR"] != self._sector[source_type.lower()]:
-                continue
-            if feature["properties"]["JOUR"] and feature["properties"]["FREQUENCE"]:
+        for jour, frequence, message_en in sectors.get(
+            self._sector[source_type.lower()], []
+        ):
+            if jour and frequence:
                 # Not implemented yet
                 pass
             else:
-                schedule_message = feature["properties"]["MESSAGE_EN"]
-                entries += self.parse_collection(source_type, schedule_message)
+                entries += self.parse_collection(source_type, message_en)
 
         return entries
 
+    def _fetch_source(self, source) -> list[Collection]:
+        try:
+            if self._sector[source["type"].lower()] is not None:
+                return self.get_data_by_source(source["type"], source["url"])
+            LOGGER.warning(
+                f"Skipped {source['type']} schedule as no sector was provided."
+            )
+        except Exception:
+            # Probably because the natural language format does not match known formats.
+            LOGGER.error("Error", exc_info=True)
+            LOGGER.warning(f"Error while parsing {source['type']} schedule. Ignored.")
+        return []
+
     def fetch(self):
         entries = []
-        for source in API_URL:
-            try:
-                if self._sector[source["type"].lower()] is not None:
-                    entries += self.get_data_by_source(source["type"], source["url"])
-                else:
-                    LOGGER.warning(
-                        f"Skipped {source['type']} schedule as no sector was provided."
-                    )
-            except Exception:
-                # Probably because the natural language format does not match known formats.
-                LOGGER.error("Error", exc_info=True)
-                LOGGER.warning(
-                    f"Error while parsing {source['type']} schedule. Ignored."
-                )
+        with ThreadPoolExecutor(max_workers=len(API_URL)) as pool:
+            for source_entries in pool.map(self._fetch_source, API_URL):
+                entries += source_entries
         return entries
@@ -1,5 +1,9 @@
 import importlib
 import logging
+import math
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from functools import cache
 
 URL = None
 TITLE = "Multiple Sources"
@@ -76,6 +80,11 @@ TEST_CASES = {
 
 LOGGER = logging.getLogger(__name__)
 
+# maximum number of sub-sources fetched at the same time
+MAX_WORKERS = 4
+# seconds after which a running sub-source is given up
+SOURCE_TIMEOUT = 120
+
 PARAM_TRANSLATIONS = {
     "de": {
         "sources": "Quellen",
@@ -83,21 +92,19 @@ PARAM_TRANSLATIONS = {
 }
 
 
+@cache
+def get_source_class(source: str) -> type:
+    return getattr(
+        importlib.import_module(f"waste_collection_schedule.source.{source}"),
+        "Source",
+    )
+
+
 def get_source(source: str, args: dict | list[dict]) -> list:
+    source_class = get_source_class(source)
     if isinstance(args, list):
-        return [
-            getattr(
-                importlib.import_module(f"waste_collection_schedule.source.{source}"),
-                "Source",
-            )(**arg)
-            for arg in args
-        ]
-    return [
-        getattr(
-            importlib.import_module(f"waste_collection_schedule.source.{source}"),
-            "Source",
-        )(**args)
-    ]
+        return [source_class(**arg) for arg in args]
+    return [source_class(**args)]
 
 
 def check_source_type(data):
@@ -126,20 +133,75 @@ class Source:
             raise ValueError(
                 f"Invalid source format provided should be a list of dictionaries or a list of list of dictionaries but is {type(sources)}, please take a look at the examples"
             )
-        self._sources: list = []
+        self._sources: list[tuple[str, object]] = []
         for source, args in sources.items():
-            self._sources += get_source(source, args)
+            self._sources += [(source, s) for s in get_source(source, args)]
 
     def fetch(self):
-        dates = []
-        fails = 0
-        for source in self._sources:
-            try:
-                dates.extend(source.fetch())
-            except Exception as e:
-                fails += 1
-                LOGGER.error(f"Error fetching dates from source {source}: {e}")
-
-        if fails == len(self._sources):
+        """Fetch all sub-sources concurrently.
+
+        A sub-source which fails or doesn't finish within SOURCE_TIMEOUT is
+        logged and skipped, the dates of all other sub-sources are returned.
+        """
+        results: list[list | None] = [None] * len(self._sources)
+        started: dict[int, float] = {}
+
+        def run(i: int, source) -> list:
+            started[i] = time.monotonic()
+            return source.fetch()
+
+        workers = max(1, min(MAX_WORKERS, len(self._sources)))
+        pool = ThreadPoolExecutor(max_workers=workers)
+        futures = {
+            pool.submit(run, i, source): i
+            for i, (_, source) in enumerate(self._sources)
+        }
+        pending = set(futures)
+        # Sub-sources which timed out keep their worker, so queued sub-sources
+        # may never start. Bound the overall time as well.
+        deadline = time.monotonic() + SOURCE_TIMEOUT * math.ceil(
+            len(self._sources) / workers
+        )
+        try:
+            while pending:
+                now = time.monotonic()
+                deadlines = [deadline] + [
+                    started[futures[f]] + SOURCE_TIMEOUT
+                    for f in pending
+                    if futures[f] in started
+                ]
+                timeout = max(0.0, min(deadlines) - now)
+                done, pending = wait(
+                    pending, timeout=timeout, return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    i = futures[future]
+                    name = self._sources[i][0]
+                    try:
+                        results[i] = future.result()
+                    except Exception as e:
+                        LOGGER.error(f"Error fetching dates from source {name}: {e}")
+
+                now = time.monotonic()
+                for future in list(pending):
+                    i = futures[future]
+                    if now >= deadline or (
+                        i in started and now - started[i] >= SOURCE_TIMEOUT
+                    ):
+                        pending.discard(future)
+                        LOGGER.error(
+                            f"Timeout fetching dates from source {self._sources[i][0]} after {SOURCE_TIMEOUT}s"
+                        )
+        finally:
+            # don't wait for sub-sources which timed out
+            pool.shutdown(wait=False, cancel_futures=True)
+
+        if all(result is None for result in results):
             raise RuntimeError("Failed to fetch dates from all sources")
+
+        dates = []
+        for result in results:
+            if result is not None:
+                dates.extend(result)
         return dates
@@ -1,11 +1,17 @@
 import json
 import urllib.parse
-from datetime import date, datetime, timedelta
+from datetime import datetime, timedelta
 from enum import Enum
 
 import requests
 from waste_collection_schedule import Collection
 from waste_collection_schedule.exceptions import SourceArgumentException
+from waste_collection_schedule.service.OpeningHours import expand_opening_hours
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
+from waste_collection_schedule.service.SpatialIndex import SpatialIndex
 
 TITLE = "Bordeaux Métropole"
 DESCRIPTION = "Source script for opendata.bordeaux-metropole.fr"
@@ -183,14 +189,20 @@ class DayNames(Enum):
     SUNDAY = "DIMANCHE"
 
 
+# geocoded addresses are refreshed after this time
+GEOCODE_TTL = 30 * 24 * 3600
+
+_geocode_cache = PersistentCache("opendata_bordeauxmetropole_fr", ttl=GEOCODE_TTL)
+
+# opening_hours abbreviations of the days
 DAY_NAME_MAP = {
-    DayNames.MONDAY: 0,
-    DayNames.TUESDAY: 1,
-    DayNames.WEDNESDAY: 2,
-    DayNames.THURSDAY: 3,
-    DayNames.FRIDAY: 4,
-    DayNames.SATURDAY: 5,
-    DayNames.SUNDAY: 6,
+    DayNames.MONDAY: "Mo",
+    DayNames.TUESDAY: "Tu",
+    DayNames.WEDNESDAY: "We",
+    DayNames.THURSDAY: "Th",
+    DayNames.FRIDAY: "Fr",
+    DayNames.SATURDAY: "Sa",
+    DayNames.SUNDAY: "Su",
 }
 
 
@@ -226,25 +238,12 @@ class Source:
         self.address = address
         self.city = city
 
-    @staticmethod
-    def _get_next_weekday(source_date: date, target_day_name: DayNames) -> date:
-        # Get the current weekday number
-        source_date_weekday = source_date.weekday()
-
-        # Get the target weekday number
-        target_weekday = DAY_NAME_MAP[target_day_name]
-
-        # Calculate the number of days until the next target weekday
-        days_until_target = (target_weekday - source_date_weekday + 7) % 7
-        if days_until_target == 0:  # It is source_date!
-            return source_date
-
-        # Calculate the date of the next target weekday
-        next_target_date = source_date + timedelta(days=days_until_target)
-
-        return next_target_date
-
     def _get_address_params(self, address: str) -> dict:
+        key = cache_key(address, self.city)
+        address_params = _geocode_cache.get(key)
+        if address_params is not None:
+            return address_params
+
         params: dict[str, str | int] = {
             "q": address,
             "citycode": self.INSEE_CODES[self.city],
@@ -262,43 +261,15 @@ class Source:
                 "address", "No results found for the given address and INSEE code"
             )
 
-        lat, lon = data[0]["geometry"]["coordinates"]
-        return {
+        # GeoJSON coordinates are (longitude, latitude)
+        lon, lat = data[0]["geometry"]["coordinates"]
+        address_params = {
             "lat": lat,
             "lon": lon,
             "address_id": data[0]["properties"]["id"],
         }
-
-    def _is_within_geo_shape(self, geo_shape: dict, address_params: dict) -> bool:
-        point_lon, point_lat = address_params["lon"], address_params["lat"]
-        polygon = geo_shape["geometry"]["coordinates"][0]
-        _type = geo_shape["geometry"]["type"]
-
-        def is_point_in_polygon(point, polygon) -> bool:
-            x, y = point
-            n = len(polygon)
-            inside = False
-            p1y, p1x = polygon[0]
-            for i in range(n + 1):
-                p2y, p2x = polygon[i % n]
-                if y > min(p1y, p2y):
-                    if y <= max(p1y, p2y):
-                        if x <= max(p1x, p2x):
-                            if p1y != p2y:
-                                xinters = (y - p1y) * (p2x - p1x) / (p2y - p1y) + p1x
-                            if p1x == p2x or x <= xinters:
-                                inside = not inside
-                p1x, p1y = p2x, p2y
-
-            return inside
-
-        if _type == "Polygon":
-            return is_point_in_polygon((point_lon, point_lat), polygon)
-        elif _type == "MultiPolygon":
-            for poly in polygon:
-                if is_point_in_polygon((point_lon, point_lat), poly):
-                    return True
-        return False
+        _geocode_cache.set(key, address_params)
+        return address_params
 
     def fetch(self) -> list[Collection]:
         # First we need to get the address parameters from the geocoder
@@ -312,12 +283,11 @@ class Source:
             raise SourceArgumentException("city", "Error response from API")
 
         # Now we need to filter the response to only include the relevant information
-        list_of_infos = [
-            i
-            for i in json.loads(response.text)
-            if i["geo_shape"]
-            and self._is_within_geo_shape(i["geo_shape"], address_params)
-        ]
+        index = SpatialIndex.from_geojson(
+            json.loads(response.text),
+            geometry=lambda i: (i["geo_shape"] or {}).get("geometry"),
+        )
+        list_of_infos = index.query(address_params["lon"], address_params["lat"])
 
         filtered_responses: dict[str, list[str]] = {}
         for response_item in list_of_infos:
@@ -327,21 +297,23 @@ class Source:
             for jour_col in response_item["jour_col"]:
                 waste_collection_per_type.append(jour_col)
 
+        # Let's generate a month of schedule
+        start = datetime.combine(datetime.today().date(), datetime.min.time())
+        end = start + timedelta(days=27)
+
         entries = []
         for _collection_type, _dates in filtered_responses.items():
             for _day in _dates:
-                source_date = datetime.today().date()
-                for _ in range(4):  # Let's generate a month of schedule
-                    next_date = self._get_next_weekday(source_date, DayNames(_day))
+                opening_hours = DAY_NAME_MAP[DayNames(_day)]
+                for next_date in expand_opening_hours(opening_hours, start, end):
                     entries.append(
                         Collection(
-                            date=next_date,  # Next collection date
+                            date=next_date.date(),  # Next collection date
                             t=LABEL_MAP.get(
                                 _collection_type, _collection_type
                             ),  # Collection type
                             icon=ICON_MAP.get(_collection_type),  # Collection icon
                         )
                     )
-                    source_date = next_date + timedelta(days=1)
 
         return entries
@@ -2,6 +2,8 @@ from datetime import datetime
 
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.PersistentCache import cache_key
+from waste_collection_schedule.service.YearlyCollections import fetch_years
 
 TITLE = "Rd4"
 DESCRIPTION = "Source for Rd4."
@@ -29,29 +31,11 @@ class Source:
         self._house_number: str | int = house_number
 
     def fetch(self) -> list[Collection]:
-        now = datetime.now()
-        year = now.year
-        entries = []
-        exception = None
-        try:
-            entries = self._get_collections(year)
-        except Exception as e:
-            # Do not fail in december to try to fetch next year
-            if now.month != 12:
-                raise
-            exception = e
-
-        if now.month != 12:
-            return entries
-
-        # Fetch next year in December
-        year += 1
-        try:
-            return entries + self._get_collections(year)
-        except Exception:
-            if exception:
-                raise exception
-            return entries
+        # in december the next year is fetched as well
+        return fetch_years(
+            self._get_collections,
+            key=cache_key("rd4_nl", self._postal_code, self._house_number),
+        )
 
     def _get_collections(self, year) -> list[Collection]:
         args = {
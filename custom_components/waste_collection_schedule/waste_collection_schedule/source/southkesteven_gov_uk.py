@@ -107,12 +107,4 @@ class Source:
                     continue
                 collections.append(Collection(date, bin_type, ICON_MAP.get(bin_type)))
 
-        # filter out duplicate entries
-        collections = list(
-            {
-                (collection.date, collection.type): collection
-                for collection in collections
-            }.values()
-        )
-
         return collections
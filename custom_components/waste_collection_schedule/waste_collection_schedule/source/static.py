@@ -1,11 +1,12 @@
 import datetime
 import logging
 from collections import OrderedDict
-from typing import Literal
+from typing import Iterable, Literal
 
 from dateutil import parser
-from dateutil.rrule import FR, MO, SA, SU, TH, TU, WE, rrule, weekday
+from dateutil.rrule import FR, MO, SA, SU, TH, TU, WE, WEEKLY, rrule, weekday
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
+from waste_collection_schedule.service.PeriodicDates import periodic_dates
 
 TITLE = "Static Source"
 DESCRIPTION = "Source for static waste collection schedules."
@@ -61,6 +62,11 @@ WEEKDAY_TYPE = Literal["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
 WEEKDAY_MAP = {"MO": MO, "TU": TU, "WE": WE, "TH": TH, "FR": FR, "SA": SA, "SU": SU}
 _LOGGER = logging.getLogger(__name__)
 
+# recurrences are only expanded within this window around today, which
+# covers the past entries shown in the calendar and the leadtime of sensors
+WINDOW_PAST_DAYS = 365
+WINDOW_FUTURE_DAYS = 2 * 365
+
 
 def validate_params(user_input):
     errors = {}
@@ -184,11 +190,13 @@ class Source:
             self._count = None
         else:
             self._until = None
-            self._count = count if count else 10
-        self._excludes = [
+            self._count = count if count else None
+        self._excludes = {
             d if isinstance(d, datetime.date) else parser.isoparse(d).date()
             for d in excludes or []
-        ]
+        }
+        self._rule: rrule | None = None
+        self._anchor: datetime.date | None = None
 
     def add_weekday(self, weekday, count: int):
         if self._weekdays is None:
@@ -199,31 +207,67 @@ class Source:
 
         self._weekdays.append(WEEKDAY_MAP[weekday](count))
 
-    def fetch(self):
-        dates = []
+    def _get_rule(self) -> rrule:
+        # Without a start, rrule starts at the time it is built, so the rule
+        # must be rebuilt on every fetch to roll forward (e.g. with count).
+        if self._start is None:
+            return self._build_rule(cache=False)
+        # compiled once, rrule caches the occurrences generated so far
+        if self._rule is None:
+            self._rule = self._build_rule(cache=True)
+        return self._rule
+
+    def _build_rule(self, cache: bool) -> rrule:
+        return rrule(
+            freq=self._recurrence,
+            interval=self._interval,
+            dtstart=self._start,
+            until=self._until,
+            count=self._count,
+            byweekday=self._weekdays,
+            cache=cache,
+        )
 
-        if self._recurrence is not None:
-            ruledates = rrule(
-                freq=self._recurrence,
+    def _recurrence_dates(
+        self, start: datetime.date, end: datetime.date
+    ) -> Iterable[datetime.date]:
+        if self._recurrence == WEEKLY and self._count is None:
+            # like rrule, start from today if no start is given
+            if self._anchor is None:
+                self._anchor = self._start or datetime.date.today()
+            return periodic_dates(
+                self._anchor,
+                [w.weekday for w in self._weekdays] if self._weekdays else None,
+                max(start, self._anchor),
+                min(end, self._until) if self._until else end,
                 interval=self._interval,
-                dtstart=self._start,
-                until=self._until,
-                count=self._count,
-                byweekday=self._weekdays,
             )
 
-            for ruleentry in ruledates:
-                date = ruleentry.date()
-
-                if self._excludes is not None and date in self._excludes:
-                    continue
-
-                dates.append(date)
+        return (
+            d.date()
+            for d in self._get_rule().between(
+                datetime.datetime.combine(start, datetime.time()),
+                datetime.datetime.combine(end, datetime.time()),
+                inc=True,
+            )
+        )
 
-        if self._dates is not None:
-            dates.extend(self._dates)
+    def fetch(self):
+        dates = set(self._dates)
 
-        dates.sort()
+        if self._recurrence is not None:
+            today = datetime.date.today()
+            window_end = today + datetime.timedelta(days=WINDOW_FUTURE_DAYS)
+            if self._until is None and self._count is None:
+                # open-ended, skip everything before the window
+                window_start = today - datetime.timedelta(days=WINDOW_PAST_DAYS)
+            else:
+                # bounded by the user, keep all past dates
+                window_start = datetime.date.min
+            dates.update(
+                date
+                for date in self._recurrence_dates(window_start, window_end)
+                if date not in self._excludes
+            )
 
-        entries = [Collection(date, self._type) for date in set(dates)]
-        return entries
+        return [Collection(date, self._type) for date in sorted(dates)]
@@ -6,9 +6,15 @@ import requests
 from bs4 import BeautifulSoup
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.exceptions import (
+    SourceArgumentException,
     SourceArgumentNotFoundWithSuggestions,
     SourceArgumentRequiredWithSuggestions,
 )
+from waste_collection_schedule.service.IconMatcher import IconMatcher
+from waste_collection_schedule.service.PersistentCache import (
+    PersistentCache,
+    cache_key,
+)
 
 TITLE = "Die NÖ Umweltverbände"
 DESCRIPTION = (
@@ -391,6 +397,8 @@ ICON_MAP = {
     "Verpackung": "mdi:package-variant",
     "LVP": "mdi:package-variant",
 }
+# the last contained key wins, e.g. "Verpackung" over "Gelber Sack"
+ICON_MATCHER = IconMatcher(ICON_MAP, precedence="last")
 
 PARAM_TRANSLATIONS = {
     "de": {
@@ -407,6 +415,12 @@ POSSIBLE_COLLECTION_PATHS = (
     "abfall-entsorgung/abfuhrtermine/",
 )
 
+# which page layout a district uses and the resolved dropdown values of an
+# address, both are resolved again if a fetch using them fails
+CACHE_TTL = 30 * 24 * 3600
+_probe_cache = PersistentCache("umweltverbaende_at_probe", ttl=CACHE_TTL)
+_address_cache = PersistentCache("umweltverbaende_at", ttl=CACHE_TTL)
+
 
 class Source:
     def __init__(
@@ -462,23 +476,33 @@ class Source:
             )
         self._district_url: str = district_url
 
+        # probed on first fetch
         self._district_collection_url: str | None = None
-        self.use_new = False
-        for col_path in POSSIBLE_COLLECTION_PATHS:
-            if (
-                r := requests.get(f"{self._district_url}{col_path}")
-            ).status_code == 200:
-                self._district_collection_url = r.url
-                self._district_url = self._district_collection_url.split(col_path)[0]
-                self.use_new = True
-                break
+        self.use_new: bool | None = None
+
+    def _probe(self, use_cache: bool = True) -> bool:
+        """Check if the district uses the new (WordPress) collection page.
+
+        Returns True if the result was cached.
+        """
+        cached = _probe_cache.get(self._district) if use_cache else None
+        from_cache = cached is not None
+        if cached is None:
+            cached = [None, self._district_url]
+            for col_path in POSSIBLE_COLLECTION_PATHS:
+                if (
+                    r := requests.get(f"{self._district_url}{col_path}")
+                ).status_code == 200:
+                    cached = [r.url, r.url.split(col_path)[0]]
+                    break
+            _probe_cache.set(self._district, cached)
+
+        self._district_collection_url, self._district_url = cached
+        self.use_new = self._district_collection_url is not None
+        return from_cache
 
     def get_icon(self, waste_text: str) -> str | None:
-        mdi_icon = None
-        for waste in ICON_MAP:
-            if waste in waste_text:
-                mdi_icon = ICON_MAP[waste]
-        return mdi_icon
+        return ICON_MATCHER.get(waste_text)
 
     def append_entry(self, ent: list, txt: list):
         ent.append(
@@ -491,9 +515,17 @@ class Source:
         return
 
     def fetch(self) -> list[Collection]:
-        if self.use_new:
-            return self.fetch_new()
-        return self.fetch_old()
+        from_cache = self._probe()
+        try:
+            return self.fetch_new() if self.use_new else self.fetch_old()
+        except SourceArgumentException:
+            raise
+        except Exception:
+            if not from_cache:
+                raise
+            # the district may have changed its page, probe again
+            self._probe(use_cache=False)
+            return self.fetch_new() if self.use_new else self.fetch_old()
 
     def fetch_old(self) -> list[Collection]:
         now = datetime.now()
@@ -633,8 +665,8 @@ class Source:
         assert self._district_collection_url is not None
         s = requests.Session()
 
+        # the nonce changes, the page has to be loaded for every fetch
         r0 = s.get(self._district_collection_url)
-        soup = BeautifulSoup(r0.text, "html.parser")
         NONCE_REGEX = r'"nonce":"([a-zA-Z0-9]+)"'
         nonce_match = re.search(NONCE_REGEX, r0.text)
         if (
@@ -646,6 +678,37 @@ class Source:
                 f"Could not find nonce for page {self._district_url}fuer-die-bevoelkerung/abholtermine/"
             )
 
+        key = cache_key(
+            self._district,
+            self._municipal,
+            self._town,
+            self._plz,
+            self._street,
+            self._hnr,
+            self._addition,
+        )
+        cached = _address_cache.get(key)
+        if cached is not None:
+            search, fraktionen = cached
+            try:
+                entries = self.get_collections(s, nonce, search, fraktionen)
+                if entries:
+                    return entries
+            except Exception:
+                pass
+            # dropdown values may have changed, resolve them again
+            _address_cache.delete(key)
+
+        search, fraktionen = self.resolve_address(s, r0.text, nonce)
+        entries = self.get_collections(s, nonce, search, fraktionen)
+        _address_cache.set(key, [search, fraktionen])
+        return entries
+
+    def resolve_address(
+        self, s: requests.Session, page: str, nonce: str
+    ) -> tuple[dict[str, str], list[str]]:
+        """Return the selected dropdown values and the fraktionen of the address."""
+        soup = BeautifulSoup(page, "html.parser")
         mun_select = soup.select_one("select#gemeinde")
         if not mun_select:
             raise Exception(
@@ -690,9 +753,23 @@ class Source:
         checkboxes = soup.select("input[type=checkbox]")
         fraktionen: list[str] = [checkbox["value"] for checkbox in checkboxes]
 
-        data2: dict[str, str | list[str]] = {k: v for k, v in data.items()}
-        data2["action"] = "get_zone_and_abfuhrtermine"
-        data2["fraktionen[]"] = fraktionen
+        search = {k: v for k, v in data.items() if k.startswith("search[")}
+        return search, fraktionen
+
+    def get_collections(
+        self,
+        s: requests.Session,
+        nonce: str,
+        search: dict[str, str],
+        fraktionen: list[str],
+    ) -> list[Collection]:
+        data2: dict[str, str | list[str]] = {
+            "action": "get_zone_and_abfuhrtermine",
+            "nonce": nonce,
+            "element": "",
+            **search,
+            "fraktionen[]": fraktionen,
+        }
         r = s.post(f"{self._district_url}wp-admin/admin-ajax.php", data=data2)
         r.raise_for_status()
 
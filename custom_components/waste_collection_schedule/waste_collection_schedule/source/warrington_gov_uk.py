@@ -46,10 +46,6 @@ class Source:
             if not bin_type:
                 continue
 
-            # List contains duplicates, so skip if already added.
-            if self.contains(entries, lambda x: x.date == datetime.strptime(job["ScheduledStart"], "%Y-%m-%dT%H:00:00").date() and x.type == bin_type):
-                continue
-
             entries.append(
                 Collection(
                     date=datetime.strptime(job["ScheduledStart"], "%Y-%m-%dT%H:00:00").date(),
@@ -68,9 +64,3 @@ class Source:
         if "GREEN" in name:
             return "Green Bin"
         return False
-
-    def contains(self, list, filter):
-        for x in list:
-            if filter(x):
-                return True
-        return False
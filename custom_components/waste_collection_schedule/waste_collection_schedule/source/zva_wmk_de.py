@@ -1,8 +1,8 @@
-import datetime
-
 import requests
 from waste_collection_schedule import Collection  # type: ignore[attr-defined]
 from waste_collection_schedule.service.ICS import ICS
+from waste_collection_schedule.service.PersistentCache import cache_key
+from waste_collection_schedule.service.YearlyCollections import fetch_years
 
 TITLE = "Abfallwirtschaft Werra-Meißner-Kreis"
 DESCRIPTION = "Source for Zweckverband Abfallwirtschaft Werra-Meißner-Kreis"
@@ -30,12 +30,9 @@ class Source:
         self._ics = ICS(split_at=" / ")
 
     def fetch(self):
-        today = datetime.date.today()
-
-        entries = self._fetch_year(today.year)
-        if today.month == 12:
-            entries.extend(self._fetch_year(today.year + 1))
-        return entries
+        return fetch_years(
+            self._fetch_year, key=cache_key("zva_wmk_de", self._city, self._street)
+        )
 
     def _fetch_year(self, year):
         match year:
@@ -0,0 +1,160 @@
+import json
+import threading
+from collections import defaultdict
+from functools import cache
+from pathlib import Path
+from typing import Any, TypedDict
+
+from .suggestions import normalize, trigrams
+
+SOURCES_JSON = Path(__file__).resolve().parents[1] / "sources.json"
+
+
+class SourceDict(TypedDict):
+    title: str
+    module: str
+    default_params: dict[str, Any]
+    id: str
+
+
+class SourceOption(TypedDict):
+    value: str
+    label: str
+
+
+def option_value(source: SourceDict) -> str:
+    """Return the value used for a source in the config flow select box."""
+    return f"{source['module']}\t{source['title']}\t{source['id']}"
+
+
+class SourceCatalogue:
+    """Read-only index of all sources listed in sources.json.
+
+    The JSON file is only parsed on first access. Option lists are built once
+    per country, search indices are built on the first search.
+    """
+
+    def __init__(self, path: Path = SOURCES_JSON):
+        self._path = path
+        self._lock = threading.Lock()
+        self._countries: dict[str, list[SourceDict]] | None = None
+        self._by_value: dict[str, dict[str, SourceDict]] = {}
+        self._ids: set[str] = set()
+        self._modules: set[str] = set()
+        self._options: dict[str, list[SourceOption]] = {}
+
+        # search index, built on demand
+        self._entries: list[tuple[str, SourceDict, str, int]] = []
+        self._trigram_index: dict[str, list[int]] = {}
+
+    def _load(self) -> dict[str, list[SourceDict]]:
+        if self._countries is not None:
+            return self._countries
+        with self._lock:
+            if self._countries is None:
+                with self._path.open(encoding="utf-8") as json_file:
+                    countries: dict[str, list[SourceDict]] = json.load(json_file)
+                for country, sources in countries.items():
+                    by_value = self._by_value.setdefault(country, {})
+                    for source in sources:
+                        by_value.setdefault(option_value(source), source)
+                        self._ids.add(source["id"])
+                        self._modules.add(source["module"])
+                self._countries = countries
+        return self._countries
+
+    @property
+    def countries(self) -> list[str]:
+        return list(self._load().keys())
+
+    def get_sources(self, country: str) -> list[SourceDict]:
+        return self._load().get(country, [])
+
+    def get_options(self, country: str) -> list[SourceOption]:
+        """Return the select options for all sources of a country."""
+        options = self._options.get(country)
+        if options is None:
+            options = [SourceOption(value="", label="")] + [
+                SourceOption(
+                    value=option_value(source),
+                    label=f"{source['title']} ({source['module']})",
+                )
+                for source in self.get_sources(country)
+            ]
+            self._options[country] = options
+        return options
+
+    def get_source(self, country: str, value: str) -> SourceDict | None:
+        """Return the source selected by an option value, None if unknown."""
+        self._load()
+        return self._by_value.get(country, {}).get(value)
+
+    def has_id(self, id: str) -> bool:
+        self._load()
+        return id in self._ids
+
+    def has_module(self, module: str) -> bool:
+        self._load()
+        return module in self._modules
+
+    def _build_search_index(self) -> None:
+        countries = self._load()
+        with self._lock:
+            if self._entries:
+                return
+            entries: list[tuple[str, SourceDict, str, int]] = []
+            index: dict[str, list[int]] = defaultdict(list)
+            for country, sources in countries.items():
+                for source in sources:
+                    key = normalize(f"{source['title']} {source['module']}")
+                    key_trigrams = trigrams(key)
+                    for trigram in key_trigrams:
+                        index[trigram].append(len(entries))
+                    entries.append((country, source, key, len(key_trigrams)))
+            self._trigram_index = dict(index)
+            self._entries = entries
+
+    def search(
+        self, query: str, country: str | None = None, limit: int = 20
+    ) -> list[SourceDict]:
+        """Search sources by title or module name.
+
+        Sources whose title or module starts with the query are ranked first,
+        all others by their trigram similarity to the query.
+
+        Args:
+            query (str): text entered by the user
+            country (str | None, optional): only search sources of this country. Defaults to None.
+            limit (int, optional): maximum number of results. Defaults to 20.
+
+        Returns:
+            list[SourceDict]: best matching sources, best match first
+        """
+        query = normalize(query)
+        if not query:
+            return []
+        self._build_search_index()
+
+        query_trigrams = trigrams(query)
+        shared: dict[int, int] = defaultdict(int)
+        for trigram in query_trigrams:
+            for i in self._trigram_index.get(trigram, ()):
+                shared[i] += 1
+
+        scored = []
+        for i, count in shared.items():
+            entry_country, source, key, key_trigram_count = self._entries[i]
+            if country is not None and entry_country != country:
+                continue
+            prefix = key.startswith(query) or f" {query}" in key
+            score = count / (len(query_trigrams) + key_trigram_count - count)
+            scored.append((not prefix, -score, key, source))
+
+        scored.sort(key=lambda x: x[:3])
+        return [x[3] for x in scored[:limit]]
+
+
+@cache
+def get_source_catalogue() -> SourceCatalogue:
+    """Return the catalogue shared by all config flows."""
+    return SourceCatalogue()
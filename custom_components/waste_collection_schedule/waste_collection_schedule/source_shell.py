@@ -5,6 +5,7 @@ import traceback
 from typing import Dict, Iterable, List, Optional, Protocol
 
 from .collection import Collection
+from .transport import fetch_two_stage, is_two_stage
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -75,31 +76,6 @@ class Customize:
         return f"Customize{{waste_type={self._waste_type}, alias={self._alias}, show={self._show}, icon={self._icon}, picture={self._picture}}}"
 
 
-def filter_function(entry: Collection, customize: Dict[str, Customize]):
-    c = customize.get(entry.type)
-    if c is None:
-        return True
-    else:
-        return c.show
-
-
-def customize_function(entry: Collection, customize: Dict[str, Customize]):
-    c = customize.get(entry.type)
-    if c is not None:
-        if c.alias is not None:
-            entry.set_type(c.alias)
-        if c.icon is not None:
-            entry.set_icon(c.icon)
-        if c.picture is not None:
-            entry.set_picture(c.picture)
-    return entry
-
-
-def apply_day_offset(entry: Collection, day_offset: int) -> Collection:
-    entry.set_date(entry.date + datetime.timedelta(days=day_offset))
-    return entry
-
-
 class SourceShell:
     def __init__(
         self,
@@ -111,6 +87,7 @@ class SourceShell:
         calendar_title: Optional[str],
         unique_id: str,
         day_offset: int,
+        deduplicate: bool = True,
     ):
         self._source = source
         self._customize = customize
@@ -122,6 +99,7 @@ class SourceShell:
         self._refreshtime: datetime.datetime | None = None
         self._entries: List[Collection] = []
         self._day_offset = day_offset
+        self._deduplicate = deduplicate
 
     @property
     def refreshtime(self):
@@ -155,29 +133,55 @@ class SourceShell:
         """Fetch data from source."""
         try:
             # fetch returns a list of Collection's
-            entries: Iterable[Collection] = self._source.fetch()
+            entries: Iterable[Collection]
+            if is_two_stage(self._source):
+                entries = fetch_two_stage(self._source)  # type: ignore[arg-type]
+            else:
+                entries = self._source.fetch()
         except Exception:
             _LOGGER.error(
                 f"fetch failed for source {self._title}:\n{traceback.format_exc()}"
             )
             return
+        self.set_fetched_entries(entries)
+
+    def set_fetched_entries(self, entries: Iterable[Collection]) -> None:
+        """Post-process and store entries returned by the source."""
         self._refreshtime = datetime.datetime.now()
 
-        # strip whitespaces
+        day_offset = datetime.timedelta(days=self._day_offset)
+        seen: set[tuple[datetime.date, str]] = set()
+        result: List[Collection] = []
         for e in entries:
+            # strip whitespaces
             e.set_type(e.type.strip())
 
-        # filter hidden entries
-        entries = filter(lambda x: filter_function(x, self._customize), entries)
-
-        # customize fetched entries
-        entries = map(lambda x: customize_function(x, self._customize), entries)
-
-        # apply day offset
-        if self._day_offset != 0:
-            entries = map(lambda x: apply_day_offset(x, self._day_offset), entries)
-
-        self._entries = list(entries)
+            c = self._customize.get(e.type)
+            if c is not None:
+                # filter hidden entries
+                if not c.show:
+                    continue
+                # customize fetched entries
+                if c.alias is not None:
+                    e.set_type(c.alias)
+                if c.icon is not None:
+                    e.set_icon(c.icon)
+                if c.picture is not None:
+                    e.set_picture(c.picture)
+
+            if day_offset:
+                e.set_date(e.date + day_offset)
+
+            # drop entries with the same date and (customized) type
+            if self._deduplicate:
+                key = (e.date, e.type)
+                if key in seen:
+                    continue
+                seen.add(key)
+
+            result.append(e)
+
+        self._entries = result
 
     def get_dedicated_calendar_types(self) -> set[str]:
         """Return set of waste types with a dedicated calendar."""
@@ -241,6 +245,9 @@ class SourceShell:
             calendar_title=calendar_title,
             unique_id=calc_unique_source_id(source_name, source_args),
             day_offset=day_offset,
+            # sources which emit multiple entries of the same type on the
+            # same day on purpose set DEDUPLICATE = False
+            deduplicate=getattr(source_module, "DEDUPLICATE", True),
         )
 
         return g
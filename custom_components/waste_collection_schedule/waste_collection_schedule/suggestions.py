@@ -0,0 +1,88 @@
+import heapq
+import re
+import unicodedata
+from typing import Any, Callable, Iterable, TypeVar
+
+T = TypeVar("T")
+
+# maximum number of suggestions passed on to the user
+MAX_SUGGESTIONS = 100
+
+_NON_ALNUM_REGEX = re.compile(r"[^a-z0-9]+")
+
+
+def normalize(text: str) -> str:
+    """Normalize text for comparisons: lower case, no accents, single spaces."""
+    text = unicodedata.normalize("NFKD", text.casefold())
+    text = "".join(c for c in text if not unicodedata.combining(c))
+    return _NON_ALNUM_REGEX.sub(" ", text).strip()
+
+
+def trigrams(text: str) -> set[str]:
+    """Return the trigrams of an already normalized text."""
+    padded = f"  {text} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+def similarity(a: set[str], b: set[str]) -> float:
+    """Return the Jaccard similarity of two trigram sets."""
+    if not a or not b:
+        return 0.0
+    shared = len(a & b)
+    return shared / (len(a) + len(b) - shared)
+
+
+def rank_suggestions(
+    value: Any,
+    candidates: Iterable[T],
+    limit: int | None = MAX_SUGGESTIONS,
+    key: Callable[[T], str] = str,
+) -> list[T]:
+    """Return the candidates most similar to value, best match first.
+
+    Candidates are compared after normalization (case, accents, punctuation
+    and whitespace). Exact matches rank first, followed by candidates starting
+    with the value, candidates containing a word starting with the value and
+    finally all others, each group ordered by trigram similarity. Identical
+    candidates are only returned once, candidates only differing in case,
+    accents or punctuation are distinct values and all returned. The
+    candidates are consumed as a stream and only the best `limit` entries
+    are kept.
+
+    Args:
+        value (Any): the value entered by the user, None keeps the original order
+        candidates (Iterable[T]): all possible values
+        limit (int | None, optional): maximum number of results, None for all. Defaults to MAX_SUGGESTIONS.
+        key (Callable[[T], str], optional): text of a candidate used for ranking. Defaults to str.
+
+    Returns:
+        list[T]: the best matching candidates
+    """
+    query = normalize(str(value)) if value is not None else ""
+    query_trigrams = trigrams(query) if query else set()
+
+    def scored():
+        seen: set[str] = set()
+        for index, candidate in enumerate(candidates):
+            raw = key(candidate)
+            if raw in seen:
+                continue
+            seen.add(raw)
+            text = normalize(raw)
+            if not query:
+                score: tuple = (0,)
+            elif text == query:
+                score = (4,)
+            elif text.startswith(query):
+                score = (3, similarity(query_trigrams, trigrams(text)))
+            elif f" {query}" in text:
+                score = (2, similarity(query_trigrams, trigrams(text)))
+            else:
+                score = (1, similarity(query_trigrams, trigrams(text)))
+            yield score, -index, candidate
+
+    if limit is None:
+        ranked = sorted(scored(), key=lambda x: x[:2], reverse=True)
+    else:
+        ranked = heapq.nlargest(limit, scored(), key=lambda x: x[:2])
+    return [x[2] for x in ranked]
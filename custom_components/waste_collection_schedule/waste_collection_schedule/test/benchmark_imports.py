@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+HEAVY_MODULES = [
+    "requests",
+    "bs4",
+    "lxml",
+    "dateutil",
+    "icalevents",
+    "icalendar",
+    "jinja2",
+    "Crypto",
+]
+
+# executed in a fresh interpreter per source so every measurement starts cold
+MEASURE_SCRIPT = """
+import json
+import site
+import sys
+import time
+
+site.addsitedir({package_dir!r})
+baseline = set(sys.modules)
+start = time.perf_counter()
+import waste_collection_schedule.source.{source}
+duration = time.perf_counter() - start
+loaded = set(sys.modules) - baseline
+print(json.dumps({{
+    "duration": duration,
+    "modules": len(loaded),
+    "heavy": sorted(m for m in {heavy!r} if m in loaded),
+}}))
+"""
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Measure the cold import time of sources."
+    )
+    parser.add_argument(
+        "-s", "--source", action="append", help="Measure given source file"
+    )
+    parser.add_argument(
+        "-n", "--top", type=int, default=0, help="Only show the n slowest sources"
+    )
+    parser.add_argument(
+        "--sorted", action="store_true", help="Sort output by import time"
+    )
+    args = parser.parse_args()
+
+    package_dir = Path(__file__).resolve().parents[2]
+    source_dir = package_dir / "waste_collection_schedule" / "source"
+
+    if args.source is not None:
+        source_files = args.source
+    else:
+        source_files = [x.stem for x in source_dir.glob("*.py") if x.stem != "__init__"]
+
+    results = {}
+    for source in sorted(source_files):
+        result = measure(package_dir, source)
+        if result is not None:
+            results[source] = result
+
+    items = list(results.items())
+    if args.sorted or args.top:
+        items.sort(key=lambda x: x[1]["duration"], reverse=True)
+    if args.top:
+        items = items[: args.top]
+
+    for source, result in items:
+        heavy = ", ".join(result["heavy"]) or "-"
+        print(
+            f"{result['duration'] * 1000:8.1f} ms {result['modules']:5d} modules  {source} [{heavy}]"
+        )
+
+    if results:
+        total = sum(r["duration"] for r in results.values())
+        print(
+            f"\n{len(results)} sources, total {total:.2f} s, mean {total / len(results) * 1000:.1f} ms"
+        )
+
+
+def measure(package_dir: Path, source: str) -> dict | None:
+    script = MEASURE_SCRIPT.format(
+        package_dir=str(package_dir), source=source, heavy=HEAVY_MODULES
+    )
+    p = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, cwd="/"
+    )
+    if p.returncode != 0:
+        print(f"  {source} failed: {p.stderr.strip().splitlines()[-1:]}")
+        return None
+    return json.loads(p.stdout.strip().splitlines()[-1])
+
+
+if __name__ == "__main__":
+    main()
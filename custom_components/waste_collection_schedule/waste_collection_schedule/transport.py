@@ -0,0 +1,204 @@
+"""Two-stage sources: declared HTTP requests and a separate parse step.
+
+Instead of fetch(), a source may implement
+
+    declare_requests(self) -> Iterable[Request] | Generator
+    parse(self, responses: list[Response | None]) -> list[Collection]
+
+The requests are executed by a Transport, which reuses one session, sends
+independent requests concurrently and may reuse responses. parse gets the
+responses in the order of the requests and does not do any I/O itself, so
+recorded responses can be parsed offline.
+
+declare_requests may also be a generator for requests depending on
+previous responses: every yielded Request (or list of Requests) is sent
+and the Response (or list of Responses) is sent back into the generator,
+exceptions of failed requests are thrown into it. parse then gets the
+responses of all yielded requests.
+
+Unlike plain requests calls, every Request has a timeout (30 seconds by
+default) and responses with an HTTP error status raise, so an error page is
+never passed to parse. Set timeout=None or catch the error (optional=True)
+where a source relies on the old behaviour.
+
+A source instance setting two_stage = False (e.g. for a local file instead
+of a URL) is fetched with its plain fetch().
+"""
+
+import inspect
+import json
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Protocol
+
+_LOGGER = logging.getLogger(__name__)
+
+MAX_WORKERS = 4
+
+
+@dataclass
+class Request:
+    url: str
+    method: str = "GET"
+    params: Any = None
+    data: Any = None
+    json: Any = None
+    headers: dict[str, str] | None = None
+    verify: bool = True
+    timeout: float | None = 30
+    # decode the response with this encoding instead of the one guessed by requests
+    encoding: str | None = None
+    # seconds a response may be reused for identical requests, None to never reuse it
+    cache_ttl: float | None = None
+    # return None instead of raising if the request fails
+    optional: bool = False
+
+    def cache_key(self) -> str:
+        return json.dumps(
+            [self.method, self.url, self.params, self.data, self.json, self.headers],
+            sort_keys=True,
+            default=str,
+        )
+
+
+@dataclass
+class Response:
+    request: Request
+    status_code: int
+    text: str
+    headers: dict[str, str] = field(default_factory=dict)
+
+    def json(self) -> Any:
+        return json.loads(self.text)
+
+
+class TwoStageSource(Protocol):
+    def declare_requests(self) -> Any:
+        ...
+
+    def parse(self, responses: list[Response | None]) -> list:
+        ...
+
+
+class Transport:
+    """Send Requests with a shared session."""
+
+    def __init__(self, max_workers: int = MAX_WORKERS):
+        self._max_workers = max_workers
+        self._session = None
+        self._lock = threading.Lock()
+        self._cache: dict[str, tuple[float, Response]] = {}
+
+    def _get_session(self):
+        import requests
+
+        with self._lock:
+            if self._session is None:
+                self._session = requests.Session()
+            return self._session
+
+    def send(self, request: Request) -> Response | None:
+        key = request.cache_key() if request.cache_ttl is not None else None
+        if key is not None:
+            with self._lock:
+                cached = self._cache.get(key)
+            if cached is not None and time.time() - cached[0] <= request.cache_ttl:
+                return cached[1]
+
+        try:
+            response = self._send(request)
+        except Exception as e:
+            if not request.optional:
+                raise
+            _LOGGER.debug(f"ignoring failed optional request {request.url}: {e}")
+            return None
+
+        if key is not None:
+            now = time.time()
+            with self._lock:
+                self._cache = {
+                    k: v
+                    for k, v in self._cache.items()
+                    if now - v[0] <= (v[1].request.cache_ttl or 0)
+                }
+                self._cache[key] = (now, response)
+        return response
+
+    def _send(self, request: Request) -> Response:
+        r = self._get_session().request(
+            request.method,
+            request.url,
+            params=request.params,
+            data=request.data,
+            json=request.json,
+            headers=request.headers,
+            verify=request.verify,
+            timeout=request.timeout,
+        )
+        r.raise_for_status()
+        if request.encoding is not None:
+            r.encoding = request.encoding
+        return Response(request, r.status_code, r.text, dict(r.headers))
+
+    def send_all(self, requests: list[Request]) -> list[Response | None]:
+        """Send requests concurrently, the responses are in the same order."""
+        if len(requests) <= 1:
+            return [self.send(request) for request in requests]
+        with ThreadPoolExecutor(
+            max_workers=min(len(requests), self._max_workers)
+        ) as pool:
+            return list(pool.map(self.send, requests))
+
+
+default_transport = Transport()
+
+
+def is_two_stage(source: Any) -> bool:
+    return (
+        getattr(source, "two_stage", True)
+        and callable(getattr(source, "declare_requests", None))
+        and callable(getattr(source, "parse", None))
+    )
+
+
+def _send(transport: Transport, batch):
+    if isinstance(batch, Request):
+        return transport.send(batch)
+    return transport.send_all(list(batch))
+
+
+def fetch_two_stage(
+    source: TwoStageSource, transport: Transport = default_transport
+) -> list:
+    """Execute the requests of a two-stage source and parse the responses."""
+    started = time.perf_counter()
+    declared = source.declare_requests()
+    responses: list[Response | None] = []
+
+    if inspect.isgenerator(declared):
+        try:
+            batch = next(declared)
+            while True:
+                try:
+                    result = _send(transport, batch)
+                except Exception as e:
+                    batch = declared.throw(e)
+                    continue
+                responses.extend([result] if isinstance(batch, Request) else result)
+                batch = declared.send(result)
+        except StopIteration:
+            pass
+    else:
+        responses = transport.send_all(list(declared))
+
+    parse_started = time.perf_counter()
+    entries = source.parse(responses)
+    _LOGGER.debug(
+        f"{type(source).__module__}: {len(responses)} requests in "
+        f"{parse_started - started:.2f}s, parsed in "
+        f"{time.perf_counter() - parse_started:.2f}s"
+    )
+    return entries
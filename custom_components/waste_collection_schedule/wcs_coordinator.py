@@ -1,5 +1,6 @@
 import datetime
 import logging
+import time
 from random import randrange
 from typing import Any
 
@@ -14,7 +15,8 @@ from homeassistant.helpers.event import (
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator
 
 from . import const
-from .waste_collection_schedule import CollectionAggregator, SourceShell
+from .waste_collection_schedule import Collection, CollectionAggregator, SourceShell
+from .waste_collection_schedule.source_shell import calc_unique_source_id
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -35,9 +37,11 @@ class WCSCoordinator(DataUpdateCoordinator[dict[str, Any]]):
         fetch_time: str | datetime.time,
         random_fetch_time_offset: int,
         day_switch_time: str | datetime.time,
+        prefetched_entries: list[Collection] | None = None,
     ):
         self._hass = hass
         self._shell = source_shell
+        self._prefetched_entries = prefetched_entries
         self._aggregator = CollectionAggregator([source_shell])
         self._separator = separator
         fetch_time_new = (
@@ -132,6 +136,43 @@ class WCSCoordinator(DataUpdateCoordinator[dict[str, Any]]):
 
     async def _fetch_now(self, *_):
         if self.shell:
-            await self._hass.async_add_executor_job(self.shell.fetch)
+            if self._prefetched_entries is not None:
+                # use the result of the config flow validation instead of
+                # fetching the same data again right after setup
+                entries, self._prefetched_entries = self._prefetched_entries, None
+                self.shell.set_fetched_entries(entries)
+            else:
+                await self._hass.async_add_executor_job(self.shell.fetch)
 
         await self._update_sensors_callback()
+
+
+def store_prefetched_entries(
+    hass: HomeAssistant,
+    source_name: str,
+    source_args: dict[str, Any],
+    entries: list[Collection],
+) -> None:
+    """Keep a validated fetch result for the config entry created next."""
+    prefetched = hass.data.setdefault(const.PREFETCHED_ENTRIES, {})
+    prefetched[calc_unique_source_id(source_name, source_args)] = (
+        time.monotonic(),
+        entries,
+    )
+
+
+def pop_prefetched_entries(
+    hass: HomeAssistant, source_name: str, source_args: dict[str, Any]
+) -> list[Collection] | None:
+    """Return a stored fetch result if it is younger than PREFETCHED_ENTRIES_TTL."""
+    prefetched = hass.data.get(const.PREFETCHED_ENTRIES, {})
+    now = time.monotonic()
+
+    # drop outdated results, e.g. of aborted config flows
+    for key in [
+        k for k, v in prefetched.items() if now - v[0] > const.PREFETCHED_ENTRIES_TTL
+    ]:
+        del prefetched[key]
+
+    item = prefetched.pop(calc_unique_source_id(source_name, source_args), None)
+    return item[1] if item else None
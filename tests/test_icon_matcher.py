@@ -0,0 +1,57 @@
+import os
+import sys
+
+import pytest
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.service.IconMatcher import (  # isort:skip # noqa: E402
+    IconMatcher,
+)
+
+ICON_MAP = {
+    "Bio": "mdi:leaf",
+    "Gelber Sack": "mdi:sack",
+    "Verpackung": "mdi:recycle",
+    "Papier": "mdi:package-variant",
+    "Altpapier": "mdi:newspaper",
+}
+
+
+def _loop(text: str, last: bool) -> str | None:
+    icon = None
+    for key, value in ICON_MAP.items():
+        if key in text:
+            icon = value
+            if not last:
+                break
+    return icon
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["Biotonne", "Gelber Sack (Verpackung)", "Altpapier", "Verpackung Bio", "Glas"],
+)
+def test_same_as_loop(text: str) -> None:
+    assert IconMatcher(ICON_MAP).get(text) == _loop(text, last=False)
+    assert IconMatcher(ICON_MAP, precedence="last").get(text) == _loop(text, True)
+
+
+def test_precedence() -> None:
+    longest = IconMatcher(ICON_MAP, precedence="longest", ignore_case=True)
+    assert longest.get("Altpapier") == "mdi:newspaper"
+    first = IconMatcher(ICON_MAP, ignore_case=True)
+    assert first.get("Altpapier") == "mdi:package-variant"
+    with pytest.raises(ValueError):
+        IconMatcher(ICON_MAP, precedence="shortest")
+
+
+def test_ignore_case_and_default() -> None:
+    matcher = IconMatcher(ICON_MAP, ignore_case=True, default="mdi:trash-can")
+    assert matcher.get("GELBER SACK") == "mdi:sack"
+    assert matcher.key("altpapier") == "Papier"
+    assert matcher.get("Restmüll") == "mdi:trash-can"
+    assert IconMatcher({}).get("Bio") is None
@@ -0,0 +1,74 @@
+import os
+import sys
+from datetime import date, datetime, timezone
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.service.OpeningHours import (  # isort:skip # noqa: E402
+    compile_opening_hours,
+    expand_opening_hours,
+    expand_schedules,
+    parse_opening_hours,
+)
+
+START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+END = datetime(2024, 12, 31, tzinfo=timezone.utc)
+
+
+def _schedule(schedule_type, opening_hours, start_at, end_at):
+    return {
+        "schedule_type": schedule_type,
+        "opening_hours": opening_hours,
+        "start_at": start_at,
+        "end_at": end_at,
+    }
+
+
+def test_parse_is_cached() -> None:
+    assert parse_opening_hours("week 2-52/2 Mo") is parse_opening_hours(
+        "week 2-52/2 Mo"
+    )
+    kwargs = dict(parse_opening_hours("2024-2025 Sep-Nov We 09:00-19:00"))
+    assert kwargs["bymonth"] == (9, 10, 11)
+
+
+def test_expand_opening_hours() -> None:
+    days = expand_opening_hours("Feb,May,Aug,Nov Th[4]", START, END)
+    assert [d.date() for d in days] == [
+        date(2024, 2, 22),
+        date(2024, 5, 23),
+        date(2024, 8, 22),
+        date(2024, 11, 28),
+    ]
+
+
+def test_compiled_rules_are_reused() -> None:
+    compile_opening_hours.cache_clear()
+    for _ in range(2):
+        expand_schedules([_schedule("regular", "Mo", None, None)])
+        expand_opening_hours("Th[4]", datetime.now(timezone.utc), END)
+    assert compile_opening_hours.cache_info().hits == 2
+
+
+def test_expand_schedules() -> None:
+    schedules = [
+        _schedule(
+            "regular",
+            "week 2-52/2 Mo 12:00-17:00",
+            "2024-01-08T00:00:00.000+00:00",
+            None,
+        ),
+        _schedule(
+            "closed",
+            '2024 Jan 01-2024 Sep 30 off "Fermeture"',
+            "2024-01-01T00:00:00.000+00:00",
+            "2024-09-30T00:00:00.000+00:00",
+        ),
+    ]
+    days = expand_schedules(schedules, START, END)
+    assert days[0] == date(2024, 10, 14)
+    assert days[-1] == date(2024, 12, 23)
+    assert len(days) == 6
@@ -0,0 +1,58 @@
+import os
+import sys
+from datetime import date
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.service.PeriodicDates import (  # isort:skip # noqa: E402
+    periodic_dates,
+)
+
+
+def test_weekly() -> None:
+    # Tuesday 2024-02-20, weekdays default to the weekday of the anchor
+    days = periodic_dates(date(2024, 2, 20), None, date(2024, 2, 1), date(2024, 3, 5))
+    assert days == [
+        date(2024, 2, 6),
+        date(2024, 2, 13),
+        date(2024, 2, 20),
+        date(2024, 2, 27),
+        date(2024, 3, 5),
+    ]
+
+
+def test_interval_and_weekdays() -> None:
+    # every 4 weeks on Monday and Thursday, aligned to the week of the anchor
+    days = periodic_dates(
+        date(2024, 2, 26), [3, 0], date(2024, 1, 1), date(2024, 3, 31), interval=4
+    )
+    assert days == [
+        date(2024, 1, 1),
+        date(2024, 1, 4),
+        date(2024, 1, 29),
+        date(2024, 2, 1),
+        date(2024, 2, 26),
+        date(2024, 2, 29),
+        date(2024, 3, 25),
+        date(2024, 3, 28),
+    ]
+
+
+def test_shifts() -> None:
+    days = periodic_dates(
+        date(2024, 12, 23),
+        [2],
+        date(2024, 12, 1),
+        date(2024, 12, 31),
+        shifts={date(2024, 12, 25): date(2024, 12, 27), date(2024, 12, 11): None},
+    )
+    assert days == [date(2024, 12, 4), date(2024, 12, 18), date(2024, 12, 27)]
+
+
+def test_empty_window() -> None:
+    assert (
+        periodic_dates(date(2024, 1, 1), [0], date(2024, 1, 2), date(2024, 1, 7)) == []
+    )
@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+import time
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.service.PersistentCache import (  # isort:skip # noqa: E402
+    PersistentCache,
+    cache_key,
+    set_cache_dir,
+)
+
+
+def test_memory_only() -> None:
+    set_cache_dir(None)
+    cache = PersistentCache("test_memory_only")
+    assert cache.get("a") is None
+    assert cache.get("a", 1) == 1
+    cache.set("a", {"id": 5})
+    assert PersistentCache("test_memory_only").get("a") == {"id": 5}
+    cache.delete("a")
+    assert cache.get("a") is None
+
+
+def test_persisted(tmp_path) -> None:
+    set_cache_dir(tmp_path)
+    try:
+        PersistentCache("test_persisted").set("key", [1, 2])
+        with (tmp_path / "test_persisted.json").open() as f:
+            assert json.load(f)["key"][1] == [1, 2]
+
+        # reload from disk
+        set_cache_dir(None)
+        set_cache_dir(tmp_path)
+        assert PersistentCache("test_persisted").get("key") == [1, 2]
+    finally:
+        set_cache_dir(None)
+
+
+def test_ttl() -> None:
+    set_cache_dir(None)
+    cache = PersistentCache("test_ttl", ttl=60)
+    cache.set("old", 1)
+    cache.set("new", 2)
+    # pretend the first entry was written two minutes ago
+    PersistentCache("test_ttl")._entries()["old"][0] = time.time() - 120
+    assert cache.get("old") is None
+    assert cache.get("new") == 2
+    assert PersistentCache("test_ttl").get("old") == 1
+
+
+def test_cache_key() -> None:
+    assert cache_key("a", 1, None) == cache_key("a", 1, None)
+    assert cache_key("a", 1) != cache_key("a", "1")
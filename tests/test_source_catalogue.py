@@ -0,0 +1,75 @@
+import json
+import os
+import sys
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.source_catalogue import (  # isort:skip # noqa: E402
+    SourceCatalogue,
+    option_value,
+)
+
+SOURCES = {
+    "Germany": [
+        {
+            "title": "AWM München",
+            "module": "awm_muenchen_de",
+            "default_params": {},
+            "id": "awm_muenchen_de",
+        },
+        {
+            "title": "Abfall.IO / AbfallPlus",
+            "module": "abfall_io",
+            "default_params": {},
+            "id": "abfall_io",
+        },
+        {
+            "title": "Landkreis Harburg",
+            "module": "ics",
+            "default_params": {"split_at": ","},
+            "id": "ics_harburg",
+        },
+    ],
+    "Austria": [
+        {
+            "title": "Müllabfuhr Wien",
+            "module": "wien_at",
+            "default_params": {},
+            "id": "wien_at",
+        },
+    ],
+}
+
+
+def _catalogue(tmp_path) -> SourceCatalogue:
+    path = tmp_path / "sources.json"
+    path.write_text(json.dumps(SOURCES), encoding="utf-8")
+    return SourceCatalogue(path)
+
+
+def test_lookup(tmp_path) -> None:
+    catalogue = _catalogue(tmp_path)
+    assert catalogue.countries == ["Germany", "Austria"]
+
+    options = catalogue.get_options("Germany")
+    assert options[0] == {"value": "", "label": ""}
+    assert len(options) == 4
+    assert options is catalogue.get_options("Germany")
+
+    source = SOURCES["Germany"][2]
+    assert catalogue.get_source("Germany", option_value(source)) == source
+    assert catalogue.get_source("Austria", option_value(source)) is None
+    assert catalogue.has_id("ics_harburg")
+    assert catalogue.has_module("wien_at")
+    assert not catalogue.has_id("ics")
+
+
+def test_search(tmp_path) -> None:
+    catalogue = _catalogue(tmp_path)
+    assert catalogue.search("Muenchen")[0]["id"] == "awm_muenchen_de"
+    assert catalogue.search("harb")[0]["id"] == "ics_harburg"
+    assert [x["id"] for x in catalogue.search("mull", country="Austria")] == ["wien_at"]
+    assert catalogue.search("") == []
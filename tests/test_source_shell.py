@@ -0,0 +1,60 @@
+import os
+import sys
+from datetime import date
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule import Collection  # isort:skip # noqa: E402
+from waste_collection_schedule.source_shell import (  # isort:skip # noqa: E402
+    Customize,
+    SourceShell,
+)
+
+
+def _shell(customize=None, day_offset=0, deduplicate=True) -> SourceShell:
+    return SourceShell(
+        source=None,  # type: ignore[arg-type]
+        customize=customize or {},
+        title="test",
+        description="test",
+        url=None,
+        calendar_title=None,
+        unique_id="test",
+        day_offset=day_offset,
+        deduplicate=deduplicate,
+    )
+
+
+def _entries() -> list[Collection]:
+    return [
+        Collection(date(2024, 1, 1), " Paper "),
+        Collection(date(2024, 1, 1), "Paper"),
+        Collection(date(2024, 1, 1), "Cardboard"),
+        Collection(date(2024, 1, 2), "Glass"),
+        Collection(date(2024, 1, 3), "Paper"),
+    ]
+
+
+def test_post_processing() -> None:
+    shell = _shell(
+        customize={
+            "Cardboard": Customize("Cardboard", alias="Paper"),
+            "Glass": Customize("Glass", show=False),
+            "Paper": Customize("Paper", icon="mdi:newspaper"),
+        },
+        day_offset=-1,
+    )
+    shell.set_fetched_entries(_entries())
+    assert [(e.date, e.type, e.icon) for e in shell._entries] == [
+        (date(2023, 12, 31), "Paper", "mdi:newspaper"),
+        (date(2024, 1, 2), "Paper", "mdi:newspaper"),
+    ]
+
+
+def test_keep_duplicates() -> None:
+    shell = _shell(deduplicate=False)
+    shell.set_fetched_entries(_entries())
+    assert len(shell._entries) == 5
@@ -0,0 +1,59 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.service.SpatialIndex import (  # isort:skip # noqa: E402
+    SpatialIndex,
+    point_in_polygon,
+)
+
+
+def _square(x, y, size):
+    return [[x, y], [x + size, y], [x + size, y + size], [x, y + size], [x, y]]
+
+
+FEATURES = [
+    {
+        "properties": {"zone": "A"},
+        "geometry": {"type": "Polygon", "coordinates": [_square(0, 0, 10)]},
+    },
+    {
+        "properties": {"zone": "B"},
+        "geometry": {
+            "type": "MultiPolygon",
+            "coordinates": [[_square(20, 0, 5)], [_square(30, 0, 5)]],
+        },
+    },
+    {"properties": {"zone": "no geometry"}, "geometry": None},
+    {
+        "properties": {"zone": "C"},
+        # square with a hole
+        "geometry": {
+            "type": "Polygon",
+            "coordinates": [_square(0, 20, 10), _square(2, 22, 2)],
+        },
+    },
+]
+
+
+def test_point_in_polygon() -> None:
+    assert point_in_polygon(5, 5, [_square(0, 0, 10)])
+    assert not point_in_polygon(15, 5, [_square(0, 0, 10)])
+    assert not point_in_polygon(3, 3, [_square(0, 0, 10), _square(2, 2, 2)])
+
+
+def test_index() -> None:
+    index = SpatialIndex.from_geojson(
+        FEATURES, value=lambda feature: feature["properties"]["zone"]
+    )
+    assert index.find(5, 5) == "A"
+    assert index.find(32, 2) == "B"
+    assert index.query(22, 2) == ["B"]
+    assert index.find(5, 25) == "C"
+    assert index.find(3, 23) is None
+    assert index.find(100, 100) is None
+    assert SpatialIndex([]).find(0, 0) is None
@@ -0,0 +1,78 @@
+import os
+import sys
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.exceptions import (  # isort:skip # noqa: E402
+    SourceArgAmbiguousWithSuggestions,
+    SourceArgumentNotFoundWithSuggestions,
+    SourceArgumentRequiredWithSuggestions,
+)
+from waste_collection_schedule.suggestions import (  # isort:skip # noqa: E402
+    MAX_SUGGESTIONS,
+    normalize,
+    rank_suggestions,
+)
+
+STREETS = [
+    "Am Bahnhof",
+    "Bahnhofstraße",
+    "Hauptstraße",
+    "Hauptstrasse",
+    "Schillerstraße",
+    "Goethestraße",
+    "Königsallee",
+]
+
+
+def test_normalize() -> None:
+    assert normalize("  München-Süd ") == "munchen sud"
+    assert normalize("Straße") == "strasse"
+    assert normalize("KÖNIGS  Allee") == "konigs allee"
+
+
+def test_rank_suggestions() -> None:
+    ranked = rank_suggestions("hauptstrasse", STREETS)
+    # exact matches after normalization first, all distinct values kept
+    assert ranked[:2] == ["Hauptstraße", "Hauptstrasse"]
+    assert len(ranked) == len(STREETS)
+    assert rank_suggestions("haupt", ["Hauptstr.", "Hauptstr", "Hauptstr."]) == [
+        "Hauptstr.",
+        "Hauptstr",
+    ]
+
+    assert rank_suggestions("bahnhof", STREETS, limit=2) == [
+        "Bahnhofstraße",
+        "Am Bahnhof",
+    ]
+    assert rank_suggestions("konigsallee", STREETS, limit=1) == ["Königsallee"]
+    # without a value the original order is kept
+    assert rank_suggestions(None, STREETS, limit=3) == STREETS[:3]
+
+
+def test_rank_suggestions_key() -> None:
+    streets = [{"name": s} for s in STREETS]
+    ranked = rank_suggestions("goethe str", streets, limit=1, key=lambda x: x["name"])
+    assert ranked == [{"name": "Goethestraße"}]
+
+
+def test_exceptions_truncate_suggestions() -> None:
+    streets = (f"Street {i}" for i in range(5000))
+    e = SourceArgumentNotFoundWithSuggestions("street", "street 4711", streets)
+    suggestions = list(e.suggestions)
+    assert suggestions[0] == "Street 4711"
+    assert len(suggestions) == MAX_SUGGESTIONS
+    assert e.suggestion_type is str
+
+    e2 = SourceArgAmbiguousWithSuggestions("street", "Haupt", STREETS)
+    assert list(e2.suggestions)[0] in ("Hauptstraße", "Hauptstrasse")
+
+    e3 = SourceArgumentRequiredWithSuggestions("street", "", range(1000))
+    assert list(e3.suggestions) == list(range(1000))
+    assert e3.suggestion_type is int
+
+    e4 = SourceArgumentNotFoundWithSuggestions("street", "x", [])
+    assert e4.suggestion_type is None
@@ -0,0 +1,133 @@
+import os
+import sys
+from datetime import date, timedelta
+
+import pytest
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule.transport import (  # isort:skip # noqa: E402
+    Request,
+    Response,
+    Transport,
+    fetch_two_stage,
+    is_two_stage,
+)
+
+
+class RecordedTransport(Transport):
+    """Answer requests from recorded responses instead of the network."""
+
+    def __init__(self, recorded: dict[str, str]):
+        super().__init__()
+        self.recorded = recorded
+        self.sent: list[str] = []
+
+    def _send(self, request: Request) -> Response:
+        self.sent.append(request.url)
+        if request.url not in self.recorded:
+            raise ConnectionError(request.url)
+        return Response(request, 200, self.recorded[request.url])
+
+
+class ListSource:
+    def declare_requests(self):
+        return [Request("a"), Request("b"), Request("missing", optional=True)]
+
+    def parse(self, responses):
+        return [r.text if r is not None else None for r in responses]
+
+
+class GeneratorSource:
+    def declare_requests(self):
+        try:
+            yield Request("stale")
+        except ConnectionError:
+            pass
+        r = yield Request("a")
+        yield [Request(r.text), Request("b")]
+
+    def parse(self, responses):
+        return [r.text for r in responses]
+
+
+def test_declared_requests() -> None:
+    transport = RecordedTransport({"a": "1", "b": "2"})
+    assert is_two_stage(ListSource())
+    source = ListSource()
+    source.two_stage = False  # type: ignore[attr-defined]
+    assert not is_two_stage(source)
+    assert fetch_two_stage(ListSource(), transport) == ["1", "2", None]
+
+
+def test_generator() -> None:
+    transport = RecordedTransport({"a": "b", "b": "2"})
+    assert fetch_two_stage(GeneratorSource(), transport) == ["b", "2", "2"]
+    assert transport.sent[:2] == ["stale", "a"]
+
+
+def test_failed_request() -> None:
+    with pytest.raises(ConnectionError):
+        fetch_two_stage(ListSource(), RecordedTransport({"a": "1"}))
+
+
+def test_cache() -> None:
+    transport = RecordedTransport({"a": "1"})
+    for _ in range(2):
+        transport.send(Request("a", cache_ttl=60))
+    transport.send(Request("a"))
+    assert transport.sent == ["a", "a"]
+
+
+def test_ics_optional_response() -> None:
+    from waste_collection_schedule.source.ics import Source
+
+    day = (date.today() + timedelta(days=30)).strftime("%Y%m%d")
+    calendar = (
+        "BEGIN:VCALENDAR\r\nVERSION:2.0\r\nPRODID:test\r\nBEGIN:VEVENT\r\n"
+        f"UID:1\r\nDTSTAMP:20250101T000000Z\r\nDTSTART;VALUE=DATE:{day}\r\n"
+        "SUMMARY:Paper\r\nEND:VEVENT\r\nEND:VCALENDAR\r\n"
+    )
+    source = Source(url="https://example.com/{%Y}.ics")
+    current = Request("https://example.com/2025.ics")
+    following = Request("https://example.com/2026.ics", optional=True)
+    # the next year isn't published yet
+    responses = [
+        Response(current, 200, calendar),
+        Response(following, 200, "<html>not available</html>"),
+    ]
+    assert [e.type for e in source.parse(responses)] == ["Paper"]
+
+    with pytest.raises(Exception):
+        source.parse([Response(current, 200, "<html>not available</html>")])
+
+
+def test_abfallnavi_stale_ids() -> None:
+    from waste_collection_schedule.service import AbfallnaviDe as module
+    from waste_collection_schedule.service.PersistentCache import cache_key
+
+    api = module.AbfallnaviDe("test")
+    api._get_cached_waste_types = lambda: {1: "Paper"}  # type: ignore[method-assign]
+    api._resolve_targets = lambda *args: [["strassen", 2]]  # type: ignore[method-assign]
+    module._cache.set(cache_key("test", "City", "Street", None), [["strassen", 1]])
+
+    url = f"{api._service_url}/strassen/{{}}/termine"
+    transport = RecordedTransport(
+        {
+            url.format(1): "<html>error</html>",
+            url.format(2): '[{"datum": "2025-01-02", "bezirk": {"fraktionId": 1}}]',
+        }
+    )
+
+    class Source:
+        def declare_requests(self):
+            return api.date_requests("City", "Street")
+
+        def parse(self, responses):
+            return api.parse_dates(responses)
+
+    assert [d[1] for d in fetch_two_stage(Source(), transport)] == ["Paper"]
+    assert transport.sent == [url.format(1), url.format(2)]
@@ -0,0 +1,56 @@
+import os
+import sys
+from datetime import date
+
+import pytest
+
+sys.path.append(
+    os.path.join(
+        os.path.dirname(__file__), "../custom_components/waste_collection_schedule"
+    )
+)  # isort:skip # noqa: E402
+from waste_collection_schedule import Collection  # isort:skip # noqa: E402
+from waste_collection_schedule.service.YearlyCollections import (  # isort:skip # noqa: E402
+    fetch_years,
+)
+
+
+def _fetch_year(year: int) -> list[Collection]:
+    if year == 2026:
+        raise ValueError("not published yet")
+    return [
+        Collection(date(year, 12, 30), "Paper"),
+        Collection(date(year, 12, 30), "Paper"),
+        Collection(date(year, 1, 2), "Glass"),
+    ]
+
+
+def test_current_year_only() -> None:
+    entries = fetch_years(_fetch_year, today=date(2025, 6, 1))
+    assert [(e.date, e.type) for e in entries] == [
+        (date(2025, 1, 2), "Glass"),
+        (date(2025, 12, 30), "Paper"),
+    ]
+
+
+def test_december_and_january() -> None:
+    # the next year is not published yet
+    entries = fetch_years(_fetch_year, key="test", today=date(2025, 12, 1))
+    assert len(entries) == 2
+
+    # january collections are fetched, december comes from the cache
+    entries = fetch_years(
+        lambda year: [Collection(date(year, 1, 5), "Glass")],
+        key="test",
+        today=date(2026, 1, 2),
+    )
+    assert [(e.date, e.type) for e in entries] == [
+        (date(2025, 1, 2), "Glass"),
+        (date(2025, 12, 30), "Paper"),
+        (date(2026, 1, 5), "Glass"),
+    ]
+
+
+def test_failure() -> None:
+    with pytest.raises(ValueError):
+        fetch_years(_fetch_year, today=date(2026, 3, 1))